@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Generators for the synthetic documents used by the benchmarks.
+"""
+from __future__ import unicode_literals
+
+import io
+import os
+
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "tests", "examples")
+
+_RECORD = """
+[[records]]
+id = {i}
+name = "record-{i}"  # a comment
+enabled = {enabled}
+ratio = {ratio}
+created = 1979-05-27T07:32:{second:02d}Z
+tags = [ "a", "b", "c" ]
+limits = {{ cpu = {i}, memory = "{i}Mi" }}
+
+  [records.meta]
+  owner = 'team-{owner}'
+  path = '''C:\\Users\\{i}'''
+"""
+
+
+def example(name):  # type: (str) -> str
+    """
+    Returns the content of one of the example files of the test suite.
+    """
+    with io.open(os.path.join(EXAMPLES_DIR, name + ".toml"), encoding="utf-8") as f:
+        return f.read()
+
+
+def records(size):  # type: (int) -> str
+    """
+    Returns a document made of [[records]] tables
+    which is at least size characters long.
+    """
+    parts = ['# Generated document\ntitle = "benchmark"\n']
+    length = len(parts[0])
+    i = 0
+    while length < size:
+        part = _RECORD.format(
+            i=i,
+            enabled="true" if i % 2 else "false",
+            ratio=i / 7.0,
+            second=i % 60,
+            owner=i % 13,
+        )
+        parts.append(part)
+        length += len(part)
+        i += 1
+
+    return "".join(parts)
+
+
+_SECTION = """
+[section-{i}]
+id = {i}
+name = "section-{i}"
+limits = {{ cpu = {i}, memory = "{i}Mi" }}
+
+  [section-{i}.meta]
+  owner = 'team-{owner}'
+  tags = [ "a", "b", "c" ]
+"""
+
+
+def sections(size):  # type: (int) -> str
+    """
+    Returns a document made of distinct tables with a sub table each
+    which is at least size characters long.
+    """
+    parts = ['# Generated document\ntitle = "benchmark"\n']
+    length = len(parts[0])
+    i = 0
+    while length < size:
+        part = _SECTION.format(i=i, owner=i % 13)
+        parts.append(part)
+        length += len(part)
+        i += 1
+
+    return "".join(parts)
+
+
+_SAMPLE = """
+[[samples]]
+time = 2018-11-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}.{micro:06d}{offset}
+day = 2018-11-{day:02d}
+at = {hour:02d}:{minute:02d}:{second:02d}
+"""
+
+_OFFSETS = ["Z", "+02:00", "-05:30", "", "+09:00"]
+
+
+def timestamps(count):  # type: (int) -> str
+    """
+    Returns a time series document made of count [[samples]] tables,
+    each holding a datetime, a date and a time.
+    """
+    return "".join(
+        _SAMPLE.format(
+            day=1 + i % 28,
+            hour=i % 24,
+            minute=i % 60,
+            second=i * 7 % 60,
+            micro=i * 7919 % 1000000,
+            offset=_OFFSETS[i % len(_OFFSETS)],
+        )
+        for i in range(count)
+    )
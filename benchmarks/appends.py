@@ -0,0 +1,48 @@
+"""
+Measures how the time taken to build documents key by key
+grows with their number of keys, which should be close to linear.
+
+Usage:
+
+    python -m benchmarks.appends [number of keys]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import time
+
+from tomlkit import document
+from tomlkit import table
+
+
+def build(count, tables=False):  # type: (int, bool) -> float
+    """
+    Returns the time taken to set the given number of keys on a new document,
+    after a table if requested.
+    """
+    doc = document()
+    if tables:
+        doc["table"] = table()
+
+    start = time.time()
+    for i in range(count):
+        doc["key{}".format(i)] = i
+
+    return time.time() - start
+
+
+def main(count=20000):  # type: (int) -> None
+    for name, tables in [("keys", False), ("before table", True)]:
+        times = [build(n, tables) for n in (count // 4, count // 2, count)]
+        for n, elapsed in zip((count // 4, count // 2, count), times):
+            print("{:<14} {:>7} keys {:>8.3f}s".format(name, n, elapsed))
+
+        # Building four times as many keys should take about four times as long
+        growth = times[-1] / times[0]
+        print("{:<14} growth x{:.1f}".format(name, growth))
+        assert growth < 8, "Appending keys does not scale linearly"
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
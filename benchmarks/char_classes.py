@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the cost per character of the cached-method character classification
+that TOMLChar used to rely on with the table-driven one.
+
+Usage:
+
+    python -m benchmarks.char_classes
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import timeit
+
+from functools import lru_cache
+
+from tomlkit.toml_char import CHAR_CLASSES
+from tomlkit.toml_char import WS_CHAR
+from tomlkit.toml_char import TOMLChar
+from tomlkit.toml_char import toml_char
+
+from ._documents import records
+
+
+class CachedTOMLChar(str):
+    """
+    The previous classification, an unbounded lru_cache per method.
+    """
+
+    WS = " \t\n\r"
+
+    def __init__(self, c):
+        super(CachedTOMLChar, self).__init__()
+
+        if len(self) > 1:
+            raise ValueError("A TOML character must be of length 1")
+
+    @lru_cache(maxsize=None)
+    def is_ws(self):  # type: () -> bool
+        return self in self.WS
+
+
+def per_char(func, text, number=5):  # type: (...) -> float
+    """
+    Returns the time, in nanoseconds, spent per character by func.
+    """
+    return timeit.timeit(lambda: func(text), number=number) / number / len(text) * 1e9
+
+
+def cached_methods(chars):
+    for c in chars:
+        c.is_ws()
+
+
+def table_methods(chars):
+    for c in chars:
+        c.is_ws()
+
+
+def cached_wrap_and_classify(text):
+    for c in text:
+        CachedTOMLChar(c).is_ws()
+
+
+def table_wrap_and_classify(text):
+    for c in text:
+        toml_char(c).is_ws()
+
+
+def table_lookup(text):
+    for c in text:
+        o = ord(c)
+        if o < 128:
+            CHAR_CLASSES[o] & WS_CHAR
+        else:
+            TOMLChar(c).is_ws()
+
+
+def main():  # type: () -> None
+    text = records(256 * 1024)
+
+    cached = [CachedTOMLChar(c) for c in text]
+    shared = [toml_char(c) for c in text]
+
+    print("Characters: {}".format(len(text)))
+    for name, func, arg in [
+        ("lru_cache method", cached_methods, cached),
+        ("table-driven method", table_methods, shared),
+        ("new char + lru_cache", cached_wrap_and_classify, text),
+        ("shared char + table", table_wrap_and_classify, text),
+        ("table lookup", table_lookup, text),
+    ]:
+        print("{:<22} {:8.1f} ns/char".format(name, per_char(func, arg)))
+
+
+if __name__ == "__main__":
+    main()
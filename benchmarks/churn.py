@@ -0,0 +1,51 @@
+"""
+Measures rewriting the same values of a document over and over,
+which should neither slow down nor grow its body.
+
+Usage:
+
+    python -m benchmarks.churn [number of rewrites]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import time
+
+from typing import Any
+
+from tomlkit import parse
+
+
+def churn(doc, count):  # type: (Any, int) -> float
+    """
+    Returns the time taken to remove and set back the values
+    of the given document the given number of times.
+    """
+    keys = [k for k in doc.keys() if k != "table"]
+
+    start = time.time()
+    for i in range(count):
+        key = keys[i % len(keys)]
+        value = doc.item(key)
+        del doc[key]
+        doc[key] = value
+
+    return time.time() - start
+
+
+def main(count=5000):  # type: (int) -> None
+    doc = parse(
+        "".join("key{} = {}\n".format(i, i) for i in range(100)) + "\n[table]\n"
+    )
+    for _ in range(4):
+        elapsed = churn(doc, count)
+        print(
+            "{:>7} rewrites {:>8.3f}s, {} items in body, {} tombstones".format(
+                count, elapsed, len(doc.body), doc.tombstones
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
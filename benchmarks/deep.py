@@ -0,0 +1,45 @@
+"""
+Measures the parsing time of documents made of deeply nested tables.
+
+Usage:
+
+    python -m benchmarks.deep [depth]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import time
+
+from tomlkit import parse
+
+
+def document(depth, header="[{}]"):  # type: (int, str) -> str
+    """
+    Returns a document made of tables each nested in the previous one,
+    down to the given depth.
+    """
+    return "".join(
+        header.format(".".join(["a"] * (i + 1))) + "\nx = {}\n".format(i)
+        for i in range(depth)
+    )
+
+
+def main(depth=5000):  # type: (int) -> None
+    for name, header in [("tables", "[{}]"), ("aots", "[[{}]]")]:
+        for level in [depth // 10, depth // 2, depth]:
+            text = document(level, header)
+
+            start = time.time()
+            parse(text)
+            elapsed = time.time() - start
+
+            print(
+                "{:<8} {:>6} levels {:>8.3f}s {:>8.3f} MB/s".format(
+                    name, level, elapsed, len(text) / 1024.0 / 1024.0 / elapsed
+                )
+            )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,49 @@
+"""
+Measures how the time taken to add keys to documents that already hold
+many tables grows with their size, which should be close to linear:
+keys are inserted before the tables, without moving them.
+
+Usage:
+
+    python -m benchmarks.inserts [number of keys]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import time
+
+from tomlkit import document
+from tomlkit import table
+
+
+def build(count):  # type: (int) -> float
+    """
+    Returns the time taken to set the given number of keys
+    on a new document holding as many tables.
+    """
+    doc = document()
+    for i in range(count):
+        doc["table{}".format(i)] = table()
+
+    start = time.time()
+    for i in range(count):
+        doc["key{}".format(i)] = i
+
+    return time.time() - start
+
+
+def main(count=20000):  # type: (int) -> None
+    counts = (count // 4, count // 2, count)
+    times = [build(n) for n in counts]
+    for n, elapsed in zip(counts, times):
+        print("{:>7} keys and tables {:>8.3f}s".format(n, elapsed))
+
+    # Inserting four times as many keys should take about four times as long
+    growth = times[-1] / times[0]
+    print("growth x{:.1f}".format(growth))
+    assert growth < 8, "Inserting keys does not scale linearly"
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Compares eager and lazy parsing when only part of a document is read.
+
+Usage:
+
+    python -m benchmarks.lazy [size in MB]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import time
+
+from tomlkit import parse
+
+from ._documents import records
+
+
+def timed(func, *args):  # type: (...) -> float
+    """
+    Returns the time, in seconds, taken by calling func.
+    """
+    start = time.time()
+    func(*args)
+
+    return time.time() - start
+
+
+def read_one(text, lazy):  # type: (str, bool) -> None
+    parse(text, lazy=lazy)["records"][-1]["meta"]["owner"]
+
+
+def render(text, lazy):  # type: (str, bool) -> None
+    parse(text, lazy=lazy).as_string()
+
+
+def main(size=2):  # type: (float) -> None
+    text = records(int(size * 1024 * 1024))
+
+    print("Input: {:.2f} MB".format(len(text) / 1024.0 / 1024.0))
+    for name, func in [("read one", read_one), ("render", render)]:
+        eager = timed(func, text, False)
+        lazy = timed(func, text, True)
+        print(
+            "{:<10} eager {:>7.3f}s  lazy {:>7.3f}s  ({:.1f}x)".format(
+                name, eager, lazy, eager / lazy
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*[float(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Measures the peak memory allocated while parsing a large generated document.
+
+Usage:
+
+    python -m benchmarks.memory [size in MB]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+from tomlkit import iterparse
+from tomlkit import parse
+from tomlkit.source import Source
+from tomlkit.toml_file import TOMLFile
+
+from ._documents import records
+
+
+def peak(func, *args):  # type: (...) -> int
+    """
+    Returns the peak number of bytes allocated while calling func.
+    """
+    tracemalloc.start()
+    try:
+        func(*args)
+
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(size=4):  # type: (float) -> None
+    text = records(int(size * 1024 * 1024))
+
+    print("Input: {:.2f} MB".format(len(text) / 1024.0 / 1024.0))
+    for name, func in [("Source()", Source), ("parse()", parse)]:
+        used = peak(func, text)
+        report(name, used, len(text))
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp_dir, "records.toml")
+        with io.open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+        toml_file = TOMLFile(path)
+        report("read()", peak(toml_file.read), len(text))
+        report("read(mmap)", peak(toml_file.read, True), len(text))
+        report("iterparse()", peak(_drain_events, path), len(text))
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def _drain_events(path):  # type: (str) -> None
+    with io.open(path, encoding="utf-8") as f:
+        for _ in iterparse(f):
+            pass
+
+
+def report(name, used, size):  # type: (str, int, int) -> None
+    print(
+        "{:<12} peak {:>10.2f} MB  {:>8.2f} bytes per input character".format(
+            name, used / 1024.0 / 1024.0, used / float(size)
+        )
+    )
+
+
+if __name__ == "__main__":
+    main(*[float(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,49 @@
+"""
+Measures the parsing time of documents holding large arrays of numbers.
+
+Usage:
+
+    python -m benchmarks.numbers [number of entries]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import time
+
+from tomlkit import parse
+
+
+def documents(count):  # type: (int) -> list
+    """
+    Returns documents holding a single array of the given number of entries,
+    of each kind of number.
+    """
+    return [
+        ("integers", [str(i * 7919) for i in range(count)]),
+        (
+            "underscores",
+            ["{:,}".format(i * 7919).replace(",", "_") for i in range(count)],
+        ),
+        ("hexadecimal", ["0x{:x}".format(i * 7919) for i in range(count)]),
+        ("floats", ["{}.{}e-3".format(i, i % 97) for i in range(count)]),
+    ]
+
+
+def main(count=100000):  # type: (int) -> None
+    for name, numbers in documents(count):
+        text = "values = [\n  {},\n]\n".format(",\n  ".join(numbers))
+
+        start = time.time()
+        parse(text)
+        elapsed = time.time() - start
+
+        print(
+            "{:<14} {:>8.3f}s {:>10.0f} numbers/s".format(
+                name, elapsed, count / elapsed
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Measures the wall time of parsing a large generated document
+with an increasing number of worker processes.
+
+Usage:
+
+    python -m benchmarks.parallel [size in MB] [maximum number of workers]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import multiprocessing
+import sys
+import time
+
+from typing import Optional
+
+from tomlkit import parse
+
+from ._documents import records
+
+
+def main(size=4, max_workers=None):  # type: (float, Optional[int]) -> None
+    text = records(int(size * 1024 * 1024))
+    expected = parse(text).as_string()
+
+    print("Input: {:.2f} MB".format(len(text) / 1024.0 / 1024.0))
+    baseline = None
+    workers = 1
+    while workers <= (max_workers or multiprocessing.cpu_count()):
+        start = time.time()
+        doc = parse(text, workers=workers)
+        elapsed = time.time() - start
+
+        assert doc.as_string() == expected
+
+        baseline = baseline or elapsed
+        print(
+            "{:>2} workers {:>8.3f}s  ({:.1f}x)".format(
+                workers, elapsed, baseline / elapsed
+            )
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:3]
+    main(*[float(arg) for arg in args[:1]] + [int(arg) for arg in args[1:]])
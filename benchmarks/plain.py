@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Compares loads_plain() and reading a hybrid document with parse().value
+on the example documents of the test suite and on a generated document.
+
+Usage:
+
+    python -m benchmarks.plain [size in MB]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import time
+
+from tomlkit import loads_plain
+from tomlkit import parse
+
+from ._documents import example
+from ._documents import records
+
+
+EXAMPLES = [
+    "example",
+    "fruit",
+    "hard",
+    "0.5.0",
+    "pyproject",
+    "test",
+    "sections_with_same_start",
+]
+
+
+def timed(func, text, duration=0.5):  # type: (...) -> float
+    """
+    Returns the average time, in seconds, taken by calling func on text
+    repeatedly for at least the given duration.
+    """
+    runs = 0
+    start = time.time()
+    while True:
+        func(text)
+        runs += 1
+        elapsed = time.time() - start
+        if elapsed >= duration:
+            break
+
+    return elapsed / runs
+
+
+def value(text):  # type: (str) -> None
+    parse(text).value
+
+
+def hybrid(text):  # type: (str) -> None
+    parse(text, mode="hybrid").value
+
+
+def main(size=2):  # type: (float) -> None
+    documents = [(name, example(name)) for name in EXAMPLES]
+    documents.append(("records", records(int(size * 1024 * 1024))))
+
+    for name, text in documents:
+        full = timed(value, text)
+        plain = timed(loads_plain, text)
+        mixed = timed(hybrid, text)
+        print(
+            "{:<26} parse().value {:>9.3f}ms  loads_plain {:>9.3f}ms  ({:.1f}x)"
+            "  hybrid {:>9.3f}ms  ({:.1f}x)".format(
+                name,
+                full * 1000,
+                plain * 1000,
+                full / plain,
+                mixed * 1000,
+                full / mixed,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*[float(arg) for arg in sys.argv[1:2]])
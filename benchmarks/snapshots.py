@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Counts the source snapshots taken while parsing tests/examples/hard.toml
+and measures the cost of a snapshot on small and large inputs.
+
+Usage:
+
+    python -m benchmarks.snapshots
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import timeit
+
+from tomlkit import parse
+from tomlkit.source import Source
+
+from ._documents import example
+from ._documents import records
+
+
+def count_snapshots(text):  # type: (str) -> int
+    """
+    Returns the number of checkpoints taken while parsing text.
+    """
+    count = [0]
+    checkpoint = Source.checkpoint
+
+    def counting_checkpoint(self):
+        count[0] += 1
+
+        return checkpoint(self)
+
+    Source.checkpoint = counting_checkpoint
+    try:
+        parse(text)
+    finally:
+        Source.checkpoint = checkpoint
+
+    return count[0]
+
+
+def snapshot_cost(text, number=100000):  # type: (str, int) -> float
+    """
+    Returns the time, in microseconds, of one checkpoint/restore cycle
+    in the middle of the given text.
+    """
+    src = Source(text)
+    src.inc_n(len(text) // 2)
+
+    def cycle():
+        src.restore(src.checkpoint())
+
+    return timeit.timeit(cycle, number=number) / number * 1e6
+
+
+def main():  # type: () -> None
+    hard = example("hard")
+
+    print("hard.toml: {} snapshots per parse".format(count_snapshots(hard)))
+    for size in [1024, 1024 * 1024, 16 * 1024 * 1024]:
+        print(
+            "checkpoint/restore on {:>9} characters: {:.3f} us".format(
+                size, snapshot_cost(records(size)[:size])
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Measures the parsing time of documents holding large multiline strings.
+
+Usage:
+
+    python -m benchmarks.strings [size in MB]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import time
+
+from tomlkit import parse
+
+
+_LINE = "-----BEGIN CERTIFICATE----- MIIDdzCCAl+gAwIBAgIEAgAAuTANBgkqhkiG9w0BAQUFADBa"
+
+
+def documents(size):  # type: (int) -> list
+    """
+    Returns documents holding a single multiline string
+    of about the given size, of each kind.
+    """
+    lines = size // (len(_LINE) + 1)
+    text = "\n".join([_LINE] * lines)
+    escaped = "\n".join([_LINE + "\\t\\u00e9"] * lines)
+    continued = " \\\n".join([_LINE] * lines)
+
+    return [
+        ("basic", 'value = """\n{}"""\n'.format(text)),
+        ("escapes", 'value = """\n{}"""\n'.format(escaped)),
+        ("continuations", 'value = """\n{}"""\n'.format(continued)),
+        ("literal", "value = '''\n{}'''\n".format(text)),
+    ]
+
+
+def main(size=1):  # type: (float) -> None
+    for name, text in documents(int(size * 1024 * 1024)):
+        start = time.time()
+        parse(text)
+        elapsed = time.time() - start
+
+        print(
+            "{:<14} {:>8.3f}s {:>8.3f} MB/s".format(
+                name, elapsed, len(text) / 1024.0 / 1024.0 / elapsed
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*[float(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Measures the parsing throughput, in MB/s, on generated and example documents.
+
+Usage:
+
+    python -m benchmarks.throughput [size in MB]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import time
+
+from tomlkit import parse
+
+from ._documents import example
+from ._documents import records
+
+
+def throughput(text, duration=0.5):  # type: (str, float) -> float
+    """
+    Returns the parsing throughput, in MB/s,
+    parsing the text repeatedly for at least the given duration.
+    """
+    runs = 0
+    start = time.time()
+    while True:
+        parse(text)
+        runs += 1
+        elapsed = time.time() - start
+        if elapsed >= duration:
+            break
+
+    return len(text) * runs / 1024.0 / 1024.0 / elapsed
+
+
+def main(size=2):  # type: (float) -> None
+    documents = [("records", records(int(size * 1024 * 1024)))]
+    for name in ["example", "hard", "0.5.0", "pyproject"]:
+        documents.append((name, example(name)))
+
+    for name, text in documents:
+        print("{:<10} {:>8.3f} MB/s".format(name, throughput(text)))
+
+
+if __name__ == "__main__":
+    main(*[float(arg) for arg in sys.argv[1:2]])
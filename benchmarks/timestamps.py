@@ -0,0 +1,37 @@
+"""
+Measures the parsing rate of documents made mostly of dates and times.
+
+Usage:
+
+    python -m benchmarks.timestamps [number of samples]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import time
+
+from tomlkit import loads_plain
+from tomlkit import parse
+
+from ._documents import timestamps
+
+
+def main(count=20000):  # type: (int) -> None
+    text = timestamps(count)
+    values = 3 * count
+
+    for name, load in [("parse", parse), ("loads_plain", loads_plain)]:
+        start = time.time()
+        load(text)
+        elapsed = time.time() - start
+
+        print(
+            "{:<12} {:>8.3f}s {:>10.0f} values/s {:>8.3f} MB/s".format(
+                name, elapsed, values / elapsed, len(text) / 1024.0 / 1024.0 / elapsed
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
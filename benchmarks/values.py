@@ -0,0 +1,49 @@
+"""
+Measures reading the plain value of a document repeatedly,
+unchanged or after changing one of its deepest values.
+
+Usage:
+
+    python -m benchmarks.values [size in MB]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import time
+
+from typing import Any
+from typing import Callable
+
+from tomlkit import parse
+
+from ._documents import sections
+
+
+def timed(func, count):  # type: (Callable[[], Any], int) -> float
+    """
+    Returns the average time, in seconds, taken by calling func.
+    """
+    start = time.time()
+    for _ in range(count):
+        func()
+
+    return (time.time() - start) / count
+
+
+def main(size=1):  # type: (float) -> None
+    doc = parse(sections(int(size * 1024 * 1024)))
+    meta = doc["section-0"]["meta"]
+
+    def changed():
+        meta["owner"] = "someone"
+
+        return doc.value
+
+    print("first     {:>10.6f}s".format(timed(lambda: doc.value, 1)))
+    print("unchanged {:>10.6f}s".format(timed(lambda: doc.value, 1000)))
+    print("changed   {:>10.6f}s".format(timed(changed, 10)))
+
+
+if __name__ == "__main__":
+    main(*[float(arg) for arg in sys.argv[1:2]])
@@ -1,3 +1,5 @@
+import copy
+import io
 import json
 import pytest
 
@@ -10,13 +12,17 @@ from datetime import time
 from tomlkit import dumps
 from tomlkit import loads
 from tomlkit import parse
+from tomlkit.events import EventType
 from tomlkit.exceptions import EmptyKeyError
 from tomlkit.exceptions import InvalidCharInStringError
 from tomlkit.exceptions import InvalidDateError
 from tomlkit.exceptions import InvalidDateTimeError
+from tomlkit.exceptions import InvalidEncodingError
 from tomlkit.exceptions import InvalidTimeError
 from tomlkit.exceptions import InvalidNumberError
+from tomlkit.exceptions import KeyAlreadyPresent
 from tomlkit.exceptions import MixedArrayTypesError
+from tomlkit.exceptions import ParseError
 from tomlkit.exceptions import UnexpectedCharError
 from tomlkit.items import AoT
 from tomlkit.items import Array
@@ -70,6 +76,87 @@ def test_parsed_document_are_properly_json_representable(
     assert doc == json_doc
 
 
+@pytest.mark.parametrize(
+    "example_name",
+    [
+        "example",
+        "fruit",
+        "hard",
+        "sections_with_same_start",
+        "pyproject",
+        "0.5.0",
+        "test",
+        "newline_in_strings",
+        "preserve_quotes_in_string",
+        "string_slash_whitespace_newline",
+    ],
+)
+def test_parse_creates_no_errors_for_valid_toml_files(
+    example, example_name, monkeypatch
+):
+    errors = []
+    init = ParseError.__init__
+
+    def counting_init(self, *args, **kwargs):
+        errors.append(self)
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(ParseError, "__init__", counting_init)
+
+    parse(example(example_name))
+
+    assert errors == []
+
+
+def test_values_nested_in_arrays_raise_their_errors():
+    with pytest.raises(UnexpectedCharError) as e:
+        parse("a = [{b = ]\n")
+
+    assert e.value.col == 10
+
+
+@pytest.mark.parametrize("header", ["[{}]", "[[{}]]"])
+def test_parse_tables_nested_5000_levels_deep(header):
+    depth = 5000
+    content = "".join(
+        header.format(".".join(["a"] * (i + 1))) + "\nx = {}\n".format(i)
+        for i in range(depth)
+    )
+
+    doc = parse(content)
+
+    table = doc
+    value = doc.value
+    for i in range(depth):
+        table = table["a"]
+        value = value["a"]
+        if header.startswith("[["):
+            table = table[0]
+            value = value[0]
+
+        assert table["x"] == i
+        assert value["x"] == i
+
+    assert doc.as_string() == content
+
+
+def test_inf_and_nan_can_end_the_input():
+    doc = parse("a = inf\nb = nan")
+
+    assert doc["a"] == float("inf")
+    assert doc["b"] != doc["b"]
+
+
+def test_floats_may_have_a_zero_integer_part_with_an_exponent():
+    assert parse("a = 0e0\nb = -0E5")["a"] == 0.0
+
+
+@pytest.mark.parametrize("raw", ["+.5", "-.5", "1.e5", "-Inf", "+infinity", "1\u0661"])
+def test_invalid_floats_raise_an_error(raw):
+    with pytest.raises(InvalidNumberError):
+        parse("a = {}".format(raw))
+
+
 @pytest.mark.parametrize(
     "example_name,error",
     [
@@ -119,6 +206,523 @@ def test_original_string_and_dumped_string_are_equal(example, example_name):
     assert content == dumps(parsed)
 
 
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_parse_accepts_utf8_binary_input(example, wrap):
+    content = example("example")
+    parsed = parse(wrap(content.encode("utf-8")))
+
+    assert isinstance(parsed, TOMLDocument)
+    assert content == dumps(parsed)
+
+
+def test_parse_skips_the_utf8_bom_of_binary_input():
+    parsed = parse(b'\xef\xbb\xbftitle = "caf\xc3\xa9"\n')
+
+    assert parsed["title"] == u"caf\xe9"
+    assert parsed.as_string() == u'title = "caf\xe9"\n'
+
+
+def test_parse_raises_an_error_for_invalid_utf8_input():
+    with pytest.raises(InvalidEncodingError) as e:
+        parse(b'a = 1\nb = "\xc3\xa9\xff"\n')
+
+    assert e.value.line == 2
+    assert e.value.col == 6
+
+
+@pytest.mark.parametrize(
+    "example_name",
+    [
+        "example",
+        "fruit",
+        "hard",
+        "sections_with_same_start",
+        "pyproject",
+        "0.5.0",
+        "test",
+    ],
+)
+def test_lazy_parse_matches_parse(example, example_name):
+    content = example(example_name)
+    expected = parse(content)
+
+    assert content == parse(content, lazy=True).as_string()
+
+    parsed = parse(content, lazy=True)
+    assert repr(expected.value) == repr(parsed.value)
+    assert content == parsed.as_string()
+
+
+def test_lazy_parse_only_parses_the_tables_accessed():
+    content = """[a]
+x = 1 # comment
+
+[b]
+y = [1,
+  2]
+
+[b.c]
+z = 3
+
+[[d]]
+w = 4
+
+[[d]]
+w = 5
+"""
+    doc = parse(content, lazy=True)
+
+    a, b, d = doc.item("a"), doc.item("b"), doc.item("d")
+    assert not a.value.is_loaded()
+    assert not b.value.is_loaded()
+    assert not any(t.value.is_loaded() for t in d.body)
+
+    assert doc["b"]["c"]["z"] == 3
+    assert not a.value.is_loaded()
+    assert b.value.is_loaded()
+    assert not any(t.value.is_loaded() for t in d.body)
+
+    assert doc["d"][1]["w"] == 5
+    assert not d.body[0].value.is_loaded()
+    assert d.body[1].value.is_loaded()
+
+    assert content == doc.as_string()
+
+
+def test_lazy_tables_can_be_modified():
+    doc = parse("[a]\nx = 1\n\n[b]\ny = 2\n", lazy=True)
+
+    doc["a"]["x"] = 3
+    doc["b"]["z"] = 4
+
+    assert len(doc.item("a")) == 1
+    assert doc.as_string() == "[a]\nx = 3\n\n[b]\ny = 2\nz = 4\n"
+
+
+def test_lazy_parse_raises_errors_of_a_table_when_it_is_accessed():
+    doc = parse("[a]\nx = 1\n\n[b]\ny = 1 1\n", lazy=True)
+
+    assert doc["a"]["x"] == 1
+
+    with pytest.raises(UnexpectedCharError) as e:
+        doc["b"]["y"]
+
+    assert e.value.line == 5
+    assert e.value.col == 6
+
+
+def test_lazy_parse_scans_the_headers_of_nested_tables_once(monkeypatch):
+    scans = []
+    scan_headers = tomlkit.parser.scan_headers
+
+    def counting_scan_headers(text, *args):
+        scans.append(text)
+
+        return scan_headers(text, *args)
+
+    monkeypatch.setattr(tomlkit.parser, "scan_headers", counting_scan_headers)
+
+    depth = 100
+    content = "".join(
+        "[{}]\nx = {}\n".format(".".join(["a"] * (i + 1)), i) for i in range(depth)
+    )
+    doc = parse(content, lazy=True)
+
+    table = doc
+    for i in range(depth):
+        table = table["a"]
+
+        assert table["x"] == i
+
+    assert len(scans) == 1
+    assert doc.as_string() == content
+
+
+def test_lazy_parse_raises_errors_of_nested_tables_at_their_line():
+    doc = parse("[a]\nx = 1\n[a.b]\n\n[a.b.c]\ny = 1 1\n", lazy=True)
+
+    with pytest.raises(UnexpectedCharError) as e:
+        doc["a"]["b"]["c"]["y"]
+
+    assert e.value.line == 6
+    assert e.value.col == 6
+
+
+@pytest.mark.parametrize(
+    "example_name", ["example", "fruit", "hard", "sections_with_same_start", "test"]
+)
+def test_parse_with_workers_matches_parse(example, example_name):
+    content = example(example_name)
+    expected = parse(content)
+
+    parsed = parse(content, workers=2)
+
+    assert content == parsed.as_string()
+    assert repr(expected.value) == repr(parsed.value)
+    assert [(k, type(v), v.as_string()) for k, v in expected.body] == [
+        (k, type(v), v.as_string()) for k, v in parsed.body
+    ]
+
+
+def test_parse_with_workers_reports_errors_like_parse():
+    content = "[a]\nx = 1\n\n[b]\ny = 1 1\n\n[c]\nz = 1\n\n[d]\nw = 1\n"
+
+    with pytest.raises(UnexpectedCharError) as e:
+        parse(content, workers=2)
+
+    assert e.value.line == 5
+    assert e.value.col == 6
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "x = 1\n[[a]\n[b]\ny = 2\n",
+        "[a]\nx = 1\n[[a.b]\n[c]\ny = 2\n",
+        "[[a]]\nx = 1\n[[a]\n[b]\ny = 2\n",
+        "[a]\nx = 1\n[a.b.c,d]\n[e]\ny = 2\n",
+    ],
+)
+def test_parse_with_workers_reports_malformed_headers_like_parse(content):
+    with pytest.raises(ParseError) as expected:
+        parse(content)
+
+    with pytest.raises(ParseError) as e:
+        parse(content, workers=2)
+
+    assert type(e.value) is type(expected.value)
+    assert (e.value.line, e.value.col) == (expected.value.line, expected.value.col)
+
+
+def _plain_types(value):
+    if isinstance(value, dict):
+        return {type(value)}.union(*[_plain_types(v) for v in value.values()])
+    elif isinstance(value, list):
+        return {type(value)}.union(*[_plain_types(v) for v in value])
+
+    return {type(value)}
+
+
+@pytest.mark.parametrize(
+    "example_name",
+    [
+        "example",
+        "fruit",
+        "hard",
+        "sections_with_same_start",
+        "pyproject",
+        "0.5.0",
+        "test",
+        "newline_in_strings",
+        "preserve_quotes_in_string",
+        "string_slash_whitespace_newline",
+    ],
+)
+def test_loads_plain_matches_parse(example, example_name):
+    content = example(example_name)
+
+    plain = tomlkit.loads_plain(content)
+
+    assert json.dumps(plain, default=json_serial) == json.dumps(
+        parse(content).value, default=json_serial
+    )
+    for t in _plain_types(plain):
+        assert t.__module__ in {"builtins", "__builtin__", "datetime"}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        'a.b = 1\na.c = "x"\n[t]\nd.e = [1, 2]\n',
+        "[a.b.c]\nx = 1\n[a]\ny = 2\n",
+        "[[a]]\nx = 1\n[a.b]\ny = 2\n[[a]]\nx = 3\n[[a.c]]\n[[a.c]]\n",
+        "[a]\nx = 1\n[b]\n[a.c]\ny = 2\n",
+        "a = '''\nline\n'''\nb = \"\"\"\\\n  esc\\t\"\"\"\n",
+        "a = 1979-05-27T07:32:00-08:00\nb = [{x = 1}, {y = 2.5}]\nc = +inf\n",
+    ],
+)
+def test_loads_plain_matches_parse_on_tables_and_values(content):
+    expected = json.dumps(parse(content).value, default=json_serial)
+
+    assert json.dumps(tomlkit.loads_plain(content), default=json_serial) == expected
+
+
+@pytest.mark.parametrize(
+    "example_name",
+    [
+        "section_with_trailing_characters",
+        "key_value_with_trailing_chars",
+        "array_with_invalid_chars",
+        "mixed_array_types",
+        "invalid_number",
+        "invalid_date",
+        "invalid_time",
+        "invalid_datetime",
+        "trailing_comma",
+        "newline_in_singleline_string",
+        "string_slash_whitespace_char",
+        "array_no_comma",
+        "array_duplicate_comma",
+        "array_leading_comma",
+        "inline_table_no_comma",
+        "inline_table_duplicate_comma",
+        "inline_table_leading_comma",
+        "inline_table_trailing_comma",
+    ],
+)
+def test_loads_plain_raises_the_errors_of_parse(invalid_example, example_name):
+    content = invalid_example(example_name)
+    with pytest.raises(Exception) as expected:
+        parse(content)
+
+    with pytest.raises(type(expected.value)) as e:
+        tomlkit.loads_plain(content)
+
+    assert str(e.value) == str(expected.value)
+
+
+@pytest.mark.parametrize(
+    "example_name", ["example", "fruit", "hard", "pyproject", "0.5.0", "test"]
+)
+def test_hybrid_parse_matches_parse(example, example_name):
+    content = example(example_name)
+
+    doc = parse(content, mode="hybrid")
+
+    assert json.dumps(doc, default=json_serial) == json.dumps(
+        parse(content), default=json_serial
+    )
+    assert not doc.is_loaded()
+    assert doc.as_string() == content
+    assert doc.is_loaded()
+    assert type(doc) is TOMLDocument
+
+
+def test_hybrid_parse_reads_plain_values():
+    doc = parse('[a]\nb = "x"\nc = [1, 2]\n[[d]]\ne = 1\n[[d]]\ne = 2\n', mode="hybrid")
+
+    assert doc["a"]["b"] == "x"
+    assert type(doc["a"]["b"]) is type(u"")
+    assert doc["a"]["c"] == [1, 2]
+    assert [t["e"] for t in doc["d"]] == [1, 2]
+    assert doc.get("z") is None
+    assert "a" in doc
+    assert list(doc.keys()) == ["a", "d"]
+    assert doc.value == {"a": {"b": "x", "c": [1, 2]}, "d": [{"e": 1}, {"e": 2}]}
+    assert not doc.is_loaded()
+
+    with pytest.raises(KeyError):
+        doc["z"]
+
+
+def test_hybrid_parse_reads_cached_values():
+    content = "a = 1\n[b]\nc = [[1], [2]]\n[[d]]\ne = 1\n"
+    doc = parse(content, mode="hybrid")
+
+    assert doc["b"] is doc["b"]
+    assert doc["b"]["c"] is doc["b"]["c"]
+    assert doc["d"][0] is doc["d"][-1]
+    assert doc.value is doc.value
+    assert doc["b"].value is doc.value["b"]
+    assert doc["b"]["c"].value == [[1], [2]]
+
+    with pytest.raises(TypeError):
+        doc.value["b"]["c"][0].append(3)
+
+    value = copy.deepcopy(doc.value)
+    value["b"]["c"][0].append(3)
+
+    assert value == {"a": 1, "b": {"c": [[1, 3], [2]]}, "d": [{"e": 1}]}
+    assert doc.value == parse(content).value
+    assert not doc.is_loaded()
+
+
+def test_hybrid_parse_loads_the_document_when_modified():
+    content = "[a]\nb = 1  # comment\n\n[[c]]\nd = [1, 2]\n"
+    expected = parse(content)
+    expected["a"]["b"] = 2
+    expected["c"][0]["d"].append(3)
+    expected["e"] = "f"
+
+    doc = parse(content, mode="hybrid")
+    table = doc["a"]
+    array = doc["c"][0]["d"]
+    table["b"] = 2
+    array.append(3)
+    doc["e"] = "f"
+
+    assert doc.as_string() == expected.as_string()
+    assert table["b"] == 2
+    assert array == [1, 2, 3]
+
+
+def test_parse_raises_an_error_for_unknown_modes():
+    with pytest.raises(ValueError):
+        parse("a = 1", mode="unknown")
+
+
+def _feed(data, size):
+    parser = tomlkit.incremental_parser()
+    for i in range(0, len(data), size):
+        parser.feed(data[i : i + size])
+
+    return parser.close()
+
+
+@pytest.mark.parametrize(
+    "example_name",
+    [
+        "example",
+        "fruit",
+        "hard",
+        "sections_with_same_start",
+        "pyproject",
+        "0.5.0",
+        "test",
+    ],
+)
+@pytest.mark.parametrize("size", [1, 7, 64, 4096])
+def test_incremental_parser_matches_parse(example, example_name, size):
+    content = example(example_name)
+    expected = parse(content)
+
+    parsed = _feed(content, size)
+
+    assert isinstance(parsed, TOMLDocument)
+    assert content == dumps(parsed)
+    assert repr(expected.value) == repr(parsed.value)
+    assert [(k, type(v), v.as_string()) for k, v in expected.body] == [
+        (k, type(v), v.as_string()) for k, v in parsed.body
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 2, 5])
+def test_incremental_parser_accepts_split_utf8_sequences(size):
+    parsed = _feed(b'\xef\xbb\xbf[a]\ntitle = "caf\xc3\xa9 \xe2\x82\xac"\n', size)
+
+    assert parsed["a"]["title"] == u"caf\xe9 \u20ac"
+
+
+def test_incremental_parser_reports_errors_at_their_document_line():
+    content = '[a]\nx = 1\n\n[b]\ny = 2\n\n[c]\nz = """\n\n"""\nw = 1 1\n'
+
+    with pytest.raises(UnexpectedCharError) as e:
+        _feed(content, 3)
+
+    assert e.value.line == 11
+    assert e.value.col == 6
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "[[a]\n[b]\n",
+        "x = 1\n[[a]\n[b]\ny = 2\n",
+        "[a]\n[[a.b]\n[c]\n",
+        "[[a]]\n[[a]\n[b]\n",
+        "[a]\nx = 1\n\n[section}\nkey = 1\n\n[b]\n",
+        "[[fruit.blah]]\n  name = 1\n\n  [fruit.blah.physic,l]\n    color = 2\n",
+        "[a]\n[[a]]\n[[a]]\nx = 1 1\n",
+    ],
+)
+@pytest.mark.parametrize("size", [1, 5, 4096])
+def test_incremental_parser_reports_malformed_headers_like_parse(content, size):
+    with pytest.raises(ParseError) as expected:
+        parse(content)
+
+    with pytest.raises(ParseError) as e:
+        _feed(content, size)
+
+    assert type(e.value) is type(expected.value)
+    assert (e.value.line, e.value.col) == (expected.value.line, expected.value.col)
+
+
+@pytest.mark.parametrize("size", [1, 5, 4096])
+def test_incremental_parser_accepts_quoted_keys_spanning_lines(size):
+    content = '  [s.t]\n  "key\n[a.c]\n13" = "x"\n'
+    expected = parse(content)
+
+    parsed = _feed(content, size)
+
+    assert expected.as_string() == parsed.as_string()
+    assert expected.value == parsed.value
+
+
+@pytest.mark.parametrize("size", [1, 5, 4096])
+def test_incremental_parser_appends_arrays_of_tables_once_complete(size):
+    content = "[a]\n[[a]]\n[[a]]\n[b]\nx = 1 1\n"
+
+    with pytest.raises(KeyAlreadyPresent):
+        parse(content)
+
+    with pytest.raises(KeyAlreadyPresent):
+        _feed(content, size)
+
+
+def test_incremental_parser_raises_an_error_for_invalid_utf8_input():
+    with pytest.raises(InvalidEncodingError) as e:
+        _feed(b'a = 1\nb = "\xc3\xa9\xff"\n', 4)
+
+    assert e.value.line == 2
+    assert e.value.col == 6
+
+
+def test_iterparse_yields_an_event_per_statement():
+    content = "# c\n\n[a]\n  x = 1 # x\n[[b]]\ny = [1,\n 2]\n"
+
+    events = list(tomlkit.iterparse(content))
+
+    assert [e.type for e in events] == [
+        EventType.Comment,
+        EventType.Whitespace,
+        EventType.Table,
+        EventType.KeyValue,
+        EventType.AoTElement,
+        EventType.KeyValue,
+    ]
+    assert [e.raw for e in events] == [
+        "# c\n",
+        "\n",
+        "[a]\n",
+        "  x = 1 # x\n",
+        "[[b]]\n",
+        "y = [1,\n 2]\n",
+    ]
+    assert [content[e.start : e.end] for e in events] == [e.raw for e in events]
+    assert events[2].key.key == "a"
+    assert events[3].key.key == "x"
+    assert events[3].value == 1
+    assert events[5].value == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "example_name",
+    ["example", "fruit", "hard", "sections_with_same_start", "pyproject", "0.5.0"],
+)
+@pytest.mark.parametrize("size", [1, 7, 64, 4096])
+def test_iterparse_reads_file_objects_in_chunks(
+    example, example_name, size, monkeypatch
+):
+    content = example(example_name)
+    expected = [(e.type, e.start, e.end, e.raw) for e in tomlkit.iterparse(content)]
+
+    monkeypatch.setattr(tomlkit.api, "_CHUNK_SIZE", size)
+    events = tomlkit.iterparse(io.BytesIO(content.encode("utf-8")))
+
+    assert expected == [(e.type, e.start, e.end, e.raw) for e in events]
+    assert content == "".join(raw for _, _, _, raw in expected)
+
+
+def test_iterparse_reports_errors_at_their_document_line(monkeypatch):
+    monkeypatch.setattr(tomlkit.api, "_CHUNK_SIZE", 3)
+
+    with pytest.raises(UnexpectedCharError) as e:
+        list(tomlkit.iterparse(io.StringIO(u"[a]\nx = 1\n\ny = 1 1\n")))
+
+    assert e.value.line == 4
+    assert e.value.col == 6
+
+
 def test_a_raw_dict_can_be_dumped():
     s = dumps({"foo": "bar"})
 
@@ -0,0 +1,94 @@
+import copy
+import pickle
+
+import pytest
+
+from tomlkit.body import BLOCK_SIZE
+from tomlkit.body import Body
+
+
+def test_body_behaves_like_a_list_of_pairs():
+    body = Body([("a", 1), ("b", 2)])
+
+    assert len(body) == 2
+    assert list(body) == [("a", 1), ("b", 2)]
+    assert body[0] == ("a", 1)
+    assert body[-1] == ("b", 2)
+    assert body == [("a", 1), ("b", 2)]
+
+    body[-1] = ("c", 3)
+
+    assert body == [("a", 1), ("c", 3)]
+
+    with pytest.raises(IndexError):
+        body[2]
+
+
+def test_body_inserts_at_any_position():
+    count = 5 * BLOCK_SIZE
+    body = Body()
+    expected = []
+    for i in range(count):
+        position = (i * 7919) % (len(expected) + 1)
+        body.insert(position, i, i)
+        expected.insert(position, (i, i))
+
+    assert list(body) == expected
+    assert [body[i] for i in range(count)] == expected
+
+
+def test_body_entries_are_stable_handles():
+    body = Body()
+    entries = [body.append(i, i) for i in range(3 * BLOCK_SIZE)]
+
+    for i in range(2 * BLOCK_SIZE):
+        body.insert(0, None, None)
+        body.insert_after(entries[i], None, None)
+
+    for i, entry in enumerate(entries):
+        assert entry.item == i
+        assert body.index(entry) == 2 * BLOCK_SIZE + 2 * min(i, 2 * BLOCK_SIZE) + max(
+            0, i - 2 * BLOCK_SIZE
+        )
+        assert body.entry(body.index(entry)) is entry
+
+
+def test_body_copies_keep_entries_shared_with_their_referrers():
+    body = Body([("a", 1), ("b", 2)])
+    entry = body.entry(1)
+
+    for copied_body, copied_entry in [
+        pickle.loads(pickle.dumps((body, entry))),
+        copy.deepcopy((body, entry)),
+    ]:
+        assert copied_body == body
+        assert copied_body.entry(1) is copied_entry
+
+        copied_body.insert_after(copied_entry, "c", 3)
+
+        assert copied_body == [("a", 1), ("b", 2), ("c", 3)]
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_empty_body_can_be_pickled(protocol):
+    body = pickle.loads(pickle.dumps(Body(), protocol))
+
+    assert body == []
+
+    body.append("a", 1)
+
+    assert body == [("a", 1)]
+
+
+def test_body_prune_keeps_the_other_entries_usable():
+    body = Body()
+    entries = [body.append(i, i) for i in range(3 * BLOCK_SIZE)]
+
+    assert body.prune(lambda entry: entry.item % 3) == 2 * BLOCK_SIZE
+    assert body.prune(lambda entry: entry.item % 3) == 0
+    assert list(body) == [(i, i) for i in range(0, 3 * BLOCK_SIZE, 3)]
+
+    body.insert_after(entries[3], "a", "a")
+
+    assert body.index(entries[6]) == 3
+    assert body[2] == ("a", "a")
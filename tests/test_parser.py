@@ -13,3 +13,42 @@ def test_parser_should_raise_an_internal_error_if_parsing_wrong_type_of_string()
 
     assert e.value.line == 1
     assert e.value.col == 0
+
+
+def test_parser_splits_each_table_name_once(monkeypatch):
+    names = []
+    split = Parser._split_table_name
+
+    def counting_split(self, name):
+        names.append(name)
+
+        return split(self, name)
+
+    monkeypatch.setattr(Parser, "_split_table_name", counting_split)
+
+    parser = Parser('["a"]\n["a".b]\n["a".c]\n[["a".d]]\n[["a".d]]\n[e]\n')
+    doc = parser.parse()
+
+    # Bare names are split without it
+    assert sorted(names) == ['"a"', '"a".b', '"a".c', '"a".d']
+    assert doc["a"]["d"][1] == {}
+
+
+def test_parser_scans_each_table_header_once(monkeypatch):
+    import tomlkit.parser
+
+    starts = []
+    pattern = tomlkit.parser.TABLE_HEADER
+
+    class CountingPattern(object):
+        def match(self, string, pos):
+            starts.append(pos)
+
+            return pattern.match(string, pos)
+
+    monkeypatch.setattr(tomlkit.parser, "TABLE_HEADER", CountingPattern())
+
+    doc = Parser("[[a]]\nx = 1\n[[a]]\n[a.b]\n[c]\n").parse()
+
+    assert starts == [0, 12, 18, 24]
+    assert doc["a"][1]["b"] == {}
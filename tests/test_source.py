@@ -0,0 +1,158 @@
+import re
+
+import pytest
+
+from tomlkit import parse
+from tomlkit.exceptions import UnexpectedCharError
+from tomlkit.exceptions import UnexpectedEofError
+from tomlkit.source import LineIndex
+from tomlkit.source import Source
+
+
+def test_source_starts_on_the_first_character():
+    src = Source("ab")
+
+    assert src.idx == 0
+    assert src.current == "a"
+    assert not src.end()
+
+
+def test_source_inc_stops_at_the_end_of_input():
+    src = Source("ab")
+
+    assert src.inc()
+    assert src.current == "b"
+    assert not src.inc()
+    assert src.end()
+    assert src.idx == 2
+    assert not src.inc()
+    assert src.idx == 2
+
+
+def test_source_inc_can_raise_at_the_end_of_input():
+    src = Source("a")
+
+    with pytest.raises(UnexpectedEofError):
+        src.inc(exception=UnexpectedEofError)
+
+
+def test_source_extract_returns_the_marked_slice():
+    src = Source("key = 1")
+
+    src.mark()
+    src.inc_n(3)
+
+    assert src.extract() == "key"
+
+
+def test_source_state_restores_the_cursor():
+    src = Source("abc")
+
+    with src.state(restore=True):
+        src.inc_n(2)
+        assert src.current == "c"
+
+    assert src.idx == 0
+    assert src.current == "a"
+
+
+def test_source_empty_string():
+    src = Source("")
+
+    assert src.end()
+    assert src.idx == 0
+
+
+def test_source_checkpoint_restores_position_and_marker():
+    src = Source("key = 1")
+
+    src.inc_n(2)
+    src.mark()
+    checkpoint = src.checkpoint()
+
+    src.inc_n(3)
+    src.mark()
+    src.restore(checkpoint)
+
+    assert src.idx == 2
+    assert src.current == "y"
+    assert src.marker == 2
+
+
+def test_source_checkpoint_can_keep_the_marker():
+    src = Source("key = 1")
+
+    checkpoint = src.checkpoint()
+    src.inc_n(3)
+    src.mark()
+    src.restore(checkpoint, marker=False)
+
+    assert src.idx == 0
+    assert src.marker == 3
+
+
+def test_source_checkpoint_at_the_end_of_input():
+    src = Source("a")
+
+    src.inc()
+    checkpoint = src.checkpoint()
+    src.restore(checkpoint)
+
+    assert src.end()
+
+
+def test_line_index_maps_offsets_to_lines_and_columns():
+    index = LineIndex("a = 1\nb = 2\n\nc = 3")
+
+    assert len(index) == 4
+    assert index.linecol(0) == (1, 0)
+    assert index.linecol(4) == (1, 4)
+    assert index.linecol(5) == (1, 5)
+    assert index.linecol(6) == (2, 0)
+    assert index.linecol(12) == (3, 0)
+    assert index.linecol(15) == (4, 2)
+    assert index.line_start(4) == 13
+
+
+def test_source_linecol_defaults_to_the_current_position():
+    src = Source("a = 1\r\nb = 2")
+
+    src.inc_n(11)
+
+    assert src.linecol() == (2, 4)
+    assert src.linecol(3) == (1, 3)
+    assert src.line_index is src.line_index
+
+
+def test_parse_errors_report_line_and_column():
+    with pytest.raises(UnexpectedCharError) as e:
+        parse("a = 1\r\nb = @\r\n")
+
+    assert e.value.line == 2
+    assert e.value.col == 4
+
+
+def test_source_scan_consumes_the_whole_match():
+    src = Source("bare-key = 1")
+
+    m = src.scan(re.compile(r"[A-Za-z0-9_-]+"))
+
+    assert m.group() == "bare-key"
+    assert src.idx == 8
+    assert src.current == " "
+
+
+def test_source_scan_does_not_move_without_a_match():
+    src = Source("= 1")
+
+    assert src.scan(re.compile(r"[a-z]+")) is None
+    assert src.idx == 0
+
+
+def test_source_scan_can_reach_the_end_of_input():
+    src = Source("key")
+
+    src.scan(re.compile(r"[a-z]+"))
+
+    assert src.end()
+    assert src.idx == 3
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import pytest
+
+from tomlkit.toml_char import BARE_KEY_CHAR
+from tomlkit.toml_char import NL_CHAR
+from tomlkit.toml_char import SPACE_CHAR
+from tomlkit.toml_char import TOMLChar
+from tomlkit.toml_char import char_class
+from tomlkit.toml_char import toml_char
+
+
+@pytest.mark.parametrize(
+    "c, bare, kv, number, ws, nl, spaces",
+    [
+        ("a", True, False, False, False, False, False),
+        ("-", True, False, True, False, False, False),
+        ("5", True, False, True, False, False, False),
+        ("=", False, True, False, False, False, False),
+        (" ", False, True, False, True, False, True),
+        ("\t", False, True, False, True, False, True),
+        ("\n", False, False, False, True, True, False),
+        ("\r", False, False, False, True, True, False),
+        (".", False, False, True, False, False, False),
+        ("é", False, False, False, False, False, False),
+    ],
+)
+def test_toml_char_classes(c, bare, kv, number, ws, nl, spaces):
+    for char in [TOMLChar(c), toml_char(c)]:
+        assert char.is_bare_key_char() is bare
+        assert char.is_kv_sep() is kv
+        assert char.is_int_float_char() is number
+        assert char.is_ws() is ws
+        assert char.is_nl() is nl
+        assert char.is_spaces() is spaces
+
+
+def test_char_class_returns_flags():
+    assert char_class("a") == BARE_KEY_CHAR
+    assert char_class("\n") & NL_CHAR
+    assert char_class(" ") & SPACE_CHAR
+    assert char_class("€") == 0
+
+
+def test_ascii_toml_chars_are_shared():
+    assert toml_char("a") is toml_char("a")
+    assert toml_char("é") == "é"
+    assert isinstance(toml_char("é"), TOMLChar)
@@ -7,8 +7,17 @@ import pickle
 
 from datetime import datetime
 
+import pytest
+
+from tomlkit import aot
+from tomlkit import comment
+from tomlkit import document
+from tomlkit import item
+from tomlkit import nl
 from tomlkit import parse
+from tomlkit import table
 from tomlkit._utils import _utc
+from tomlkit.container import COMPACT_MIN_TOMBSTONES
 
 
 def test_document_is_a_dict(example):
@@ -296,6 +305,204 @@ def test_inserting_after_deletion():
     assert expected == doc.as_string()
 
 
+def test_inserting_after_deletion_before_a_comment():
+    doc = parse("foo = 10\nbar = 11\n# Comment\n\n[table]\n")
+    del doc["foo"]
+
+    doc["baz"] = 12
+
+    expected = """bar = 11
+# Comment
+baz = 12
+
+[table]
+"""
+
+    assert expected == doc.as_string()
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_appending_after_deletion_before_a_table(compact):
+    doc = document()
+    doc.add(comment("Comment"))
+    doc["a"] = aot()
+    doc["a"].append(table())
+    doc["b"] = 1
+    doc.add(nl())
+    doc["t"] = table()
+    doc["t"]["c"] = 2
+
+    del doc["a"]
+    if compact:
+        doc.compact()
+
+    doc["d"] = 3
+
+    expected = """# Comment
+b = 1
+
+
+d = 3
+
+[t]
+c = 2
+"""
+
+    assert expected == doc.as_string()
+    assert parse(doc.as_string()) == {"b": 1, "d": 3, "t": {"c": 2}}
+
+
+def test_removed_elements_are_compacted():
+    doc = parse("foo = 10\nbar = 11\nt = {a = 1, b = 2}\n\n[x.y]\nz = 1\n")
+    del doc["foo"]
+    del doc["t"]["b"]
+    doc["x"]["w"] = 2
+    del doc["x"]["w"]
+
+    expected = """bar = 11
+t = {a = 1 }
+
+[x.y]
+z = 1
+"""
+
+    assert doc.tombstones == 1
+    assert expected == doc.as_string()
+
+    assert doc.compact() is doc
+    assert doc.tombstones == 0
+    assert len(doc.body) == 4
+    assert doc.item("t").value.compact().tombstones == 0
+    assert doc.item("x").value.compact().tombstones == 0
+    assert expected == doc.as_string()
+    assert doc == {"bar": 11, "t": {"a": 1}, "x": {"y": {"z": 1}}}
+
+
+def test_removed_elements_are_compacted_automatically():
+    doc = parse("foo = 10\n\n[table]\n")
+    for i in range(1000):
+        doc["bar"] = i
+        del doc["bar"]
+
+    assert len(doc.body) < 2 * COMPACT_MIN_TOMBSTONES
+    assert doc.tombstones < COMPACT_MIN_TOMBSTONES
+    assert doc.as_string() == "foo = 10\n\n[table]\n"
+
+
+def test_document_value_is_cached_until_modified():
+    doc = parse("a = 1\n\n[t]\nb = 2\n\n[t.u]\nc = 3\n\n[[aot]]\nd = 4\n")
+
+    value = doc._value()
+    t = doc["t"]._value()
+
+    assert doc._value() is value
+    assert doc.items() and doc._value() is value
+
+    doc["t"]["u"]["c"] = 5
+
+    assert doc._value() is not value
+    assert doc.value == {"a": 1, "t": {"b": 2, "u": {"c": 5}}, "aot": [{"d": 4}]}
+
+    doc["a"] = 2
+
+    assert doc["t"]._value() is not t
+    t = doc["t"]._value()
+    assert doc.value == {"a": 2, "t": {"b": 2, "u": {"c": 5}}, "aot": [{"d": 4}]}
+    assert doc["t"]._value() is t
+
+    table = item({"d": 6})
+    doc.item("aot").append(table)
+
+    assert doc.value["aot"] == [{"d": 4}, {"d": 6}]
+
+    del doc["t"]["u"]
+
+    assert doc.value == {"a": 2, "t": {"b": 2}, "aot": [{"d": 4}, {"d": 6}]}
+
+
+def test_document_value_is_read_only():
+    content = "a = 1\n\n[t]\nx = 1\n\n[t.u]\ny = 2\n\n[[aot]]\nz = 3\n"
+    doc = parse(content)
+
+    value = doc.value
+
+    with pytest.raises(TypeError):
+        value["t"]["x"] = 100
+
+    with pytest.raises(TypeError):
+        value["t"]["u"].update(y=200)
+
+    with pytest.raises(TypeError):
+        value["aot"].append({"z": 4})
+
+    with pytest.raises(TypeError):
+        del value["a"]
+
+    expected = {"a": 1, "t": {"x": 1, "u": {"y": 2}}, "aot": [{"z": 3}]}
+
+    assert doc.value is value
+    assert doc.value == expected
+    assert content == doc.as_string()
+
+    copied = copy.deepcopy(value)
+    copied["t"]["x"] = 100
+    copied["aot"].append({"z": 4})
+
+    assert type(copied) is dict
+    assert type(copied["aot"]) is list
+    assert doc.value == expected
+    assert json.loads(json.dumps(value)) == expected
+    assert pickle.loads(pickle.dumps(value)) == expected
+
+
+def test_document_value_registers_each_dependent_once():
+    doc = parse("a = 1\n\n[t]\nb = 2\n\n[[aot]]\nd = 4\n")
+    t = doc.item("t").value
+    aot = doc.item("aot")
+
+    for i in range(1000):
+        doc["a"] = i
+
+        assert doc.value["a"] == i
+
+    assert len(t._dependents) == 1
+    assert len(aot._dependents) == 1
+
+
+def test_document_value_does_not_modify_the_parts_of_super_tables():
+    doc = parse("[a.b]\nx = 1\n\n[a]\ny = 2\n")
+    parts = [v.value for k, v in doc.body if k == "a"]
+
+    assert doc.value == {"a": {"b": {"x": 1}, "y": 2}}
+    assert [part.value for part in parts] == [{"b": {"x": 1}}, {"y": 2}]
+
+
+def test_inserting_many_elements_before_tables():
+    doc = parse("foo = 10\n\n[table]\nbaz = 1\n")
+    for i in range(3):
+        doc["bar{}".format(i)] = i
+
+    del doc["bar1"]
+    doc["qux"] = 12
+    doc["aot"] = [{"a": 1}]
+    doc["last"] = True
+
+    expected = """foo = 10
+bar0 = 0
+bar2 = 2
+qux = 12
+last = true
+
+[table]
+baz = 1
+
+[[aot]]
+a = 1
+"""
+
+    assert expected == doc.as_string()
+
+
 def test_toml_document_with_dotted_keys_inside_table(example):
     content = example("0.5.0")
 
@@ -350,6 +557,32 @@ def test_toml_document_is_pickable(example):
     assert pickle.loads(pickle.dumps(doc)).as_string() == content
 
 
+def test_toml_document_pickled_keeps_its_values():
+    content = "[[foo]]\nbar = 1\n\n[[foo]]\nbar = 2\n"
+
+    doc = pickle.loads(pickle.dumps(parse(content)))
+
+    assert json.loads(json.dumps(doc)) == {"foo": [{"bar": 1}, {"bar": 2}]}
+    assert json.loads(json.dumps(copy.deepcopy(doc))) == {
+        "foo": [{"bar": 1}, {"bar": 2}]
+    }
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_toml_document_pickled_can_be_modified(protocol):
+    content = "[a.b]\nx = 1\n\n[c]\n\n[a.d]\ny = 2\n"
+
+    expected = parse(content)
+    doc = pickle.loads(pickle.dumps(expected, protocol))
+    for d in (expected, doc):
+        d["a"]["b"]["z"] = 3
+        d["a"]["e"] = 4
+        d["c"]["w"] = 5
+
+    assert doc.as_string() == expected.as_string()
+    assert doc == {"a": {"b": {"x": 1, "z": 3}, "d": {"y": 2}, "e": 4}, "c": {"w": 5}}
+
+
 def test_toml_document_set_super_table_element():
     content = """[site.user]
 name = "John"
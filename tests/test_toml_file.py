@@ -1,6 +1,14 @@
+# -*- coding: utf-8 -*-
 import io
 import os
 
+import pytest
+
+from tomlkit.exceptions import InvalidEncodingError
+from tomlkit.exceptions import NonExistentKey
+from tomlkit.exceptions import UnexpectedCharError
+from tomlkit.items import AoT
+from tomlkit.items import Table
 from tomlkit.toml_document import TOMLDocument
 from tomlkit.toml_file import TOMLFile
 
@@ -23,3 +31,158 @@ def test_toml_file(example):
     finally:
         with io.open(toml_file, "w", encoding="utf-8") as f:
             assert f.write(original_content)
+
+
+def test_toml_file_read_with_mmap(example):
+    original_content = example("example")
+
+    toml_file = os.path.join(os.path.dirname(__file__), "examples", "example.toml")
+    content = TOMLFile(toml_file).read(mmap=True)
+
+    assert isinstance(content, TOMLDocument)
+    assert content["owner"]["organization"] == "GitHub"
+    assert content.as_string() == original_content
+
+
+def test_toml_file_read_empty_file_with_mmap(tmpdir):
+    toml_file = str(tmpdir.join("empty.toml"))
+    with io.open(toml_file, "w", encoding="utf-8"):
+        pass
+
+    content = TOMLFile(toml_file).read(mmap=True)
+
+    assert isinstance(content, TOMLDocument)
+    assert content.as_string() == ""
+
+
+def test_toml_file_read_non_ascii_with_mmap(tmpdir):
+    toml_file = str(tmpdir.join("unicode.toml"))
+    with io.open(toml_file, "w", encoding="utf-8") as f:
+        f.write(u'name = "Sébastien"\n')
+
+    content = TOMLFile(toml_file).read(mmap=True)
+
+    assert content["name"] == u"Sébastien"
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_toml_file_read_translates_line_endings(tmpdir, mmap):
+    toml_file = str(tmpdir.join("crlf.toml"))
+    with io.open(toml_file, "wb") as f:
+        f.write(b'title = """a\r\nb"""\r\n\r\n[t]\r\nx = 1\r\n')
+
+    content = TOMLFile(toml_file).read(mmap=mmap)
+
+    assert content["title"] == "a\nb"
+    assert content.as_string() == 'title = """a\nb"""\n\n[t]\nx = 1\n'
+    assert TOMLFile(toml_file).read_table("t").as_string() == "x = 1\n"
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 64])
+def test_toml_file_read_with_mmap_in_chunks(tmpdir, monkeypatch, size):
+    monkeypatch.setattr("tomlkit.toml_file._CHUNK_SIZE", size)
+    toml_file = str(tmpdir.join("chunks.toml"))
+    with io.open(toml_file, "wb") as f:
+        f.write(
+            b'\xef\xbb\xbfname = "S\xc3\xa9bastien"\r\n\r'
+            b'[[a]]\r\nb = """x\r\ny"""\r\n[[a]]\r\nb = "\xe2\x82\xac"\r\n\r\n'
+            b"[c]\rd = [\r\n  1,\r\n  2,\r\n]\r"
+        )
+
+    expected = TOMLFile(toml_file).read()
+    content = TOMLFile(toml_file).read(mmap=True)
+
+    assert content.as_string() == expected.as_string()
+    assert content == expected
+
+
+@pytest.mark.parametrize("size", [1, 4, 64])
+def test_toml_file_read_with_mmap_reports_encoding_errors(tmpdir, monkeypatch, size):
+    monkeypatch.setattr("tomlkit.toml_file._CHUNK_SIZE", size)
+    toml_file = str(tmpdir.join("invalid.toml"))
+    with io.open(toml_file, "wb") as f:
+        f.write(b'[a]\nb = 1\n\n[c]\nd = "\xc3\xa9\xff"\n')
+
+    with pytest.raises(InvalidEncodingError) as expected:
+        TOMLFile(toml_file).read()
+
+    with pytest.raises(InvalidEncodingError) as e:
+        TOMLFile(toml_file).read(mmap=True)
+
+    assert (e.value.line, e.value.col) == (expected.value.line, expected.value.col)
+
+
+def test_toml_file_read_table_with_index(tmpdir):
+    toml_file = str(tmpdir.join("servers.toml"))
+    with io.open(toml_file, "w", encoding="utf-8") as f:
+        f.write(
+            u"""title = "Sébastien"
+
+[servers]
+  [servers.alpha]
+  ip = "10.0.0.1"
+
+  [servers.beta]
+  ip = "10.0.0.2"
+
+[[products]]
+name = "Hammer"
+
+[clients]
+data = [["gamma", "delta"], [1, 2]]
+
+[[products]]
+name = "Nail"
+
+[tool.poetry]
+name = "tomlkit"
+"""
+        )
+
+    toml = TOMLFile(toml_file)
+    toml.build_index()
+
+    assert os.path.exists(toml_file + ".index")
+
+    alpha = toml.read_table("servers.alpha")
+    assert isinstance(alpha, Table)
+    assert alpha.value == {"ip": "10.0.0.1"}
+    assert alpha.as_string() == u'  ip = "10.0.0.1"\n\n'
+
+    servers = toml.read_table("servers")
+    assert servers.value == {"alpha": {"ip": "10.0.0.1"}, "beta": {"ip": "10.0.0.2"}}
+
+    products = toml.read_table("products")
+    assert isinstance(products, AoT)
+    assert products.value == [{"name": "Hammer"}, {"name": "Nail"}]
+
+    assert toml.read_table("tool").value == {"poetry": {"name": "tomlkit"}}
+
+    with pytest.raises(NonExistentKey):
+        toml.read_table("title")
+
+
+def test_toml_file_index_is_rebuilt_when_the_file_changes(tmpdir):
+    toml_file = str(tmpdir.join("config.toml"))
+    with io.open(toml_file, "w", encoding="utf-8") as f:
+        f.write(u"[a]\nx = 1\n")
+
+    toml = TOMLFile(toml_file)
+    toml.build_index()
+
+    with io.open(toml_file, "w", encoding="utf-8") as f:
+        f.write(u"[b]\ny = 2\n\n[a]\nx = 12\n")
+
+    assert toml.read_table("a").value == {"x": 12}
+
+
+def test_toml_file_read_table_reports_errors_at_their_file_line(tmpdir):
+    toml_file = str(tmpdir.join("config.toml"))
+    with io.open(toml_file, "w", encoding="utf-8") as f:
+        f.write(u"[a]\nx = 1\n\n[b]\ny = 1 1\n")
+
+    with pytest.raises(UnexpectedCharError) as e:
+        TOMLFile(toml_file).read_table("b")
+
+    assert e.value.line == 5
+    assert e.value.col == 6
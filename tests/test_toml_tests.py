@@ -5,6 +5,7 @@ from tomlkit import parse
 from tomlkit._compat import decode
 from tomlkit._compat import unicode
 from tomlkit._utils import parse_rfc3339
+from tomlkit.exceptions import ParseError
 from tomlkit.exceptions import TOMLKitError
 
 
@@ -47,6 +48,21 @@ def test_valid_decode(valid_case):
     assert toml_val.as_string() == valid_case["toml"]
 
 
+def test_valid_decode_creates_no_errors(valid_case, monkeypatch):
+    errors = []
+    init = ParseError.__init__
+
+    def counting_init(self, *args, **kwargs):
+        errors.append(self)
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(ParseError, "__init__", counting_init)
+
+    parse(valid_case["toml"])
+
+    assert errors == []
+
+
 def test_invalid_decode(invalid_decode_case):
     with pytest.raises(TOMLKitError):
         parse(invalid_decode_case["toml"])
@@ -49,3 +49,20 @@ def test_parse_rfc3339_date(string, expected):
 )
 def test_parse_rfc3339_time(string, expected):
     assert parse_rfc3339(string) == expected
+
+
+def test_parse_rfc3339_reuses_timezones():
+    first = parse_rfc3339("1979-05-27T07:32:00-07:00")
+    second = parse_rfc3339("2018-11-19T00:00:00-07:00")
+
+    assert first.tzinfo is second.tzinfo
+    assert first.tzinfo.utcoffset(first) == td(hours=-7)
+
+
+@pytest.mark.parametrize(
+    "string",
+    ["1979-05-2707:32:00", "07:32:00Z", "1979-13-27", "24:00:00", "12345-05-27"],
+)
+def test_parse_rfc3339_invalid(string):
+    with pytest.raises(ValueError):
+        parse_rfc3339(string)
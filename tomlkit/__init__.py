@@ -7,12 +7,15 @@ from .api import datetime
 from .api import document
 from .api import dumps
 from .api import float_
+from .api import incremental_parser
 from .api import inline_table
 from .api import integer
 from .api import item
+from .api import iterparse
 from .api import key
 from .api import key_value
 from .api import loads
+from .api import loads_plain
 from .api import nl
 from .api import parse
 from .api import string
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+A lightweight scanner locating the table headers of a TOML document
+without parsing any of its values.
+"""
+from __future__ import unicode_literals
+
+import re
+
+from typing import List
+from typing import Tuple
+
+from ._compat import unicode
+
+
+_INDENT = re.compile(r"[ \t\r]*")
+# Table headers as the parser reads them: the name goes up to the first
+# closing bracket, even past the end of the line, and arrays of tables
+# are closed by the character following it, whatever it is.
+_HEADER = re.compile(r"\[(\[)?([^\]]*)\](?(1).?)", re.S)
+_PLAIN = re.compile(r"[^\"'\[\]{}#\n=,]*")
+_BASIC = re.compile(r'"(?:[^"\\\n]|\\.)*"')
+_LITERAL = re.compile(r"'[^'\n]*'")
+
+
+class Header(object):
+    """
+    A table header found by the scanner.
+    """
+
+    __slots__ = ("start", "name", "is_aot")
+
+    def __init__(self, start, name, is_aot):  # type: (int, unicode, bool) -> None
+        # Offset of the start of the line holding the header
+        self.start = start
+        # Raw name of the table, as written between the brackets
+        self.name = name
+        self.is_aot = is_aot
+
+    def __repr__(self):  # type: () -> str
+        return "<Header {}{}{} at {}>".format(
+            "[[" if self.is_aot else "[",
+            self.name,
+            "]]" if self.is_aot else "]",
+            self.start,
+        )
+
+
+def scan_headers(
+    text, pos=0, final=True
+):  # type: (unicode, int, bool) -> Tuple[List[Header], int]
+    """
+    Scans the statements of text, starting at pos which must be
+    the start of a line, and returns the table headers found along with
+    the offset at which scanning stopped.
+
+    If final is False, text is considered incomplete and scanning stops
+    at the start of the first statement that might continue past its end.
+    Otherwise the returned offset is always the length of text.
+
+    Invalid statements are skipped, reporting them is left to the parser.
+    """
+    headers = []
+    end = len(text)
+
+    while pos < end:
+        start = pos
+        pos = _INDENT.match(text, pos).end()
+        if pos == end:
+            if not final:
+                # The indentation of a statement still to come
+                return headers, start
+
+            break
+
+        c = text[pos]
+        if c == "\n":
+            pos += 1
+
+            continue
+
+        if c == "[":
+            m = _HEADER.match(text, pos)
+            if m is None:
+                # Not closed, the parser reports it
+                if not final:
+                    return headers, start
+
+                break
+
+            headers.append(Header(start, m.group(2), m.group(1) is not None))
+            pos = m.end()
+
+        pos = _skip_statement(text, pos, final)
+        if pos == -1:
+            return headers, start
+
+    return headers, end
+
+
+def _skip_statement(text, pos, final):  # type: (unicode, int, bool) -> int
+    """
+    Returns the offset following the end of the statement at pos,
+    or -1 if it is not complete.
+    """
+    end = len(text)
+    # Brackets and braces opened and not closed yet
+    nesting = []
+    # Whether a key may start here, quoted keys can span lines like in the parser
+    key = True
+    while True:
+        pos = _PLAIN.match(text, pos).end()
+        if pos == end:
+            return end if final else -1
+
+        c = text[pos]
+        if c == "\n":
+            pos += 1
+            if not nesting:
+                return pos
+        elif c == "#":
+            pos = text.find("\n", pos)
+            if pos == -1:
+                return end if final else -1
+        elif c == '"' or c == "'":
+            if key:
+                pos = text.find(c, pos + 1)
+                if pos != -1:
+                    pos += 1
+            elif text.startswith(c * 3, pos):
+                pos = _skip_multiline_string(text, pos + 3, c)
+            else:
+                m = (_BASIC if c == '"' else _LITERAL).match(text, pos)
+                if m is not None:
+                    pos = m.end()
+                else:
+                    # Not terminated on this line
+                    pos = text.find("\n", pos)
+
+            if pos == -1:
+                return end if final else -1
+        elif c == "=":
+            key = False
+            pos += 1
+        elif c == ",":
+            key = nesting[-1:] == ["{"]
+            pos += 1
+        elif c in "[{":
+            nesting.append(c)
+            key = c == "{"
+            pos += 1
+        else:
+            if nesting:
+                nesting.pop()
+
+            pos += 1
+
+
+def _skip_multiline_string(text, pos, quote):  # type: (unicode, int, unicode) -> int
+    """
+    Returns the offset following the closing delimiter
+    of the multiline string starting at pos, or -1 if it is not closed.
+    """
+    delimiter = quote * 3
+    while True:
+        idx = text.find(delimiter, pos)
+        if idx == -1:
+            return -1
+
+        if quote == '"':
+            # An odd number of backslashes escapes the first quote
+            backslashes = 0
+            while idx - backslashes > pos and text[idx - backslashes - 1] == "\\":
+                backslashes += 1
+
+            if backslashes % 2:
+                pos = idx + 1
+
+                continue
+
+        return idx + 3
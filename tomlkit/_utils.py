@@ -9,94 +9,91 @@ from datetime import timedelta
 from ._compat import decode
 from ._compat import timezone
 
-RFC_3339_LOOSE = re.compile(
-    "^"
-    r"(([0-9]+)-(\d{2})-(\d{2}))?"  # Date
-    "("
+RFC_3339 = re.compile(
+    r"(?:([0-9]+)-([0-9]{2})-([0-9]{2}))?"  # Date
+    "(?:"
     "([T ])?"  # Separator
-    r"(\d{2}):(\d{2}):(\d{2})(\.([0-9]+))?"  # Time
-    r"((Z)|([\+|\-]([01][0-9]|2[0-3]):([0-5][0-9])))?"  # Timezone
+    r"([0-9]{2}):([0-9]{2}):([0-9]{2})(?:\.([0-9]+))?"  # Time
+    "((Z)|([+-])([01][0-9]|2[0-3]):([0-5][0-9]))?"  # Timezone
     ")?"
-    "$"
-)
-
-RFC_3339_DATETIME = re.compile(
-    "^"
-    "([0-9]+)-(0[1-9]|1[012])-(0[1-9]|[12][0-9]|3[01])"  # Date
-    "[T ]"  # Separator
-    r"([01][0-9]|2[0-3]):([0-5][0-9]):([0-5][0-9]|60)(\.([0-9]+))?"  # Time
-    r"((Z)|([\+|\-]([01][0-9]|2[0-3]):([0-5][0-9])))?"  # Timezone
-    "$"
-)
-
-RFC_3339_DATE = re.compile("^([0-9]+)-(0[1-9]|1[012])-(0[1-9]|[12][0-9]|3[01])$")
-
-RFC_3339_TIME = re.compile(
-    r"^([01][0-9]|2[0-3]):([0-5][0-9]):([0-5][0-9]|60)(\.([0-9]+))?$"
+    r"\Z"
 )
 
 _utc = timezone(timedelta(), "UTC")
 
+# Timezones of the offsets already parsed, by offset
+_timezones = {"Z": _utc}
+
 
 def parse_rfc3339(string):  # type: (str) -> Union[datetime, date, time]
-    m = RFC_3339_DATETIME.match(string)
-    if m:
-        year = int(m.group(1))
-        month = int(m.group(2))
-        day = int(m.group(3))
-        hour = int(m.group(4))
-        minute = int(m.group(5))
-        second = int(m.group(6))
-        microsecond = 0
-
-        if m.group(7):
-            microsecond = int(("{:<06s}".format(m.group(8)))[:6])
-
-        dt = datetime(year, month, day, hour, minute, second, microsecond)
-
-        if m.group(9):
-            # Timezone
-            tz = m.group(9)
-            if tz == "Z":
-                tzinfo = _utc
-            else:
-                sign = m.group(11)[0]
-                hour_offset, minute_offset = int(m.group(12)), int(m.group(13))
-                offset = timedelta(seconds=hour_offset * 3600 + minute_offset * 60)
-                if sign == "-":
-                    offset = -offset
-
-                tzinfo = timezone(
-                    offset, "{}{}:{}".format(sign, m.group(12), m.group(13))
-                )
-
-            return datetime(
-                year, month, day, hour, minute, second, microsecond, tzinfo=tzinfo
-            )
-        else:
-            return datetime(year, month, day, hour, minute, second, microsecond)
-
-    m = RFC_3339_DATE.match(string)
-    if m:
-        year = int(m.group(1))
-        month = int(m.group(2))
-        day = int(m.group(3))
-
-        return date(year, month, day)
-
-    m = RFC_3339_TIME.match(string)
-    if m:
-        hour = int(m.group(1))
-        minute = int(m.group(2))
-        second = int(m.group(3))
-        microsecond = 0
-
-        if m.group(4):
-            microsecond = int(("{:<06s}".format(m.group(5)))[:6])
-
-        return time(hour, minute, second, microsecond)
-
-    raise ValueError("Invalid RFC 339 string")
+    m = RFC_3339.match(string)
+    if not m or not (m.group(1) or m.group(5)):
+        raise ValueError("Invalid RFC 339 string")
+
+    return parse_rfc3339_match(m)
+
+
+def parse_rfc3339_match(m):  # type: (Match) -> Union[datetime, date, time]
+    """
+    Returns the date, time or datetime matched by the RFC_3339 pattern.
+
+    Raises a ValueError if it is not a valid one.
+    """
+    (
+        year,
+        month,
+        day,
+        separator,
+        hour,
+        minute,
+        second,
+        fraction,
+        tz,
+        _,
+        sign,
+        tz_hour,
+        tz_minute,
+    ) = m.groups()
+
+    microsecond = 0
+    if fraction:
+        microsecond = int(fraction[:6].ljust(6, "0"))
+
+    if not year:
+        if tz:
+            raise ValueError("Invalid RFC 339 string")
+
+        return time(int(hour), int(minute), int(second), microsecond)
+
+    if len(year) > 4:
+        raise ValueError("Invalid RFC 339 string")
+
+    if not hour:
+        return date(int(year), int(month), int(day))
+
+    if not separator:
+        raise ValueError("Invalid RFC 339 string")
+
+    tzinfo = None
+    if tz:
+        tzinfo = _timezones.get(tz)
+        if tzinfo is None:
+            offset = timedelta(hours=int(tz_hour), minutes=int(tz_minute))
+            if sign == "-":
+                offset = -offset
+
+            tzinfo = _timezones[tz] = timezone(offset, str(tz))
+
+    return datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        microsecond,
+        tzinfo=tzinfo,
+    )
 
 
 _escaped = {"b": "\b", "t": "\t", "n": "\n", "f": "\f", "r": "\r", '"': '"', "\\": "\\"}
@@ -1,6 +1,11 @@
 import datetime as _datetime
 
+from typing import Any
+from typing import Dict
+from typing import Generator
+from typing import Optional
 from typing import Tuple
+from typing import Union
 
 from ._utils import parse_rfc3339
 from .container import Container
@@ -20,18 +25,42 @@ from .items import Trivia
 from .items import Whitespace
 from .items import String
 from .items import item
+from .events import Event
+from .parser import EventParser
+from .parser import IncrementalParser
 from .parser import Parser
+from .parser import PlainParser
+from .source import decode_source
+from .toml_document import HybridDocument
 from .toml_document import TOMLDocument as _TOMLDocument
 from .items import Time
 
 
-def loads(string):  # type: (str) -> _TOMLDocument
+# Size of the chunks read from file objects by iterparse()
+_CHUNK_SIZE = 64 * 1024
+
+
+def loads(
+    string, lazy=False, workers=None, mode="full"
+):  # type: (Union[str, bytes], bool, Optional[int], str) -> _TOMLDocument
     """
     Parses a string into a TOMLDocument.
 
     Alias for parse().
     """
-    return parse(string)
+    return parse(string, lazy=lazy, workers=workers, mode=mode)
+
+
+def loads_plain(string):  # type: (Union[str, bytes]) -> Dict[str, Any]
+    """
+    Parses a string into plain Python objects: dicts, lists,
+    strings, numbers, booleans and dates and times.
+
+    The result is the same as parse(string).value, without any of
+    the formatting information of a TOMLDocument,
+    and the same errors are raised on invalid input.
+    """
+    return PlainParser(string).parse()
 
 
 def dumps(data):  # type: (_TOMLDocument) -> str
@@ -44,11 +73,78 @@ def dumps(data):  # type: (_TOMLDocument) -> str
     return data.as_string()
 
 
-def parse(string):  # type: (str) -> _TOMLDocument
+def parse(
+    string, lazy=False, workers=None, mode="full"
+):  # type: (Union[str, bytes], bool, Optional[int], str) -> _TOMLDocument
     """
     Parses a string into a TOMLDocument.
+
+    Binary input (bytes, bytearray or memoryview) must be UTF-8 encoded.
+
+    If lazy is True, only table headers are parsed upfront. The body of
+    each table is parsed the first time it is accessed, so errors it
+    contains are only raised then.
+
+    If workers is greater than 1, the input is split between top-level
+    tables and its parts are parsed by that many processes.
+    It is ignored when parsing lazily.
+
+    If mode is "hybrid", the document is first parsed into plain values,
+    like with loads_plain(), which reading it returns. The complete
+    document is only parsed, with the other options, from the kept
+    source text when it is first modified or rendered.
     """
-    return Parser(string).parse()
+    if mode == "hybrid":
+        text = decode_source(string)
+
+        return HybridDocument(
+            PlainParser(text).parse(),
+            lambda: Parser(text, lazy=lazy).parse(workers=workers),
+        )
+    elif mode != "full":
+        raise ValueError('Unknown parsing mode "{}".'.format(mode))
+
+    return Parser(string, lazy=lazy).parse(workers=workers)
+
+
+def incremental_parser():  # type: () -> IncrementalParser
+    """
+    Returns a parser to which the input can be fed in chunks.
+
+    Chunks are passed to its feed() method and close()
+    returns the resulting TOMLDocument.
+    """
+    return IncrementalParser()
+
+
+def iterparse(source):  # type: (Any) -> Generator[Event]
+    """
+    Yields an Event for each statement of a TOML document
+    without building the document itself.
+
+    The source can be a string, UTF-8 encoded bytes or a file object,
+    which is read in chunks so that memory usage does not depend
+    on the size of the document.
+    """
+    if not hasattr(source, "read"):
+        for event in Parser(source).events():
+            yield event
+
+        return
+
+    parser = EventParser()
+    while True:
+        chunk = source.read(_CHUNK_SIZE)
+        if not chunk:
+            break
+
+        parser.feed(chunk)
+        for event in parser.read_events():
+            yield event
+
+    parser.close()
+    for event in parser.read_events():
+        yield event
 
 
 def document():  # type: () -> _TOMLDocument
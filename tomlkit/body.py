@@ -0,0 +1,290 @@
+from typing import Any
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+# Number of entries of the blocks filled by appending.
+# Blocks grown by insertions are split in two once they hold twice as many.
+BLOCK_SIZE = 256
+
+
+class Entry(object):
+    """
+    A key and item of a container body.
+
+    Entries stay valid handles to their position in the body
+    while other entries are inserted around them.
+    """
+
+    __slots__ = ("key", "item", "_block")
+
+    def __init__(self, key, item, block=None):  # type: (Any, Any, _Block) -> None
+        self.key = key
+        self.item = item
+        self._block = block
+
+    def __getstate__(self):  # type: () -> Tuple[Any, Any]
+        return self.key, self.item
+
+    def __setstate__(self, state):  # type: (Tuple[Any, Any]) -> None
+        self.key, self.item = state
+        self._block = None
+
+    def __repr__(self):  # type: () -> str
+        return "<Entry {!r}: {!r}>".format(self.key, self.item)
+
+
+class _Block(object):
+    """
+    The position of a block of entries in a body.
+
+    Entries refer to their block through it rather than to the list
+    holding them, so that bodies do not form reference cycles.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(self, index):  # type: (int) -> None
+        self.index = index
+
+
+class Body(object):
+    """
+    The ordered (key, item) pairs of a container.
+
+    Entries are stored in blocks of bounded size, with a Fenwick tree
+    of the block sizes to locate positions, so that inserting an entry
+    at a position or after another one takes O(log n) time.
+
+    Iterating over or indexing a body gives (key, item) tuples.
+    """
+
+    def __init__(self, pairs=()):  # type: (Iterable[Tuple[Any, Any]]) -> None
+        self._blocks = []  # type: List[List[Entry]]
+        self._positions = []  # type: List[_Block]
+        self._len = 0
+        # Built on demand, then kept up to date until blocks are added
+        self._tree = None  # type: Optional[List[int]]
+
+        for key, item in pairs:
+            self.append(key, item)
+
+    def append(self, key, item):  # type: (Any, Any) -> Entry
+        blocks = self._blocks
+        if not blocks or len(blocks[-1]) >= BLOCK_SIZE:
+            self._add_block()
+
+        entry = Entry(key, item, self._positions[-1])
+        blocks[-1].append(entry)
+        self._len += 1
+
+        if self._tree is not None:
+            self._add(len(blocks) - 1, 1)
+
+        return entry
+
+    def insert(self, index, key, item):  # type: (int, Any, Any) -> Entry
+        """
+        Inserts a new entry before the given position, like list.insert().
+        """
+        if index < 0:
+            index = max(0, index + self._len)
+
+        if index >= self._len:
+            return self.append(key, item)
+
+        block, offset = self._locate(index)
+
+        return self._insert(block, offset, Entry(key, item))
+
+    def insert_after(self, entry, key, item):  # type: (Entry, Any, Any) -> Entry
+        """
+        Inserts a new entry right after the given one.
+        """
+        block = entry._block.index
+
+        return self._insert(
+            block, self._blocks[block].index(entry) + 1, Entry(key, item)
+        )
+
+    def entry(self, index):  # type: (int) -> Entry
+        if index < 0:
+            index += self._len
+
+        if not 0 <= index < self._len:
+            raise IndexError("body index out of range")
+
+        if index == self._len - 1:
+            return self._blocks[-1][-1]
+
+        block, offset = self._locate(index)
+
+        return self._blocks[block][offset]
+
+    def entries(self):  # type: () -> Generator[Entry]
+        for block in self._blocks:
+            for entry in block:
+                yield entry
+
+    def index(self, entry):  # type: (Entry) -> int
+        """
+        Returns the current position of the given entry.
+        """
+        block = entry._block.index
+
+        return self._offset(block) + self._blocks[block].index(entry)
+
+    def prune(self, predicate):  # type: (Callable[[Entry], bool]) -> int
+        """
+        Removes the entries for which the given function returns True,
+        rebuilding the blocks in a single pass.
+
+        Returns the number of removed entries.
+        """
+        entries = [entry for entry in self.entries() if not predicate(entry)]
+        removed = self._len - len(entries)
+        if removed:
+            self.__init__()
+            self._extend(entries)
+
+        return removed
+
+    def _extend(self, entries):  # type: (Iterable[Entry]) -> None
+        for entry in entries:
+            if not self._blocks or len(self._blocks[-1]) >= BLOCK_SIZE:
+                self._add_block()
+
+            entry._block = self._positions[-1]
+            self._blocks[-1].append(entry)
+            self._len += 1
+
+    def _add_block(self):  # type: () -> None
+        self._positions.append(_Block(len(self._blocks)))
+        self._blocks.append([])
+        self._tree = None
+
+    def _insert(self, block, offset, entry):  # type: (int, int, Entry) -> Entry
+        entries = self._blocks[block]
+        entries.insert(offset, entry)
+        entry._block = self._positions[block]
+        self._len += 1
+
+        if len(entries) > 2 * BLOCK_SIZE:
+            self._split(block)
+        elif self._tree is not None:
+            self._add(block, 1)
+
+        return entry
+
+    def _split(self, block):  # type: (int) -> None
+        entries = self._blocks[block]
+        half = len(entries) // 2
+        new = entries[half:]
+        del entries[half:]
+
+        position = _Block(block + 1)
+        for entry in new:
+            entry._block = position
+
+        self._blocks.insert(block + 1, new)
+        self._positions.insert(block + 1, position)
+        for i in range(block + 2, len(self._positions)):
+            self._positions[i].index = i
+
+        self._tree = None
+
+    def _build_tree(self):  # type: () -> List[int]
+        n = len(self._blocks)
+        tree = [0] * (n + 1)
+        for i, block in enumerate(self._blocks, 1):
+            tree[i] += len(block)
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+
+        self._tree = tree
+
+        return tree
+
+    def _add(self, index, delta):  # type: (int, int) -> None
+        tree = self._tree
+        index += 1
+        while index < len(tree):
+            tree[index] += delta
+            index += index & -index
+
+    def _offset(self, index):  # type: (int) -> int
+        """
+        Returns the number of entries before the given block.
+        """
+        tree = self._tree if self._tree is not None else self._build_tree()
+        offset = 0
+        while index > 0:
+            offset += tree[index]
+            index -= index & -index
+
+        return offset
+
+    def _locate(self, index):  # type: (int) -> Tuple[int, int]
+        """
+        Returns the index of the block holding the entry at the given position
+        and the offset of the entry within it.
+        """
+        tree = self._tree if self._tree is not None else self._build_tree()
+        n = len(tree) - 1
+        block = 0
+        step = 1 << (n.bit_length() - 1)
+        while step:
+            if block + step <= n and tree[block + step] <= index:
+                block += step
+                index -= tree[block]
+
+            step >>= 1
+
+        return block, index
+
+    def __len__(self):  # type: () -> int
+        return self._len
+
+    def __iter__(self):  # type: () -> Generator[Tuple[Any, Any]]
+        for block in self._blocks:
+            for entry in block:
+                yield entry.key, entry.item
+
+    def __getitem__(self, index):  # type: (int) -> Tuple[Any, Any]
+        entry = self.entry(index)
+
+        return entry.key, entry.item
+
+    def __setitem__(self, index, pair):  # type: (int, Tuple[Any, Any]) -> None
+        entry = self.entry(index)
+        entry.key, entry.item = pair
+
+    def __eq__(self, other):  # type: (Any) -> bool
+        if not isinstance(other, (Body, list)):
+            return NotImplemented
+
+        return list(self) == list(other)
+
+    def __ne__(self, other):  # type: (Any) -> bool
+        if not isinstance(other, (Body, list)):
+            return NotImplemented
+
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):  # type: () -> str
+        return "{}({!r})".format(self.__class__.__name__, list(self))
+
+    def __getstate__(self):  # type: () -> Tuple[List[Entry]]
+        # Wrapped so that the state of empty bodies is not skipped
+        return (list(self.entries()),)
+
+    def __setstate__(self, state):  # type: (Tuple[List[Entry]]) -> None
+        self.__init__()
+        self._extend(state[0])
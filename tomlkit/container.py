@@ -1,8 +1,12 @@
 from __future__ import unicode_literals
 
 import copy
+import weakref
+
+from types import GeneratorType
 
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import Generator
 from typing import List
@@ -11,6 +15,8 @@ from typing import Tuple
 from typing import Union
 
 from ._compat import decode
+from .body import Body
+from .body import Entry
 from .exceptions import KeyAlreadyPresent
 from .exceptions import NonExistentKey
 from .items import AoT
@@ -23,49 +29,203 @@ from .items import Whitespace
 from .items import item as _item
 
 
+# Removed items are left in the body as tombstones, which are compacted away
+# once there are at least COMPACT_MIN_TOMBSTONES of them
+# and they make up more than COMPACT_RATIO of the body.
+COMPACT_MIN_TOMBSTONES = 16
+COMPACT_RATIO = 0.5
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(
+        "{} is read-only, copy it to modify it".format(self.__class__.__name__)
+    )
+
+
+class ReadOnlyDict(dict):
+    """
+    A dict of the cached value of a container, which can not be modified.
+
+    Copying it gives a regular dict.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self):  # type: () -> Dict[Any, Any]
+        return dict(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):  # type: (Dict[int, Any]) -> Dict[Any, Any]
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self):  # type: () -> Tuple[type, Tuple[Dict[Any, Any]]]
+        return dict, (dict(self),)
+
+
+class ReadOnlyList(list):
+    """
+    A list of the cached value of a container, which can not be modified.
+
+    Copying it gives a regular list.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = reverse = sort = clear = _read_only
+
+    def copy(self):  # type: () -> List[Any]
+        return list(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):  # type: (Dict[int, Any]) -> List[Any]
+        return copy.deepcopy(list(self), memo)
+
+    def __reduce__(self):  # type: () -> Tuple[type, Tuple[List[Any]]]
+        return list, (list(self),)
+
+
 class Container(dict):
     """
     A container for items within a TOMLDocument.
     """
 
     def __init__(self, parsed=False):  # type: (bool) -> None
-        self._map = {}  # type: Dict[Key, int]
-        self._body = []  # type: List[Tuple[Optional[Key], Item]]
+        self._map = {}  # type: Dict[Key, Union[Entry, Tuple[Entry, ...]]]
+        self._body = Body()
         self._parsed = parsed
 
+        # Where new items are inserted, computed on first use then kept up to date
+        # by append(), see _insertion_boundary().
+        self._boundary = None  # type: Optional[list]
+
+        # Number of removed items still in the body, see compact().
+        self._tombstones = 0
+
+        # The plain value, built on first use, and references to the containers
+        # whose own cached value was built from it, see _changed().
+        self._cached_value = None  # type: Optional[Dict[Any, Any]]
+        self._dependents = None  # type: Optional[List[weakref.ref]]
+
     @property
-    def body(self):  # type: () -> List[Tuple[Optional[Key], Item]]
+    def body(self):  # type: () -> Body
         return self._body
 
+    @property
+    def tombstones(self):  # type: () -> int
+        """
+        The number of removed items still held in the body.
+        """
+        return self._tombstones
+
     @property
     def value(self):  # type: () -> Dict[Any, Any]
+        """
+        The items of the container as a dict, tables being dicts as well.
+
+        It is cached until the container, or one of its tables,
+        is modified, and is read-only: its dicts and lists can be copied
+        with copy.copy() or copy.deepcopy() to get modifiable ones.
+        """
+        return self._value()
+
+    def _value(self):  # type: () -> Dict[Any, Any]
+        """
+        Returns the cached value of the container, building it if needed.
+        """
+        if self._cached_value is None:
+            _build_values(self)
+
+        return self._cached_value
+
+    def _build_value(self):  # type: () -> Dict[Any, Any]
+        ref = weakref.ref(self)
         d = {}
+        merged = set()
         for k, v in self._body:
             if k is None:
                 continue
 
             k = k.key
+            if isinstance(v, AoT):
+                v.add_dependent(ref)
+
             v = v.value
 
             if isinstance(v, Container):
-                v = v.value
+                container, v = v, v._value()
+                container.add_dependent(ref)
+
+            elif type(v) is list:
+                # Arrays of tables
+                v = ReadOnlyList(v)
 
             if k in d:
+                # The values of the parts of a super table are merged in a copy
+                # as they are cached as well
+                if k not in merged:
+                    d[k] = dict(d[k])
+                    merged.add(k)
+
                 d[k].update(v)
             else:
                 d[k] = v
 
-        return d
+        for k in merged:
+            d[k] = ReadOnlyDict(d[k])
+
+        return ReadOnlyDict(d)
+
+    def add_dependent(self, ref):  # type: (weakref.ref) -> None
+        """
+        Registers a reference to a container whose cached value includes
+        the value of this one, to invalidate it when this one changes.
+
+        Each container is only registered once, however many times
+        its value is rebuilt while this one stays unchanged.
+        """
+        if self._dependents is None:
+            self._dependents = [ref]
+        elif not _is_registered(self._dependents, ref):
+            self._dependents.append(ref)
+
+    def _changed(self):  # type: () -> None
+        if self._cached_value is not None:
+            _invalidate([weakref.ref(self)])
 
     def parsing(self, parsing):  # type: (bool) -> None
-        self._parsed = parsing
+        containers = [self]
+        while containers:
+            container = containers.pop()
+            if isinstance(container, LazyContainer):
+                container.parsing(parsing)
+                continue
 
-        for k, v in self._body:
-            if isinstance(v, Table):
-                v.value.parsing(parsing)
-            elif isinstance(v, AoT):
-                for t in v.body:
-                    t.value.parsing(parsing)
+            container._parsed = parsing
+
+            for k, v in container._body:
+                if isinstance(v, Table):
+                    containers.append(v.value)
+                elif isinstance(v, AoT):
+                    containers.extend(t.value for t in v.body)
+
+    def is_loaded(self):  # type: () -> bool
+        """
+        Whether the items of the container have been parsed.
+
+        Only containers created by a lazy or hybrid parse can be unloaded.
+        """
+        return True
+
+    def load(self):  # type: () -> None
+        """
+        Parses the items of the container if they have not been yet.
+        """
 
     def add(
         self, key, item=None
@@ -84,6 +244,8 @@ class Container(dict):
         return self.append(key, item)
 
     def append(self, key, item):  # type: (Union[Key, str, None], Item) -> Container
+        self._changed()
+
         if not isinstance(key, Key) and key is not None:
             key = Key(key)
 
@@ -93,26 +255,28 @@ class Container(dict):
         if isinstance(item, (AoT, Table)) and item.name is None:
             item.name = key.key
 
+        # Removed items are not taken into account
+        has_items = len(self._body) > self._tombstones
         if (
             isinstance(item, Table)
-            and self._body
+            and has_items
             and not self._parsed
             and not item.trivia.indent
         ):
             item.trivia.indent = "\n"
 
-        if isinstance(item, AoT) and self._body and not self._parsed:
+        if isinstance(item, AoT) and has_items and not self._parsed:
             if item and "\n" not in item[0].trivia.indent:
                 item[0].trivia.indent = "\n" + item[0].trivia.indent
             else:
                 self.append(None, Whitespace("\n"))
 
         if key is not None and key in self:
-            current_idx = self._map[key]
-            if isinstance(current_idx, tuple):
-                current_idx = current_idx[0]
+            current = self._map[key]
+            if isinstance(current, tuple):
+                current = current[0]
 
-            current = self._body[current_idx][1]
+            current = current.item
             if isinstance(item, Table):
                 if not isinstance(current, (Table, AoT)):
                     raise KeyAlreadyPresent(key)
@@ -148,31 +312,19 @@ class Container(dict):
                 raise KeyAlreadyPresent(key)
 
         is_table = isinstance(item, (Table, AoT))
-        if key is not None and self._body and not self._parsed:
+        if key is not None and has_items and not self._parsed:
             # If there is already at least one table in the current container
             # and the given item is not a table, we need to find the last
             # item that is not a table and insert after it
             # If no such item exists, insert at the top of the table
-            key_after = None
-            idx = 0
-            for k, v in self._body:
-                if isinstance(v, Null):
-                    # This happens only after deletion
-                    continue
-
-                if isinstance(v, Whitespace) and not v.is_fixed():
-                    continue
-
-                if not is_table and isinstance(v, (Table, AoT)):
-                    break
-
-                key_after = k or idx
-                idx += 1
+            boundary = self._insertion_boundary()
+            key_after = boundary[1] if is_table else boundary[0]
 
             if key_after is not None:
                 if isinstance(key_after, int):
-                    if key_after + 1 < len(self._body) - 1:
-                        return self._insert_at(key_after + 1, key, item)
+                    idx = self._index_after(key_after)
+                    if idx is not None:
+                        return self._insert_at(idx, key, item)
                     else:
                         previous_item = self._body[-1][1]
                         if (
@@ -182,53 +334,126 @@ class Container(dict):
                         ):
                             previous_item.trivia.trail += "\n"
                 else:
-                    return self._insert_after(key_after, key, item)
+                    self._insert_after(key_after, key, item)
+                    self._boundary = _inserted(boundary, key, is_table)
+
+                    return self
             else:
-                return self._insert_at(0, key, item)
+                self._insert_at(0, key, item)
+                self._boundary = _inserted(boundary, key, is_table)
+
+                return self
 
         if key in self._map:
-            current_idx = self._map[key]
-            if isinstance(current_idx, tuple):
-                current_idx = current_idx[0]
+            current = self._map[key]
+            if isinstance(current, tuple):
+                current = current[0]
 
-            current = self._body[current_idx][1]
-            if key is not None and not isinstance(current, Table):
+            if key is not None and not isinstance(current.item, Table):
                 raise KeyAlreadyPresent(key)
 
             # Adding sub tables to a currently existing table
-            idx = self._map[key]
-            if not isinstance(idx, tuple):
-                idx = (idx,)
+            entries = self._map[key]
+            if not isinstance(entries, tuple):
+                entries = (entries,)
 
-            self._map[key] = idx + (len(self._body),)
+            self._map[key] = entries + (self._body.append(key, item),)
         else:
-            self._map[key] = len(self._body)
+            self._map[key] = self._body.append(key, item)
 
-        self._body.append((key, item))
+        if self._boundary is not None:
+            _appended(self._boundary, key, item)
 
         if key is not None:
             super(Container, self).__setitem__(key.key, item.value)
 
         return self
 
+    def _insertion_boundary(self):  # type: () -> list
+        """
+        Returns where items are inserted, as the key, or index if it has none,
+        of the last item that is not a table before the first table,
+        and of the last item, followed by the number of items
+        and whether there is a table among them.
+
+        Comments, fixed whitespace and values are counted as items.
+        """
+        if self._boundary is None:
+            self._boundary = [None, None, 0, False]
+            for k, v in self._body:
+                _appended(self._boundary, k, v)
+
+        return self._boundary
+
+    def _index_after(self, count):  # type: (int) -> Optional[int]
+        """
+        Returns the position in the body right after the item
+        at the given index of the insertion boundary,
+        or None if only removed items and unfixed whitespace follow it.
+
+        Removed items and unfixed whitespace are not counted in the index, like in
+        _appended(), so the position does not depend on whether the body
+        was compacted.
+        """
+        idx = None
+        for i, (_, v) in enumerate(self._body):
+            if not _is_counted(v):
+                continue
+
+            if idx is not None:
+                return idx
+
+            if count == 0:
+                idx = i + 1
+
+            count -= 1
+
     def remove(self, key):  # type: (Union[Key, str]) -> Container
         if not isinstance(key, Key):
             key = Key(key)
 
-        idx = self._map.pop(key, None)
-        if idx is None:
+        entries = self._map.pop(key, None)
+        if entries is None:
             raise NonExistentKey(key)
 
-        if isinstance(idx, tuple):
-            for i in idx:
-                self._body[i] = (None, Null())
-        else:
-            self._body[idx] = (None, Null())
+        self._changed()
+
+        if not isinstance(entries, tuple):
+            entries = (entries,)
+
+        for entry in entries:
+            entry.key, entry.item = None, Null()
+
+        self._boundary = None
+        self._removed(len(entries))
 
         super(Container, self).__delitem__(key.key)
 
         return self
 
+    def compact(self):  # type: () -> Container
+        """
+        Drops the tombstones left in the body by removed items.
+        """
+        if self._tombstones:
+            self._body.prune(_is_tombstone)
+            self._tombstones = 0
+            self._boundary = None
+
+        return self
+
+    def _removed(self, count):  # type: (int) -> None
+        """
+        Records the given number of new tombstones,
+        compacting the body if they make up too much of it.
+        """
+        self._tombstones += count
+        if (
+            self._tombstones >= COMPACT_MIN_TOMBSTONES
+            and self._tombstones > COMPACT_RATIO * len(self._body)
+        ):
+            self.compact()
+
     def _insert_after(
         self, key, other_key, item
     ):  # type: (Union[str, Key], Union[str, Key], Union[Item, Any]) -> Container
@@ -246,30 +471,18 @@ class Container(dict):
 
         item = _item(item)
 
-        idx = self._map[key]
-        # Insert after the max index if there are many.
-        if isinstance(idx, tuple):
-            idx = max(idx)
-        current_item = self._body[idx][1]
+        entry = self._map[key]
+        # Insert after the last entry if there are many,
+        # they are in the order they were appended.
+        if isinstance(entry, tuple):
+            entry = entry[-1]
+        current_item = entry.item
         if "\n" not in current_item.trivia.trail:
             current_item.trivia.trail += "\n"
 
-        # Increment indices after the current index
-        for k, v in self._map.items():
-            if isinstance(v, tuple):
-                new_indices = []
-                for v_ in v:
-                    if v_ > idx:
-                        v_ = v_ + 1
-
-                    new_indices.append(v_)
-
-                self._map[k] = tuple(new_indices)
-            elif v > idx:
-                self._map[k] = v + 1
-
-        self._map[other_key] = idx + 1
-        self._body.insert(idx + 1, (other_key, item))
+        self._map[other_key] = self._body.insert_after(entry, other_key, item)
+        self._boundary = None
+        self._changed()
 
         if key is not None:
             super(Container, self).__setitem__(other_key.key, item.value)
@@ -296,22 +509,9 @@ class Container(dict):
             ):
                 previous_item.trivia.trail += "\n"
 
-        # Increment indices after the current index
-        for k, v in self._map.items():
-            if isinstance(v, tuple):
-                new_indices = []
-                for v_ in v:
-                    if v_ >= idx:
-                        v_ = v_ + 1
-
-                    new_indices.append(v_)
-
-                self._map[k] = tuple(new_indices)
-            elif v >= idx:
-                self._map[k] = v + 1
-
-        self._map[key] = idx
-        self._body.insert(idx, (key, item))
+        self._map[key] = self._body.insert(idx, key, item)
+        self._boundary = None
+        self._changed()
 
         if key is not None:
             super(Container, self).__setitem__(key.key, item.value)
@@ -322,36 +522,34 @@ class Container(dict):
         if not isinstance(key, Key):
             key = Key(key)
 
-        idx = self._map.get(key, None)
-        if idx is None:
+        entry = self._map.get(key, None)
+        if entry is None:
             raise NonExistentKey(key)
 
-        return self._body[idx][1]
+        return entry.item
 
     def last_item(self):  # type: () -> Optional[Item]
         if self._body:
             return self._body[-1][1]
 
     def as_string(self, prefix=None):  # type: () -> str
-        s = ""
+        return _join(self._render())
+
+    def _render(self):  # type: () -> Generator
         for k, v in self._body:
             if k is not None:
                 if isinstance(v, Table):
-                    s += self._render_table(k, v)
+                    yield self._render_table(k, v)
                 elif isinstance(v, AoT):
-                    s += self._render_aot(k, v)
+                    yield self._render_aot(k, v)
                 else:
-                    s += self._render_simple_item(k, v)
+                    yield self._render_simple_item(k, v)
             else:
-                s += self._render_simple_item(k, v)
-
-        return s
+                yield self._render_simple_item(k, v)
 
     def _render_table(
         self, key, table, prefix=None
-    ):  # (Key, Table, Optional[str]) -> str
-        cur = ""
-
+    ):  # (Key, Table, Optional[str]) -> Generator
         if table.display_name is not None:
             _key = table.display_name
         else:
@@ -362,7 +560,8 @@ class Container(dict):
 
         if not table.is_super_table() or (
             any(
-                not isinstance(v, (Table, AoT, Whitespace)) for _, v in table.value.body
+                not isinstance(v, (Table, AoT, Whitespace, Null))
+                for _, v in table.value.body
             )
             and not key.is_dotted()
         ):
@@ -370,7 +569,7 @@ class Container(dict):
             if table.is_aot_element():
                 open_, close = "[[", "]]"
 
-            cur += "{}{}{}{}{}{}{}{}".format(
+            yield "{}{}{}{}{}{}{}{}".format(
                 table.trivia.indent,
                 open_,
                 decode(_key),
@@ -381,46 +580,47 @@ class Container(dict):
                 "\n" if "\n" not in table.trivia.trail and len(table.value) > 0 else "",
             )
 
+        if not table.value.is_loaded():
+            # Untouched tables are rendered as their original text
+            yield table.value.as_string()
+
+            return
+
         for k, v in table.value.body:
             if isinstance(v, Table):
                 if v.is_super_table():
                     if k.is_dotted() and not key.is_dotted():
                         # Dotted key inside table
-                        cur += self._render_table(k, v)
+                        yield self._render_table(k, v)
                     else:
-                        cur += self._render_table(k, v, prefix=_key)
+                        yield self._render_table(k, v, prefix=_key)
                 else:
-                    cur += self._render_table(k, v, prefix=_key)
+                    yield self._render_table(k, v, prefix=_key)
             elif isinstance(v, AoT):
-                cur += self._render_aot(k, v, prefix=_key)
+                yield self._render_aot(k, v, prefix=_key)
             else:
-                cur += self._render_simple_item(
+                yield self._render_simple_item(
                     k, v, prefix=_key if key.is_dotted() else None
                 )
 
-        return cur
-
     def _render_aot(self, key, aot, prefix=None):
         _key = key.as_string()
         if prefix is not None:
             _key = prefix + "." + _key
 
-        cur = ""
         _key = decode(_key)
         for table in aot.body:
-            cur += self._render_aot_table(table, prefix=_key)
-
-        return cur
-
-    def _render_aot_table(self, table, prefix=None):  # (Table, Optional[str]) -> str
-        cur = ""
+            yield self._render_aot_table(table, prefix=_key)
 
+    def _render_aot_table(
+        self, table, prefix=None
+    ):  # (Table, Optional[str]) -> Generator
         _key = prefix or ""
 
         if not table.is_super_table():
             open_, close = "[[", "]]"
 
-            cur += "{}{}{}{}{}{}{}".format(
+            yield "{}{}{}{}{}{}{}".format(
                 table.trivia.indent,
                 open_,
                 decode(_key),
@@ -430,22 +630,25 @@ class Container(dict):
                 table.trivia.trail,
             )
 
+        if not table.value.is_loaded():
+            yield table.value.as_string()
+
+            return
+
         for k, v in table.value.body:
             if isinstance(v, Table):
                 if v.is_super_table():
                     if k.is_dotted():
                         # Dotted key inside table
-                        cur += self._render_table(k, v)
+                        yield self._render_table(k, v)
                     else:
-                        cur += self._render_table(k, v, prefix=_key)
+                        yield self._render_table(k, v, prefix=_key)
                 else:
-                    cur += self._render_table(k, v, prefix=_key)
+                    yield self._render_table(k, v, prefix=_key)
             elif isinstance(v, AoT):
-                cur += self._render_aot(k, v, prefix=_key)
+                yield self._render_aot(k, v, prefix=_key)
             else:
-                cur += self._render_simple_item(k, v)
-
-        return cur
+                yield self._render_simple_item(k, v)
 
     def _render_simple_item(self, key, item, prefix=None):
         if key is None:
@@ -482,7 +685,7 @@ class Container(dict):
             yield v.value
 
     def items(self):  # type: () -> Generator[Item]
-        for k, v in self.value.items():
+        for k, v in self._value().items():
             if k is None:
                 continue
 
@@ -502,15 +705,15 @@ class Container(dict):
         if not isinstance(key, Key):
             key = Key(key)
 
-        idx = self._map.get(key, None)
-        if idx is None:
+        entry = self._map.get(key, None)
+        if entry is None:
             raise NonExistentKey(key)
 
-        if isinstance(idx, tuple):
+        if isinstance(entry, tuple):
             container = Container(True)
 
-            for i in idx:
-                item = self._body[i][1]
+            for e in entry:
+                item = e.item
 
                 if isinstance(item, Table):
                     for k, v in item.value.body:
@@ -520,9 +723,7 @@ class Container(dict):
 
             return container
 
-        item = self._body[idx][1]
-
-        return item.value
+        return entry.item.value
 
     def __setitem__(self, key, value):  # type: (Union[Key, str], Any) -> None
         if key is not None and key in self:
@@ -542,22 +743,23 @@ class Container(dict):
         if not isinstance(new_key, Key):
             new_key = Key(new_key)
 
-        idx = self._map.get(key, None)
-        if idx is None:
+        entry = self._map.get(key, None)
+        if entry is None:
             raise NonExistentKey(key)
 
-        self._replace_at(idx, new_key, value)
+        self._replace_at(entry, new_key, value)
 
     def _replace_at(
-        self, idx, new_key, value
-    ):  # type: (Union[int, Tuple[int]], Union[Key, str], Item) -> None
-        if isinstance(idx, tuple):
-            for i in idx[1:]:
-                self._body[i] = (None, Null())
+        self, entry, new_key, value
+    ):  # type: (Union[Entry, Tuple[Entry, ...]], Union[Key, str], Item) -> None
+        if isinstance(entry, tuple):
+            for e in entry[1:]:
+                e.key, e.item = None, Null()
 
-            idx = idx[0]
+            self._removed(len(entry) - 1)
+            entry = entry[0]
 
-        k, v = self._body[idx]
+        k, v = entry.key, entry.item
 
         self._map[new_key] = self._map.pop(k)
 
@@ -577,18 +779,20 @@ class Container(dict):
             # Insert a cosmetic new line for tables
             value.append(None, Whitespace("\n"))
 
-        self._body[idx] = (new_key, value)
+        entry.key, entry.item = new_key, value
+        self._boundary = None
+        self._changed()
 
         super(Container, self).__setitem__(new_key.key, value.value)
 
     def __str__(self):  # type: () -> str
-        return str(self.value)
+        return str(self._value())
 
     def __eq__(self, other):  # type: (Dict) -> bool
         if not isinstance(other, dict):
             return NotImplemented
 
-        return self.value == other
+        return self._value() == other
 
     def _getstate(self, protocol):
         return (self._parsed,)
@@ -604,9 +808,23 @@ class Container(dict):
         )
 
     def __setstate__(self, state):
-        self._map = state[0]
-        self._body = state[1]
-        self._parsed = state[2]
+        self._map, self._body, self._parsed = state
+        if isinstance(self._body, list):
+            # Pickled as a list of items, indexed by position
+            body, self._body = self._body, Body()
+            entries = [self._body.append(k, v) for k, v in body]
+            for k, idx in self._map.items():
+                if isinstance(idx, tuple):
+                    self._map[k] = tuple(entries[i] for i in idx)
+                else:
+                    self._map[k] = entries[idx]
+
+        self._boundary = None
+        self._tombstones = sum(1 for e in self._body.entries() if _is_tombstone(e))
+
+        for k, v in self._body:
+            if k is not None:
+                super(Container, self).__setitem__(k.key, v.value)
 
     def copy(self):  # type: () -> Container
         return copy.copy(self)
@@ -616,7 +834,251 @@ class Container(dict):
         for k, v in super(Container, self).copy().items():
             super(Container, c).__setitem__(k, v)
 
-        c._body += self.body
-        c._map.update(self._map)
+        entries = {}
+        for entry in self._body.entries():
+            entries[entry] = c._body.append(entry.key, entry.item)
+
+        for k, entry in self._map.items():
+            if isinstance(entry, tuple):
+                c._map[k] = tuple(entries[e] for e in entry)
+            else:
+                c._map[k] = entries[entry]
+
+        c._tombstones = self._tombstones
 
         return c
+
+
+def _join(parts):  # type: (Generator) -> str
+    """
+    Joins the strings yielded by a rendering generator.
+
+    Rendering generators yield the generators of their nested tables
+    instead of calling them, which are run from an explicit stack
+    so that deeply nested tables do not exhaust the recursion limit.
+    """
+    s = []
+    stack = [parts]
+    while stack:
+        for part in stack[-1]:
+            if isinstance(part, GeneratorType):
+                stack.append(part)
+                break
+
+            s.append(part)
+        else:
+            stack.pop()
+
+    return "".join(s)
+
+
+def _build_values(container):  # type: (Container) -> None
+    """
+    Caches the value of a container, building the missing values
+    of its tables first from an explicit stack, so that deeply
+    nested tables do not exhaust the recursion limit.
+    """
+    stack = [(container, False)]
+    while stack:
+        container, ready = stack.pop()
+        if container._cached_value is not None:
+            continue
+
+        if ready:
+            container._cached_value = container._build_value()
+            continue
+
+        container.load()
+        stack.append((container, True))
+        for k, v in container._body:
+            if k is not None and isinstance(v, Table) and v.value._cached_value is None:
+                stack.append((v.value, False))
+
+
+def _invalidate(refs):  # type: (List[weakref.ref]) -> None
+    """
+    Drops the cached value of the referenced containers
+    and of the containers including them, up to the root.
+    """
+    while refs:
+        container = refs.pop()()
+        if container is None or container._cached_value is None:
+            # Containers without a cached value have no dependents
+            continue
+
+        container._cached_value = None
+        if container._dependents:
+            refs.extend(container._dependents)
+            container._dependents = None
+
+
+def _is_registered(refs, ref):  # type: (List[weakref.ref], weakref.ref) -> bool
+    """
+    Returns whether the container referenced by ref is among refs.
+    """
+    container = ref()
+
+    return any(r() is container for r in refs)
+
+
+def _is_tombstone(entry):  # type: (Entry) -> bool
+    return entry.key is None and isinstance(entry.item, Null)
+
+
+def _appended(boundary, key, item):  # type: (list, Optional[Key], Item) -> None
+    """
+    Updates the insertion boundary of a container for an item appended to it.
+    """
+    if not _is_counted(item):
+        return
+
+    after = key or boundary[2]
+    if isinstance(item, (Table, AoT)):
+        boundary[3] = True
+    elif not boundary[3]:
+        boundary[0] = after
+
+    boundary[1] = after
+    boundary[2] += 1
+
+
+def _is_counted(item):  # type: (Item) -> bool
+    """
+    Whether the given item is counted in the insertion boundary of a container.
+    """
+    return not isinstance(item, Null) and not (
+        isinstance(item, Whitespace) and not item.is_fixed()
+    )
+
+
+def _inserted(boundary, key, is_table):  # type: (list, Key, bool) -> list
+    """
+    Returns the insertion boundary of a container after an item
+    was inserted at its boundary.
+    """
+    before, last, count, has_table = boundary
+    if is_table:
+        return [before, key, count + 1, True]
+
+    if not has_table:
+        last = key
+    elif isinstance(last, int):
+        last += 1
+
+    return [key, last, count + 1, has_table]
+
+
+class LazyContainer(Container):
+    """
+    A container whose items are parsed from their source text
+    the first time they are needed.
+
+    Until then, the container renders as its original text.
+    """
+
+    def __init__(self, raw, loader):  # type: (str, Callable[[Container], None]) -> None
+        super(LazyContainer, self).__init__(True)
+
+        self._raw = raw
+        self._loader = loader
+        self._callbacks = []  # type: List[Callable[[], None]]
+
+    def is_loaded(self):  # type: () -> bool
+        return False
+
+    def load(self):  # type: () -> None
+        if self._loader is None:
+            # Already being loaded
+            return
+
+        # Items are appended the way the parser would,
+        # the final parsing state is restored afterwards.
+        loader, self._loader = self._loader, None
+        parsed, self._parsed = self._parsed, True
+        try:
+            loader(self)
+        except Exception:
+            self._loader = loader
+            self._parsed = parsed
+            self._map = {}
+            self._body = Body()
+            self._boundary = None
+            self._tombstones = 0
+            self._cached_value = None
+            dict.clear(self)
+
+            raise
+
+        # Once loaded, it is nothing more than a regular container
+        callbacks = self._callbacks
+        del self._raw, self._loader, self._callbacks
+        self.__class__ = Container
+
+        self.parsing(parsed)
+
+        for callback in callbacks:
+            callback()
+
+    def on_load(self, callback):  # type: (Callable[[], None]) -> None
+        """
+        Registers a function to call once the items have been parsed.
+        """
+        self._callbacks.append(callback)
+
+    def parsing(self, parsing):  # type: (bool) -> None
+        self._parsed = parsing
+
+    def as_string(self, prefix=None):  # type: () -> str
+        return self._raw
+
+
+def _loading(method):  # type: (Callable) -> Callable
+    def wrapper(self, *args, **kwargs):
+        self.load()
+
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+# Every other way of reading or modifying a lazy container loads it first
+_LOADING_METHODS = [
+    "add",
+    "append",
+    "remove",
+    "_insert_after",
+    "_insert_at",
+    "item",
+    "last_item",
+    "keys",
+    "values",
+    "items",
+    "update",
+    "get",
+    "pop",
+    "popitem",
+    "setdefault",
+    "clear",
+    "copy",
+    "_replace",
+    "_replace_at",
+    "_getstate",
+    "__contains__",
+    "__getitem__",
+    "__setitem__",
+    "__delitem__",
+    "__iter__",
+    "__len__",
+    "__eq__",
+    "__ne__",
+    "__str__",
+    "__repr__",
+    "__copy__",
+    "__reduce_ex__",
+]
+
+for _name in _LOADING_METHODS:
+    setattr(LazyContainer, _name, _loading(getattr(Container, _name)))
+
+for _name in ["body", "value"]:
+    setattr(LazyContainer, _name, property(_loading(getattr(Container, _name).fget)))
@@ -0,0 +1,63 @@
+from __future__ import unicode_literals
+
+from enum import Enum
+from typing import Any
+from typing import Optional
+
+from .items import Item
+from .items import Key
+
+
+class EventType(Enum):
+    """
+    The type of an Event.
+    """
+
+    # A table header: [table]
+    Table = "table"
+    # An array of tables element header: [[table]]
+    AoTElement = "aot_element"
+    # A key/value pair
+    KeyValue = "key_value"
+    # A comment on its own line
+    Comment = "comment"
+    # Blank lines
+    Whitespace = "whitespace"
+
+
+class Event(object):
+    """
+    A single statement of a TOML document, as yielded by iterparse().
+
+    start and end are the offsets of the statement in the decoded document
+    and raw is its source text, including indentation and trailing comment.
+    """
+
+    __slots__ = ("type", "start", "end", "raw", "key", "item")
+
+    def __init__(
+        self, type, start, end, raw, key=None, item=None
+    ):  # type: (EventType, int, int, str, Optional[Key], Optional[Item]) -> None
+        self.type = type
+        self.start = start
+        self.end = end
+        self.raw = raw
+        # Key of a key/value pair, or name of a table
+        self.key = key
+        # Item parsed from the statement, if any
+        self.item = item
+
+    @property
+    def value(self):  # type: () -> Any
+        """
+        The value of a key/value pair, as a Python object.
+        """
+        if self.type != EventType.KeyValue:
+            return None
+
+        return self.item.value
+
+    def __repr__(self):  # type: () -> str
+        return "<Event {} {}:{} {!r}>".format(
+            self.type.value, self.start, self.end, self.raw
+        )
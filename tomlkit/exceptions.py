@@ -156,6 +156,17 @@ class InvalidCharInStringError(ParseError):
         super(InvalidCharInStringError, self).__init__(line, col, message=message)
 
 
+class InvalidEncodingError(ParseError):
+    """
+    The TOML being parsed is not valid UTF-8.
+    """
+
+    def __init__(self, line, col):  # type: (int, int) -> None
+        message = "Invalid UTF-8 sequence"
+
+        super(InvalidEncodingError, self).__init__(line, col, message=message)
+
+
 class UnexpectedEofError(ParseError):
     """
     The TOML being parsed ended before the end of a statement.
@@ -10,6 +10,7 @@ from enum import Enum
 from typing import Any
 from typing import Dict
 from typing import Generator
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Union
@@ -756,6 +757,13 @@ class Table(Item, dict):
         self._is_aot_element = is_aot_element
         self._is_super_table = is_super_table
 
+        if self._value.is_loaded():
+            self._update_keys()
+        else:
+            # The body of lazily parsed tables is only known once loaded
+            self._value.on_load(self._update_keys)
+
+    def _update_keys(self):  # type: () -> None
         for k, v in self._value.body:
             if k is not None:
                 super(Table, self).__setitem__(k.key, v)
@@ -893,7 +901,34 @@ class Table(Item, dict):
     def __delitem__(self, key):  # type: (Union[Key, str]) -> None
         self.remove(key)
 
+    def get(self, key, default=None):  # type: (Union[Key, str], Any) -> Any
+        self._value.load()
+
+        return super(Table, self).get(key, default)
+
+    def __iter__(self):  # type: () -> Iterator[str]
+        self._value.load()
+
+        return super(Table, self).__iter__()
+
+    def __len__(self):  # type: () -> int
+        self._value.load()
+
+        return super(Table, self).__len__()
+
+    def __eq__(self, other):  # type: (Any) -> bool
+        self._value.load()
+
+        return super(Table, self).__eq__(other)
+
+    def __ne__(self, other):  # type: (Any) -> bool
+        self._value.load()
+
+        return super(Table, self).__ne__(other)
+
     def __repr__(self):
+        self._value.load()
+
         return super(Table, self).__repr__()
 
     def _getstate(self, protocol=3):
@@ -967,9 +1002,11 @@ class InlineTable(Item, dict):
 
     def as_string(self):  # type: () -> str
         buf = "{"
-        for i, (k, v) in enumerate(self._value.body):
+        # Removed items are left out of the body
+        body = [(k, v) for k, v in self._value.body if not isinstance(v, Null)]
+        for i, (k, v) in enumerate(body):
             if k is None:
-                if i == len(self._value.body) - 1:
+                if i == len(body) - 1:
                     buf = buf.rstrip(",")
 
                 buf += v.as_string()
@@ -985,7 +1022,7 @@ class InlineTable(Item, dict):
                 v.trivia.trail.replace("\n", ""),
             )
 
-            if i != len(self._value.body) - 1:
+            if i != len(body) - 1:
                 buf += ","
 
         buf += "}"
@@ -1103,6 +1140,8 @@ class AoT(Item, list):
         self.name = name
         self._body = []
         self._parsed = parsed
+        # References to the containers whose cached value includes this AoT
+        self._dependents = None
 
         super(AoT, self).__init__(Trivia(trail=""))
 
@@ -1139,8 +1178,26 @@ class AoT(Item, list):
 
         super(AoT, self).append(table)
 
+        if self._dependents:
+            from .container import _invalidate
+
+            dependents, self._dependents = self._dependents, None
+            _invalidate(dependents)
+
         return table
 
+    def add_dependent(self, ref):  # type: (Any) -> None
+        """
+        Registers a reference to a container whose cached value
+        includes this AoT, to invalidate it when a table is appended.
+        """
+        from .container import _is_registered
+
+        if self._dependents is None:
+            self._dependents = [ref]
+        elif not _is_registered(self._dependents, ref):
+            self._dependents.append(ref)
+
     def as_string(self):  # type: () -> str
         b = ""
         for table in self._body:
@@ -1,33 +1,50 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+import codecs
+import multiprocessing
 import re
 import string
 
+from bisect import bisect_left
+from datetime import date
+from datetime import datetime
+from datetime import time
 from typing import Any
+from typing import Dict
 from typing import Generator
 from typing import List
+from typing import Match
 from typing import Optional
+from typing import Pattern
 from typing import Tuple
 from typing import Union
 
 from ._compat import chr
-from ._compat import decode
+from ._compat import long
+from ._compat import unicode
+from ._scanner import Header
+from ._scanner import scan_headers
 from ._utils import _escaped
-from ._utils import RFC_3339_LOOSE
-from ._utils import parse_rfc3339
+from ._utils import RFC_3339
+from ._utils import parse_rfc3339_match
 from .container import Container
+from .container import LazyContainer
+from .events import Event
+from .events import EventType
 from .exceptions import EmptyKeyError
 from .exceptions import EmptyTableNameError
 from .exceptions import InternalParserError
 from .exceptions import InvalidCharInStringError
 from .exceptions import InvalidDateTimeError
 from .exceptions import InvalidDateError
+from .exceptions import InvalidEncodingError
 from .exceptions import InvalidTimeError
 from .exceptions import InvalidNumberError
 from .exceptions import InvalidUnicodeValueError
 from .exceptions import MixedArrayTypesError
 from .exceptions import ParseError
+from .exceptions import TOMLKitError
 from .exceptions import UnexpectedCharError
 from .exceptions import UnexpectedEofError
 from .items import AoT
@@ -51,21 +68,103 @@ from .items import Time
 from .items import Trivia
 from .items import Whitespace
 from .source import Source
+from .source import decode_source
 from .toml_char import TOMLChar
+from .toml_char import toml_char
 from .toml_document import TOMLDocument
 
 
+# Patterns consuming a whole token at once, matched at the current position
+BARE_KEY = re.compile(r"[A-Za-z0-9_-]+")
+SPACES = re.compile(r"[ \t]+")
+BLANK = re.compile(r"[ \t\r]+")
+KV_SEP = re.compile(r"[ \t]*(?:=[ \t]*)?")
+COMMENT = re.compile(r"[^\r\n]*")
+TABLE_HEADER = re.compile(r"\[(\[)?([^\]]*)")
+BARE_TABLE_NAME = re.compile(r"[A-Za-z0-9_-]+(?:\.[A-Za-z0-9_-]+)*\Z")
+VALUE = re.compile(r"[^ \t\n\r#,\]}]+")
+QUOTED_KEY = {'"': re.compile(r'[^"]*'), "'": re.compile(r"[^']*")}
+WHITESPACE = re.compile(r"[ \t\n\r]+")
+# Number literals, classified by the name of the matching group
+NUMBER = re.compile(
+    r"""
+    (?P<hex>0x[0-9a-fA-F](?:_?[0-9a-fA-F])*)\Z
+    |(?P<oct>0o[0-7](?:_?[0-7])*)\Z
+    |(?P<bin>0b[01](?:_?[01])*)\Z
+    |(?P<int>[+-]?(?:0|[1-9](?:_?[0-9])*))\Z
+    |(?P<float>[+-]?
+        (?:
+            (?:0|[1-9](?:_?[0-9])*)  # Integer part
+            (?:\.[0-9](?:_?[0-9])*)?  # Fractional part
+            (?:[eE][+-]?[0-9](?:_?[0-9])*)?  # Exponent part
+            |inf|nan
+        )
+    )\Z
+    """,
+    re.VERBOSE,
+)
+NUMBER_BASES = {"hex": 16, "oct": 8, "bin": 2}
+# Runs of characters standing for themselves within each type of string
+STRING_CHARS = {
+    StringType.SLB: re.compile(r'[^"\\\n\r]+'),
+    StringType.MLB: re.compile(r'[^"\\]+'),
+    StringType.SLL: re.compile(r"[^'\n\r]+"),
+    StringType.MLL: re.compile(r"[^']+"),
+}
+
+# Patterns of the statements and values read directly by PlainParser.
+# Quoted keys are limited to the ones Parser takes as they are.
+_PLAIN_BARE = r"[A-Za-z0-9_-]+"
+_PLAIN_QUOTED = r""""[^"'\\.\r\n]*"|'[^"'\\.\r\n]*'"""
+_PLAIN_KEY = r"(?:{b}(?:\.(?:{b}|{q}))*|{q})".format(b=_PLAIN_BARE, q=_PLAIN_QUOTED)
+PLAIN_TRAIL = re.compile(r"[ \t\r]*(?:#[^\r\n]*)?\r?(?:\n|\Z)")
+PLAIN_HEADER = re.compile(
+    r"[ \t\r]*\[(\[)?({b}(?:\.{b})*)\](\])?".format(b=_PLAIN_BARE) + PLAIN_TRAIL.pattern
+)
+PLAIN_KEY_VALUE = re.compile(r"[ \t]*({})[ \t]*=[ \t]*".format(_PLAIN_KEY))
+PLAIN_INLINE_KEY = re.compile(
+    r"[ \t]*({}|{})[ \t]*=[ \t]*".format(_PLAIN_BARE, _PLAIN_QUOTED)
+)
+PLAIN_SPACES = re.compile(r"[ \t]*")
+PLAIN_ARRAY_WS = re.compile(r"(?:[ \t\r\n]+|#[^\r\n]*)*")
+PLAIN_BASIC = re.compile(r'"(?!"")([^"\\\r\n]*)"')
+PLAIN_LITERAL = re.compile(r"'(?!'')([^'\r\n]*)'")
+
+
 class Parser:
     """
     Parser for TOML documents.
     """
 
-    def __init__(self, string):  # type: (str) -> None
-        # Input to parse
-        self._src = Source(decode(string))
+    def __init__(
+        self, string, line_offset=0, lazy=False
+    ):  # type: (Union[str, bytes], int, bool) -> None
+        # Input to parse, line_offset is the number of lines preceding it
+        # when it is only a fragment of the document.
+        self._src = Source(decode_source(string), line_offset=line_offset)
 
         self._aot_stack = []
 
+        # In lazy mode, table bodies are only parsed when first needed
+        self._lazy = lazy
+        # Headers of the input, scanned on first use by lazy tables,
+        # along with the index of the header ending the body of each table.
+        # Parsers of lazy table bodies share the headers of the whole input,
+        # which starts _header_offset characters before their own.
+        self._headers = None  # type: Optional[List[Header]]
+        self._header_starts = None  # type: Optional[List[int]]
+        self._header_ends = None  # type: Optional[List[int]]
+        self._header_offset = 0
+        # Offset of the last lazy table body and number of lines preceding it,
+        # bodies being skipped in order
+        self._lazy_line = 0, line_offset
+
+        # Next table header, scanned ahead of being parsed
+        self._lookahead = None  # type: Optional[Tuple[int, bool, str, int]]
+
+        # Strings and types of the keys of the table names already split
+        self._table_names = {}  # type: Dict[str, Tuple[Tuple[str], Tuple[KeyType]]]
+
     @property
     def _state(self):
         return self._src.state
@@ -108,6 +207,12 @@ class Parser:
         """
         return self._src.consume(chars=chars, min=min, max=max)
 
+    def scan(self, pattern):  # type: (Pattern) -> Optional[Match]
+        """
+        Consumes the text matching the given pattern at the current position.
+        """
+        return self._src.scan(pattern)
+
     def end(self):  # type: () -> bool
         """
         Returns True if the parser has reached the end of the input.
@@ -126,9 +231,119 @@ class Parser:
         """
         return self._src.parse_error(exception, *args)
 
-    def parse(self):  # type: () -> TOMLDocument
+    def parse(self, workers=None):  # type: (Optional[int]) -> TOMLDocument
+        if workers is not None and workers > 1 and not self._lazy:
+            body = self._parse_parallel(workers)
+            if body is not None:
+                return body
+
         body = TOMLDocument(True)
+        self._parse_into(body)
+        body.parsing(False)
+
+        return body
+
+    def _parse_parallel(self, workers):  # type: (int) -> Optional[TOMLDocument]
+        """
+        Parses the input in a pool of processes, split in chunks
+        starting with top-level tables, and merges the results in order.
+
+        Returns None if the input can not be split or if one
+        of the chunks is invalid, in which case it must be parsed as a whole.
+        """
+        headers, _ = scan_headers(self._src)
+
+        # A few chunks per worker, of roughly the same size
+        size = len(self._src) // (workers * 4) + 1
+        starts = [0]
+        for header in _unit_headers(headers):
+            if header.start - starts[-1] >= size:
+                starts.append(header.start)
+
+        if len(starts) < 2:
+            return None
+
+        starts.append(len(self._src))
+        line = self._src.linecol(0)[0] - 1
+        chunks = []
+        for i, (start, end) in enumerate(zip(starts, starts[1:])):
+            text = self._src[start:end]
+            chunks.append((text, line, i == 0))
+            line += text.count("\n")
+
+        pool = multiprocessing.Pool(workers)
+        try:
+            results = pool.map(_parse_chunk, chunks)
+        finally:
+            pool.close()
+            pool.join()
+
+        if any(result is None for result in results):
+            return None
+
+        # Appending the tables of every chunk to the document
+        # is what parsing the input as a whole would do.
+        body = results[0]
+        for tables in results[1:]:
+            for key, value in tables:
+                body.append(key, value)
+
+        body.parsing(False)
+
+        return body
+
+    def events(self, offset=0):  # type: (int) -> Generator[Event]
+        """
+        Yields an Event for each statement of the input, in order,
+        without building a document.
+
+        offset is added to the start and end of every event.
+        Only syntax errors are reported, errors that depend on the
+        structure of the document, like duplicate keys, are not.
+        """
+        while not self.end():
+            start = self._idx
+            item = self._parse_item()
+            if item is None:
+                # Found a table header
+                is_aot, name = self._parse_table_header()
+                self._parse_comment_trail()
+
+                type_ = EventType.AoTElement if is_aot else EventType.Table
+                key, value = Key(name, sep=""), None
+            else:
+                key, value = item
+                if isinstance(value, Whitespace):
+                    type_ = EventType.Whitespace
+                elif isinstance(value, Comment):
+                    type_ = EventType.Comment
+                else:
+                    type_ = EventType.KeyValue
+
+            yield Event(
+                type_,
+                offset + start,
+                offset + self._idx,
+                self._src[start : self._idx],
+                key=key,
+                item=value,
+            )
+
+    def _parse_into(self, body):  # type: (Container) -> None
+        """
+        Parses the whole input, appending its items and tables
+        to the given container.
+        """
+        self._parse_items(body)
 
+        for key, value in self._parse_tables():
+            body.append(key, value)
+
+    def _parse_items(self, body):  # type: (Container) -> None
+        """
+        Parses the items preceding the first table,
+        appending them to the given container.
+        """
         # Take all keyvals outside of tables/AoT's.
         while not self.end():
             # Break out if a table is found
@@ -149,6 +364,11 @@ class Parser:
 
             self.mark()
 
+    def _parse_tables(self):  # type: () -> Generator[Tuple[Key, Union[Table, AoT]]]
+        """
+        Parses the top-level tables found from the current position,
+        which must be the start of a table header.
+        """
         while not self.end():
             key, value = self._parse_table()
             if isinstance(value, Table) and value.is_aot_element():
@@ -156,11 +376,7 @@ class Parser:
                 # along with it.
                 value = self._parse_aot(value, key.key)
 
-            body.append(key, value)
-
-        body.parsing(False)
-
-        return body
+            yield key, value
 
     def _merge_ws(self, item, container):  # type: (Item, Container) -> bool
         """
@@ -189,56 +405,40 @@ class Parser:
         Returns whether a key is strictly a child of another key.
         AoT siblings are not considered children of one another.
         """
-        parent_parts = tuple(self._split_table_name(parent))
-        child_parts = tuple(self._split_table_name(child))
+        return _is_child_table(self._table_name(parent)[0], self._table_name(child)[0])
 
-        if parent_parts == child_parts:
-            return False
-
-        return parent_parts == child_parts[: len(parent_parts)]
-
-    def _split_table_name(self, name):  # type: (str) -> Generator[Key]
-        in_name = False
-        current = ""
-        t = KeyType.Bare
-        for c in name:
-            c = TOMLChar(c)
-
-            if c == ".":
-                if in_name:
-                    current += c
-                    continue
-
-                if not current:
-                    raise self.parse_error()
+    def _table_name(self, name):  # type: (str) -> Tuple[Tuple[str], Tuple[KeyType]]
+        """
+        Returns the strings and types of the keys making up a table name.
 
-                yield Key(current, t=t, sep="")
+        Each name is only split once per parse.
+        """
+        parts = self._table_names.get(name)
+        if parts is None:
+            if BARE_TABLE_NAME.match(name):
+                keys = tuple(name.split("."))
+                parts = keys, (KeyType.Bare,) * len(keys)
+            else:
+                keys = self._split_table_name(name)
+                parts = tuple(k.key for k in keys), tuple(k.t for k in keys)
 
-                current = ""
-                t = KeyType.Bare
-                continue
-            elif c in {"'", '"'}:
-                if in_name:
-                    if t == KeyType.Literal and c == '"':
-                        current += c
-                        continue
+            self._table_names[name] = parts
 
-                    if c != t.value:
-                        raise self.parse_error()
+        return parts
 
-                    in_name = False
-                else:
-                    in_name = True
-                    t = KeyType.Literal if c == "'" else KeyType.Basic
+    def _table_keys(self, name, start=0):  # type: (str, int) -> Tuple[Key]
+        """
+        Returns new keys making up a table name, from the given one.
+        """
+        keys, types = self._table_name(name)
 
-                continue
-            elif in_name or c.is_bare_key_char():
-                current += c
-            else:
-                raise self.parse_error()
+        return tuple(Key(k, t=t, sep="") for k, t in zip(keys[start:], types[start:]))
 
-        if current:
-            yield Key(current, t=t, sep="")
+    def _split_table_name(self, name):  # type: (str) -> Tuple[Key]
+        try:
+            return tuple(_split_table_name(name))
+        except ParseError:
+            raise self.parse_error()
 
     def _parse_item(self):  # type: () -> Optional[Tuple[Optional[Key], Item]]
         """
@@ -256,7 +456,8 @@ class Parser:
                     return None, Whitespace(self.extract())
                 elif c in " \t\r":
                     # Skip whitespace.
-                    if not self.inc():
+                    self.scan(BLANK)
+                    if self.end():
                         return None, Whitespace(self.extract())
                 elif c == "#":
                     # Found a comment, parse it
@@ -301,23 +502,21 @@ class Parser:
                 self.inc()  # Skip #
 
                 # The comment itself
-                while not self.end() and not self._current.is_nl() and self.inc():
-                    pass
+                self.scan(COMMENT)
 
                 comment = self.extract()
                 self.mark()
 
                 break
             elif c in " \t\r":
-                self.inc()
+                self.scan(BLANK)
             else:
                 raise self.parse_error(UnexpectedCharError, c)
 
             if self.end():
                 break
 
-        while self._current.is_spaces() and self.inc():
-            pass
+        self.scan(SPACES)
 
         if self._current == "\r":
             self.inc()
@@ -334,9 +533,7 @@ class Parser:
     def _parse_key_value(self, parse_comment=False):  # type: (bool) -> (Key, Item)
         # Leading indent
         self.mark()
-
-        while self._current.is_spaces() and self.inc():
-            pass
+        self.scan(SPACES)
 
         indent = self.extract()
 
@@ -346,15 +543,10 @@ class Parser:
             raise self.parse_error(EmptyKeyError)
 
         self.mark()
-
-        found_equals = self._current == "="
-        while self._current.is_kv_sep() and self.inc():
-            if self._current == "=":
-                if found_equals:
-                    raise self.parse_error(UnexpectedCharError, "=")
-                else:
-                    found_equals = True
-            pass
+        self.scan(KV_SEP)
+        if self._current == "=":
+            # Only one equal sign is allowed
+            raise self.parse_error(UnexpectedCharError, "=")
 
         key.sep = self.extract()
 
@@ -402,9 +594,7 @@ class Parser:
 
         self.inc()
         self.mark()
-
-        while self._current != quote_style and self.inc():
-            pass
+        self.scan(QUOTED_KEY[quote_style])
 
         key = self.extract()
 
@@ -426,8 +616,7 @@ class Parser:
         dotted = False
 
         self.mark()
-        while self._current.is_bare_key_char() and self.inc():
-            pass
+        self.scan(BARE_KEY)
 
         key = self.extract()
 
@@ -442,7 +631,7 @@ class Parser:
     def _handle_dotted_key(
         self, container, key, value
     ):  # type: (Container, Key, Any) -> None
-        names = tuple(self._split_table_name(key.key))
+        names = self._table_keys(key.key)
         name = names[0]
         name._dotted = True
         if name in container:
@@ -476,78 +665,71 @@ class Parser:
     def _parse_value(self):  # type: () -> Item
         """
         Attempts to parse a value at the current position.
+
+        The kind of value is decided from its first character alone.
         """
         self.mark()
         c = self._current
-        trivia = Trivia()
 
-        if c == StringType.SLB.value:
-            return self._parse_basic_string()
-        elif c == StringType.SLL.value:
-            return self._parse_literal_string()
-        elif c == BoolType.TRUE.value[0]:
-            return self._parse_true()
-        elif c == BoolType.FALSE.value[0]:
-            return self._parse_false()
-        elif c == "[":
-            return self._parse_array()
-        elif c == "{":
-            return self._parse_inline_table()
-        elif c in "+-" or self._peek(4) in {
-            "+inf",
-            "-inf",
-            "inf",
-            "+nan",
-            "-nan",
-            "nan",
-        }:
-            # Number
-            while self._current not in " \t\n\r#,]}" and self.inc():
-                pass
-
-            raw = self.extract()
-
-            item = self._parse_number(raw, trivia)
-            if item is not None:
-                return item
-
-            raise self.parse_error(InvalidNumberError)
-        elif c in string.digits:
-            # Integer, Float, Date, Time or DateTime
-            while self._current not in " \t\n\r#,]}" and self.inc():
-                pass
-
-            raw = self.extract()
-
-            m = RFC_3339_LOOSE.match(raw)
-            if m:
-                if m.group(1) and m.group(5):
-                    # datetime
-                    try:
-                        return DateTime(parse_rfc3339(raw), trivia, raw)
-                    except ValueError:
-                        raise self.parse_error(InvalidDateTimeError)
+        parse = _VALUE_PARSERS.get(c)
+        if parse is None:
+            raise self.parse_error(UnexpectedCharError, c)
 
-                if m.group(1):
-                    try:
-                        return Date(parse_rfc3339(raw), trivia, raw)
-                    except ValueError:
-                        raise self.parse_error(InvalidDateError)
+        return parse(self)
 
-                if m.group(5):
-                    try:
-                        return Time(parse_rfc3339(raw), trivia, raw)
-                    except ValueError:
-                        raise self.parse_error(InvalidTimeError)
+    def _parse_signed_number(self):  # type: () -> Item
+        self.scan(VALUE)
 
-            item = self._parse_number(raw, trivia)
-            if item is not None:
-                return item
+        item = self._parse_number(self.extract(), Trivia())
+        if item is not None:
+            return item
+
+        raise self.parse_error(InvalidNumberError)
+
+    def _parse_special_float(self):  # type: () -> Item
+        """
+        Parses inf or nan.
+        """
+        c = self._current
+        self.scan(VALUE)
+
+        raw = self.extract()
+        if raw not in {"inf", "nan"}:
+            self._src.seek(self._marker)
 
-            raise self.parse_error(InvalidNumberError)
-        else:
             raise self.parse_error(UnexpectedCharError, c)
 
+        return self._parse_number(raw, Trivia())
+
+    def _parse_digits(self):  # type: () -> Item
+        """
+        Parses an integer, a float, a date, a time or a datetime.
+        """
+        trivia = Trivia()
+        self.scan(VALUE)
+
+        raw = self.extract()
+
+        item = self._parse_number(raw, trivia)
+        if item is not None:
+            return item
+
+        m = RFC_3339.match(raw)
+        if m:
+            if m.group(1) and m.group(5):
+                cls, error = DateTime, InvalidDateTimeError
+            elif m.group(1):
+                cls, error = Date, InvalidDateError
+            else:
+                cls, error = Time, InvalidTimeError
+
+            try:
+                return cls(parse_rfc3339_match(m), trivia, raw)
+            except ValueError:
+                raise self.parse_error(error)
+
+        raise self.parse_error(InvalidNumberError)
+
     def _parse_true(self):
         return self._parse_bool(BoolType.TRUE)
 
@@ -593,13 +775,10 @@ class Parser:
                 continue
 
             # consume value
-            if not prev_value:
-                try:
-                    elems.append(self._parse_value())
-                    prev_value = True
-                    continue
-                except UnexpectedCharError:
-                    pass
+            if not prev_value and self._current in _VALUE_PARSERS:
+                elems.append(self._parse_value())
+                prev_value = True
+                continue
 
             # consume comma
             if prev_value and self._current == ",":
@@ -673,58 +852,20 @@ class Parser:
         return InlineTable(elems, Trivia())
 
     def _parse_number(self, raw, trivia):  # type: (str, Trivia) -> Optional[Item]
-        # Leading zeros are not allowed
-        sign = ""
-        if raw.startswith(("+", "-")):
-            sign = raw[0]
-            raw = raw[1:]
-
-        if (
-            len(raw) > 1
-            and raw.startswith("0")
-            and not raw.startswith(("0.", "0o", "0x", "0b"))
-        ):
+        value = _number(raw)
+        if value is None:
             return
 
-        if raw.startswith(("0o", "0x", "0b")) and sign:
-            return
+        if isinstance(value, float):
+            return Float(value, trivia, raw)
 
-        digits = "[0-9]"
-        base = 10
-        if raw.startswith("0b"):
-            digits = "[01]"
-            base = 2
-        elif raw.startswith("0o"):
-            digits = "[0-7]"
-            base = 8
-        elif raw.startswith("0x"):
-            digits = "[0-9a-f]"
-            base = 16
-
-        # Underscores should be surrounded by digits
-        clean = re.sub("(?i)(?<={})_(?={})".format(digits, digits), "", raw)
-
-        if "_" in clean:
-            return
-
-        if clean.endswith("."):
-            return
-
-        try:
-            return Integer(int(sign + clean, base), trivia, sign + raw)
-        except ValueError:
-            try:
-                return Float(float(sign + clean), trivia, sign + raw)
-            except ValueError:
-                return
+        return Integer(value, trivia, raw)
 
     def _parse_literal_string(self):  # type: () -> String
-        with self._state:
-            return self._parse_string(StringType.SLL)
+        return self._parse_string(StringType.SLL)
 
     def _parse_basic_string(self):  # type: () -> String
-        with self._state:
-            return self._parse_string(StringType.SLB)
+        return self._parse_string(StringType.SLB)
 
     def _parse_escaped_char(self, multiline):
         if multiline and self._current.is_ws():
@@ -735,13 +876,10 @@ class Parser:
             # """\
             #     hello \
             #     world"""
-            tmp = ""
-            while self._current.is_ws():
-                tmp += self._current
-                # consume the whitespace, EOF here is an issue
-                # (middle of string)
-                self.inc(exception=UnexpectedEofError)
-                continue
+            tmp = self.scan(WHITESPACE).group()
+            if self.end():
+                # EOF here is an issue (middle of string)
+                raise self.parse_error(UnexpectedEofError)
 
             # the escape followed by whitespace must have a newline
             # before any other chars
@@ -796,7 +934,8 @@ class Parser:
             delim = delim.toggle()  # convert delim to multi delim
 
         self.mark()  # to extract the original string with whitespace and all
-        value = ""
+        value = []
+        chars = STRING_CHARS[delim]
 
         # A newline immediately following the opening delimiter will be trimmed.
         if delim.is_multiline() and self._current == "\n":
@@ -820,7 +959,7 @@ class Parser:
                         if self._current != delim.unit:
                             # Not a triple quote, leave in result as-is.
                             # Adding back the characters we already consumed
-                            value += close
+                            value.append(close)
                             close = ""  # clear the close
                             break
 
@@ -837,11 +976,11 @@ class Parser:
                     # that would simply imply the end of self._src
                     self.inc()
 
-                return String(delim, value, original, Trivia())
+                return String(delim, "".join(value), original, Trivia())
             elif delim.is_basic() and escaped:
                 # attempt to parse the current char as an escaped value, an exception
                 # is raised if this fails
-                value += self._parse_escaped_char(delim.is_multiline())
+                value.append(self._parse_escaped_char(delim.is_multiline()))
 
                 # no longer escaped
                 escaped = False
@@ -853,11 +992,13 @@ class Parser:
                 self.inc(exception=UnexpectedEofError)
             else:
                 # this is either a literal string where we keep everything as is,
-                # or this is not a special escaped char in a basic string
-                value += self._current
+                # or this is not a special escaped char in a basic string:
+                # the whole run of such characters is consumed at once.
+                value.append(self.scan(chars).group())
 
-                # consume this char, EOF here is an issue (middle of string)
-                self.inc(exception=UnexpectedEofError)
+                if self.end():
+                    # EOF here is an issue (middle of string)
+                    raise self.parse_error(UnexpectedEofError)
 
     def _parse_table(
         self, parent_name=None
@@ -865,102 +1006,177 @@ class Parser:
         """
         Parses a table element.
         """
-        if self._current != "[":
-            raise self.parse_error(
-                InternalParserError, "_parse_table() called on non-bracket character."
-            )
+        return self._parse_open(self._open_table(parent_name))
 
+    def _open_table(self, parent_name=None):  # type: (Optional[str]) -> _OpenTable
+        """
+        Parses the header of a table element, creating the missing
+        super tables, and returns the table whose body comes next.
+        """
         indent = self.extract()
-        self.inc()  # Skip opening bracket
-
-        if self.end():
-            raise self.parse_error(UnexpectedEofError)
-
-        is_aot = False
-        if self._current == "[":
-            if not self.inc():
-                raise self.parse_error(UnexpectedEofError)
-
-            is_aot = True
-
-        # Key
-        self.mark()
-        while self._current != "]" and self.inc():
-            if self.end():
-                raise self.parse_error(UnexpectedEofError)
-
-            pass
+        is_aot, name = self._parse_table_header()
+        cws, comment, trail = self._parse_comment_trail()
 
-        name = self.extract()
-        if not name.strip():
-            raise self.parse_error(EmptyTableNameError)
+        if self._lazy:
+            values = self._lazy_body(name)
+        else:
+            values = Container(True)
 
-        key = Key(name, sep="")
-        name_parts = tuple(self._split_table_name(name))
+        name_parts, _ = self._table_name(name)
         missing_table = False
         if parent_name:
-            parent_name_parts = tuple(self._split_table_name(parent_name))
+            parent_name_parts, _ = self._table_name(parent_name)
         else:
             parent_name_parts = tuple()
 
         if len(name_parts) > len(parent_name_parts) + 1:
             missing_table = True
 
-        name_parts = name_parts[len(parent_name_parts) :]
+        name_parts = self._table_keys(name, len(parent_name_parts))
+        if name_parts:
+            key = name_parts[0]
+        else:
+            key = Key(name, sep="")
 
-        values = Container(True)
+        result = Null()
 
-        self.inc()  # Skip closing bracket
-        if is_aot:
-            # TODO: Verify close bracket
-            self.inc()
+        if len(name_parts) > 1 and missing_table:
+            # Missing super table
+            # i.e. a table initialized like this: [foo.bar]
+            # without initializing [foo]
+            #
+            # So we have to create the parent tables
+            table = Table(
+                Container(True),
+                Trivia(indent, cws, comment, trail),
+                is_aot and name_parts[0].key in self._aot_stack,
+                is_super_table=True,
+                name=name_parts[0].key,
+            )
 
-        cws, comment, trail = self._parse_comment_trail()
+            result = table
 
-        result = Null()
+            for i, _name in enumerate(name_parts[1:]):
+                last = i == len(name_parts[1:]) - 1
+                if _name in table:
+                    child = table[_name]
+                else:
+                    child = Table(
+                        values if last else Container(True),
+                        Trivia(indent, cws, comment, trail),
+                        is_aot and last,
+                        is_super_table=not last,
+                        name=_name.key,
+                        display_name=name if last else None,
+                    )
 
-        if len(name_parts) > 1:
-            if missing_table:
-                # Missing super table
-                # i.e. a table initialized like this: [foo.bar]
-                # without initializing [foo]
-                #
-                # So we have to create the parent tables
-                table = Table(
-                    Container(True),
-                    Trivia(indent, cws, comment, trail),
-                    is_aot and name_parts[0].key in self._aot_stack,
-                    is_super_table=True,
-                    name=name_parts[0].key,
-                )
+                if is_aot and last:
+                    table.append(_name, AoT([child], name=table.name, parsed=True))
+                else:
+                    table.append(_name, child)
 
-                result = table
-                key = name_parts[0]
+                table = child
 
-                for i, _name in enumerate(name_parts[1:]):
-                    if _name in table:
-                        child = table[_name]
-                    else:
-                        child = Table(
-                            Container(True),
-                            Trivia(indent, cws, comment, trail),
-                            is_aot and i == len(name_parts[1:]) - 1,
-                            is_super_table=i < len(name_parts[1:]) - 1,
-                            name=_name.key,
-                            display_name=name if i == len(name_parts[1:]) - 1 else None,
-                        )
-
-                    if is_aot and i == len(name_parts[1:]) - 1:
-                        table.append(_name, AoT([child], name=table.name, parsed=True))
-                    else:
-                        table.append(_name, child)
+        table = _OpenTable(
+            name, values, key, result, is_aot, (indent, cws, comment, trail)
+        )
+        # Lazy bodies are parsed on their own, along with their child tables
+        table.items_parsed = table.children_parsed = self._lazy
 
-                    table = child
-                    values = table.value
-        else:
-            if name_parts:
-                key = name_parts[0]
+        return table
 
+    def _close_table(
+        self, table
+    ):  # type: (_OpenTable) -> Union[Tuple[Key, Union[Table, AoT]], _OpenAoT]
+        """
+        Returns the key and item of a table whose body has been parsed,
+        or the AoT it starts if it is the first element of one.
+        """
+        result = table.result
+        if isinstance(result, Null):
+            result = Table(
+                table.values,
+                Trivia(*table.trivia),
+                table.is_aot,
+                name=table.name,
+                display_name=table.name,
+            )
+
+            if table.is_aot and (
+                not self._aot_stack or table.name != self._aot_stack[-1]
+            ):
+                self._aot_stack.append(table.name)
+
+                return _OpenAoT(table.key, table.name, result)
+
+        return table.key, result
+
+    def _parse_table_body(self, name, values):  # type: (str, Container) -> None
+        """
+        Parses the items and child tables of the table with the given name,
+        appending them to the given container.
+        """
+        self._parse_open(_OpenTable(name, values))
+
+    def _parse_open(
+        self, opened
+    ):  # type: (Union[_OpenTable, _OpenAoT]) -> Optional[Tuple[Key, Item]]
+        """
+        Parses the rest of an open table or AoT, along with all the tables
+        nested in it, and returns its key and item once it is closed.
+
+        Nested tables are kept on a stack of open ones rather than parsed
+        recursively, so that the depth of a document is not limited.
+        """
+        stack = [opened]
+        while True:
+            opened = stack[-1]
+            if isinstance(opened, _OpenAoT):
+                if not self.end():
+                    is_aot_next, name_next = self._peek_table()
+                    if is_aot_next and name_next == opened.name:
+                        stack.append(self._open_table(opened.name))
+                        continue
+
+                self._aot_stack.pop()
+                closed = opened.key, AoT(opened.payload, parsed=True)
+            else:
+                if not opened.items_parsed:
+                    self._parse_table_items(opened.values)
+                    opened.items_parsed = True
+
+                if (
+                    not opened.children_parsed
+                    and not self.end()
+                    and self._is_child(opened.name, self._peek_table()[1])
+                ):
+                    # Picking up the child table, and then any sibling
+                    stack.append(self._open_table(opened.name))
+                    continue
+
+                if opened.key is None:
+                    # Only the body was parsed
+                    closed = None
+                else:
+                    closed = self._close_table(opened)
+                    if isinstance(closed, _OpenAoT):
+                        stack[-1] = closed
+                        continue
+
+            stack.pop()
+            if not stack:
+                return closed
+
+            parent = stack[-1]
+            if isinstance(parent, _OpenAoT):
+                parent.payload.append(closed[1])
+            else:
+                parent.values.append(*closed)
+
+    def _parse_table_items(self, values):  # type: (Container) -> None
+        """
+        Parses the items of a table, up to the next table header.
+        """
         while not self.end():
             item = self._parse_item()
             if item:
@@ -970,113 +1186,179 @@ class Parser:
                         self._handle_dotted_key(values, _key, item)
                     else:
                         values.append(_key, item)
+            elif self._current == "[":
+                break
             else:
-                if self._current == "[":
-                    is_aot_next, name_next = self._peek_table()
+                raise self.parse_error(
+                    InternalParserError,
+                    "_parse_item() returned None on a non-bracket character.",
+                )
 
-                    if self._is_child(name, name_next):
-                        key_next, table_next = self._parse_table(name)
+    def _lazy_body(self, name):  # type: (str) -> LazyContainer
+        """
+        Skips the body of the table with the given name and returns
+        a container that will parse it the first time it is needed.
+        """
+        start = self._idx
+        end = self._table_body_end(name)
+        raw = self._src[start:end]
+        last, line_offset = self._lazy_line
+        if start < last:
+            line_offset = self._src.linecol(start)[0] - 1
+        else:
+            line_offset += self._src.count("\n", last, start)
 
-                        values.append(key_next, table_next)
+        self._lazy_line = start, line_offset
+        headers = self._headers, self._header_starts, self._header_ends
+        header_offset = self._header_offset + start
 
-                        # Picking up any sibling
-                        while not self.end():
-                            _, name_next = self._peek_table()
+        def load(container):  # type: (Container) -> None
+            parser = Parser(raw, line_offset=line_offset, lazy=True)
+            # The headers of the body have been scanned along with these ones
+            parser._headers, parser._header_starts, parser._header_ends = headers
+            parser._header_offset = header_offset
+            parser._parse_table_body(name, container)
 
-                            if not self._is_child(name, name_next):
-                                break
+        # Moving to the next table header, past its indentation,
+        # as if the body had been parsed.
+        self._src.seek(end)
+        self.scan(BLANK)
 
-                            key_next, table_next = self._parse_table(name)
+        return LazyContainer(raw, load)
 
-                            values.append(key_next, table_next)
+    def _table_body_end(self, name):  # type: (str) -> int
+        """
+        Returns the offset at which the body of the table
+        with the given name, starting at the current position, ends.
+        """
+        if self._headers is None:
+            self._scan_headers()
+
+        headers = self._headers
+        offset = self._header_offset
+        i = bisect_left(self._header_starts, self._idx + offset)
+        if i and headers[i - 1].name == name:
+            # The header of the table itself
+            end = self._header_ends[i - 1]
+        else:
+            end = i
+            while end < len(headers) and self._is_nested(name, headers[end].name):
+                end += 1
 
-                    break
-                else:
-                    raise self.parse_error(
-                        InternalParserError,
-                        "_parse_item() returned None on a non-bracket character.",
-                    )
+        if end < len(headers):
+            return min(headers[end].start - offset, len(self._src))
 
-        if isinstance(result, Null):
-            result = Table(
-                values,
-                Trivia(indent, cws, comment, trail),
-                is_aot,
-                name=name,
-                display_name=name,
+        return len(self._src)
+
+    def _scan_headers(self):  # type: () -> None
+        """
+        Scans the headers of the input and finds the end of the body
+        of each table, in a single pass over them.
+        """
+        headers, _ = scan_headers(self._src)
+        ends = [len(headers)] * len(headers)
+        # Headers whose body is still open, the innermost last
+        stack = []  # type: List[int]
+        for i, header in enumerate(headers):
+            while stack and not self._is_nested(headers[stack[-1]].name, header.name):
+                ends[stack.pop()] = i
+
+            stack.append(i)
+
+        self._headers = headers
+        self._header_starts = [header.start for header in headers]
+        self._header_ends = ends
+
+    def _is_nested(self, parent, child):  # type: (str, str) -> bool
+        """
+        Returns whether the table with the name child
+        is part of the body of the table with the name parent.
+        """
+        try:
+            return self._is_child(parent, child)
+        except ParseError:
+            # Invalid names are reported when the table itself is parsed
+            return False
+
+    def _parse_table_header(self):  # type: () -> Tuple[bool, str]
+        """
+        Parses the brackets and name of a table header.
+
+        Returns whether the table is an AoT element and its raw name.
+        """
+        if self._current != "[":
+            raise self.parse_error(
+                InternalParserError, "_parse_table() called on non-bracket character."
             )
 
-            if is_aot and (not self._aot_stack or name != self._aot_stack[-1]):
-                result = self._parse_aot(result, name)
+        _, is_aot, name, end = self._next_table_header()
+
+        self.inc()  # Skip opening bracket
+
+        if self.end():
+            raise self.parse_error(UnexpectedEofError)
+
+        if is_aot and not self.inc():
+            raise self.parse_error(UnexpectedEofError)
+
+        # Key
+        self._src.seek(end)
+
+        if not name.strip():
+            raise self.parse_error(EmptyTableNameError)
 
-        return key, result
+        # Invalid names are reported here
+        self._table_name(name)
+
+        self.inc()  # Skip closing bracket
+        if is_aot:
+            # TODO: Verify close bracket
+            self.inc()
+
+        return is_aot, name
 
     def _peek_table(self):  # type: () -> Tuple[bool, str]
         """
-        Peeks ahead non-intrusively by cloning then restoring the
-        initial state of the parser.
-
         Returns the name of the table about to be parsed,
         as well as whether it is part of an AoT.
         """
-        # we always want to restore after exiting this scope
-        with self._state(save_marker=True, restore=True):
-            if self._current != "[":
-                raise self.parse_error(
-                    InternalParserError,
-                    "_peek_table() entered on non-bracket character",
-                )
+        if self._current != "[":
+            raise self.parse_error(
+                InternalParserError, "_peek_table() entered on non-bracket character"
+            )
 
-            # AoT
-            self.inc()
-            is_aot = False
-            if self._current == "[":
-                self.inc()
-                is_aot = True
+        _, is_aot, name, _ = self._next_table_header()
 
-            self.mark()
+        return is_aot, name
+
+    def _next_table_header(self):  # type: () -> Tuple[int, bool, str, int]
+        """
+        Returns the table header starting at the current position:
+        its start, whether it is an AoT element, its raw name and its end.
 
-            while self._current != "]" and self.inc():
-                table_name = self.extract()
+        The header is only scanned once, being kept as the lookahead
+        of the parser until it is parsed.
+        """
+        header = self._lookahead
+        if header is None or header[0] != self._idx:
+            m = TABLE_HEADER.match(self._src, self._idx)
+            header = self._lookahead = (
+                self._idx,
+                m.group(1) is not None,
+                m.group(2),
+                m.end(),
+            )
 
-            return is_aot, table_name
+        return header
 
     def _parse_aot(self, first, name_first):  # type: (Table, str) -> AoT
         """
         Parses all siblings of the provided table first and bundles them into
         an AoT.
         """
-        payload = [first]
         self._aot_stack.append(name_first)
-        while not self.end():
-            is_aot_next, name_next = self._peek_table()
-            if is_aot_next and name_next == name_first:
-                _, table = self._parse_table(name_first)
-                payload.append(table)
-            else:
-                break
-
-        self._aot_stack.pop()
 
-        return AoT(payload, parsed=True)
-
-    def _peek(self, n):  # type: (int) -> str
-        """
-        Peeks ahead n characters.
-
-        n is the max number of characters that will be peeked.
-        """
-        # we always want to restore after exiting this scope
-        with self._state(restore=True):
-            buf = ""
-            for _ in range(n):
-                if self._current not in " \t\n\r#,]}":
-                    buf += self._current
-                    self.inc()
-                    continue
-
-                break
-            return buf
+        return self._parse_open(_OpenAoT(None, name_first, first))[1]
 
     def _peek_unicode(
         self, is_long
@@ -1116,3 +1398,735 @@ class Parser:
                     value = None
 
             return value, extracted
+
+
+class _OpenTable(object):
+    """
+    A table being parsed, along with its child tables.
+    """
+
+    def __init__(
+        self, name, values, key=None, result=None, is_aot=False, trivia=None
+    ):  # type: (str, Container, Optional[Key], Optional[Item], bool, Optional[Tuple[str, str, str, str]]) -> None
+        self.name = name
+        self.values = values
+        self.key = key
+        self.result = result
+        self.is_aot = is_aot
+        self.trivia = trivia
+
+        # Whether its items, and then its child tables, were parsed
+        self.items_parsed = False
+        self.children_parsed = False
+
+
+class _OpenAoT(object):
+    """
+    An array of tables whose elements are being parsed.
+    """
+
+    def __init__(self, key, name, first):  # type: (Key, str, Table) -> None
+        self.key = key
+        self.name = name
+        self.payload = [first]
+
+
+# Parser of each kind of value, by first character
+_VALUE_PARSERS = {
+    StringType.SLB.value: Parser._parse_basic_string,
+    StringType.SLL.value: Parser._parse_literal_string,
+    BoolType.TRUE.value[0]: Parser._parse_true,
+    BoolType.FALSE.value[0]: Parser._parse_false,
+    "[": Parser._parse_array,
+    "{": Parser._parse_inline_table,
+    "+": Parser._parse_signed_number,
+    "-": Parser._parse_signed_number,
+    "i": Parser._parse_special_float,
+    "n": Parser._parse_special_float,
+}
+for _c in string.digits:
+    _VALUE_PARSERS[_c] = Parser._parse_digits
+
+
+class _Unsupported(Exception):
+    """
+    Raised by PlainParser on input it leaves to Parser.
+    """
+
+
+class PlainParser(Parser):
+    """
+    Parser building plain Python objects instead of a TOMLDocument.
+
+    Common statements are read directly, without keeping any trivia.
+    On anything else, including invalid input, the whole document
+    is parsed by Parser instead, so that both always return
+    the same values and raise the same errors.
+    """
+
+    def __init__(self, string):  # type: (Union[str, bytes]) -> None
+        Parser.__init__(self, string)
+
+        # Tables defined by a header, the parents created along with them,
+        # the tables created by dotted keys and the arrays of tables, by id.
+        self._explicit = set()
+        self._implicit = set()
+        self._dotted = set()
+        self._aots = set()
+
+    def parse(self):  # type: () -> Dict[str, Any]
+        try:
+            return self._parse_plain()
+        except (_Unsupported, ParseError):
+            return _plain(Parser(self._src).parse().value)
+
+    def _parse_plain(self):  # type: () -> Dict[str, Any]
+        src = self._src
+        end = len(src)
+        root = {}
+        table = root
+        # Keys of the last table header
+        # and top-level tables whose definition is over.
+        path = []
+        closed = set()
+
+        pos = 0
+        while pos < end:
+            m = PLAIN_TRAIL.match(src, pos)
+            if m is not None:
+                # Blank line or comment
+                pos = m.end()
+
+                continue
+
+            m = PLAIN_HEADER.match(src, pos)
+            if m is not None:
+                if (m.group(1) is None) != (m.group(3) is None):
+                    raise _Unsupported()
+
+                keys = m.group(2).split(".")
+                if path and keys[0] != path[0]:
+                    closed.add(path[0])
+
+                if keys[0] in closed:
+                    raise _Unsupported()
+
+                table = self._plain_table(root, keys, m.group(1) is not None, path)
+                path = keys
+                pos = m.end()
+
+                continue
+
+            m = PLAIN_KEY_VALUE.match(src, pos)
+            if m is None:
+                raise _Unsupported()
+
+            keys = self._plain_keys(m.group(1))
+            value, pos = self._plain_value(m.end())
+
+            m = PLAIN_TRAIL.match(src, pos)
+            if m is None:
+                raise _Unsupported()
+
+            pos = m.end()
+
+            container = table
+            for key in keys[:-1]:
+                child = container.get(key)
+                if child is None:
+                    child = container[key] = {}
+                    self._dotted.add(id(child))
+                elif id(child) not in self._dotted:
+                    raise _Unsupported()
+
+                container = child
+
+            if keys[-1] in container:
+                raise _Unsupported()
+
+            container[keys[-1]] = value
+
+        return root
+
+    def _plain_table(
+        self, root, keys, is_aot, path
+    ):  # type: (Dict[str, Any], List[str], bool, List[str]) -> Dict[str, Any]
+        """
+        Returns the table defined by the header with the given keys,
+        creating it along with its missing parents.
+
+        path holds the keys of the previous header.
+        """
+        container = root
+        for i, key in enumerate(keys[:-1]):
+            child = container.get(key)
+            if child is None:
+                child = container[key] = {}
+                self._implicit.add(id(child))
+            elif id(child) in self._aots:
+                # Only the last element of the array of tables being defined
+                if path[: i + 1] != keys[: i + 1]:
+                    raise _Unsupported()
+
+                child = child[-1]
+            elif id(child) not in self._explicit and id(child) not in self._implicit:
+                raise _Unsupported()
+
+            container = child
+
+        key = keys[-1]
+        child = container.get(key)
+        table = {}
+        if is_aot:
+            if child is None:
+                child = container[key] = []
+                self._aots.add(id(child))
+            elif id(child) not in self._aots or path[: len(keys)] != keys:
+                raise _Unsupported()
+
+            child.append(table)
+        elif child is None:
+            container[key] = table
+        else:
+            # Parser does not always keep the content of tables
+            # defined after their children.
+            raise _Unsupported()
+
+        self._explicit.add(id(table))
+
+        return table
+
+    def _plain_keys(self, raw):  # type: (str) -> List[str]
+        """
+        Returns the keys making up the given, possibly dotted, key.
+        """
+        keys = raw.split(".")
+        for i, key in enumerate(keys):
+            if key[0] in "\"'":
+                key = keys[i] = key[1:-1]
+                if not key.strip():
+                    raise _Unsupported()
+
+        return keys
+
+    def _plain_value(self, pos):  # type: (int) -> Tuple[Any, int]
+        """
+        Returns the value starting at the given position
+        along with the position following it.
+        """
+        src = self._src
+        c = src[pos : pos + 1]
+        if c == '"' or c == "'":
+            if src.startswith(c * 3, pos):
+                close = src.find(c * 3, pos + 3)
+                if close != -1 and src[close + 3 : close + 4] != c:
+                    value = src[pos + 3 : close]
+                    if c == "'" or "\\" not in value:
+                        if value[:1] == "\n":
+                            # Trimmed newline following the opening delimiter
+                            value = value[1:]
+
+                        return value, close + 3
+            else:
+                m = (PLAIN_BASIC if c == '"' else PLAIN_LITERAL).match(src, pos)
+                if m is not None:
+                    return m.group(1), m.end()
+
+            # Escape sequences, among others
+            self._src.seek(pos)
+            if c == '"':
+                value = self._parse_basic_string()
+            else:
+                value = self._parse_literal_string()
+
+            return unicode(value), self._idx
+        elif c == "t" and src.startswith("true", pos):
+            return True, pos + 4
+        elif c == "f" and src.startswith("false", pos):
+            return False, pos + 5
+        elif c == "[":
+            return self._plain_array(pos)
+        elif c == "{":
+            return self._plain_inline_table(pos)
+        elif c and c in "+-0123456789":
+            m = VALUE.match(src, pos)
+            raw = m.group()
+            value = _number(raw)
+            if value is not None:
+                return value, m.end()
+
+            if c not in "+-":
+                m_date = RFC_3339.match(raw)
+                if m_date:
+                    try:
+                        return parse_rfc3339_match(m_date), m.end()
+                    except ValueError:
+                        pass
+
+            raise _Unsupported()
+
+        raise _Unsupported()
+
+    def _plain_array(self, pos):  # type: (int) -> Tuple[List[Any], int]
+        src = self._src
+        values = []
+        pos = PLAIN_ARRAY_WS.match(src, pos + 1).end()
+        while src[pos : pos + 1] != "]":
+            value, pos = self._plain_value(pos)
+            values.append(value)
+
+            pos = PLAIN_ARRAY_WS.match(src, pos).end()
+            c = src[pos : pos + 1]
+            if c == ",":
+                pos = PLAIN_ARRAY_WS.match(src, pos + 1).end()
+            elif c != "]":
+                raise _Unsupported()
+
+        if len(set(type(value) for value in values)) > 1:
+            # Mixed types
+            raise _Unsupported()
+
+        return values, pos + 1
+
+    def _plain_inline_table(self, pos):  # type: (int) -> Tuple[Dict[str, Any], int]
+        src = self._src
+        table = {}
+        pos = PLAIN_SPACES.match(src, pos + 1).end()
+        if src[pos : pos + 1] == "}":
+            return table, pos + 1
+
+        while True:
+            m = PLAIN_INLINE_KEY.match(src, pos)
+            if m is None:
+                raise _Unsupported()
+
+            key = self._plain_keys(m.group(1))[0]
+            if key in table:
+                raise _Unsupported()
+
+            table[key], pos = self._plain_value(m.end())
+
+            pos = PLAIN_SPACES.match(src, pos).end()
+            c = src[pos : pos + 1]
+            if c == "}":
+                return table, pos + 1
+
+            if c != ",":
+                raise _Unsupported()
+
+            pos += 1
+
+
+def _number(raw):  # type: (str) -> Optional[Union[int, float]]
+    """
+    Returns the value of the given number literal, or None if it is not valid.
+    """
+    m = NUMBER.match(raw)
+    if m is None:
+        return
+
+    kind = m.lastgroup
+    clean = raw.replace("_", "")
+    if kind == "float":
+        return float(clean)
+
+    if kind == "int":
+        return int(clean)
+
+    return int(clean[2:], NUMBER_BASES[kind])
+
+
+def _plain(value):  # type: (Any) -> Any
+    """
+    Converts a value of a parsed document to plain Python objects.
+    """
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_plain(v) for v in value]
+    elif isinstance(value, bool):
+        return value
+    elif isinstance(value, unicode):
+        return unicode(value)
+    elif isinstance(value, (int, long)):
+        return int(value)
+    elif isinstance(value, float):
+        return float(value)
+    elif isinstance(value, datetime):
+        return datetime(
+            value.year,
+            value.month,
+            value.day,
+            value.hour,
+            value.minute,
+            value.second,
+            value.microsecond,
+            value.tzinfo,
+        )
+    elif isinstance(value, date):
+        return date(value.year, value.month, value.day)
+    elif isinstance(value, time):
+        return time(
+            value.hour, value.minute, value.second, value.microsecond, value.tzinfo
+        )
+
+    return value
+
+
+def _split_table_name(name):  # type: (str) -> Generator[Key]
+    """
+    Splits a table name into its keys.
+
+    Invalid names raise a ParseError at their offending character.
+    """
+    in_name = False
+    current = ""
+    t = KeyType.Bare
+    for i, c in enumerate(name):
+        c = toml_char(c)
+
+        if c == ".":
+            if in_name:
+                current += c
+                continue
+
+            if not current:
+                raise ParseError(1, i)
+
+            yield Key(current, t=t, sep="")
+
+            current = ""
+            t = KeyType.Bare
+            continue
+        elif c in {"'", '"'}:
+            if in_name:
+                if t == KeyType.Literal and c == '"':
+                    current += c
+                    continue
+
+                if c != t.value:
+                    raise ParseError(1, i)
+
+                in_name = False
+            else:
+                in_name = True
+                t = KeyType.Literal if c == "'" else KeyType.Basic
+
+            continue
+        elif in_name or c.is_bare_key_char():
+            current += c
+        else:
+            raise ParseError(1, i)
+
+    if current:
+        yield Key(current, t=t, sep="")
+
+
+def _table_name_keys(name):  # type: (str) -> Tuple[str]
+    """
+    Returns the strings of the keys making up a table name.
+    """
+    if BARE_TABLE_NAME.match(name):
+        return tuple(name.split("."))
+
+    return tuple(k.key for k in _split_table_name(name))
+
+
+def _is_child_table(parent, child):  # type: (Tuple[str], Tuple[str]) -> bool
+    """
+    Returns whether a table, given the keys of its name, is strictly
+    a child of another one. AoT siblings are not considered children
+    of one another.
+    """
+    return len(parent) < len(child) and parent == child[: len(parent)]
+
+
+def _unit_headers(
+    headers, root=None
+):  # type: (List[Header], Optional[Header]) -> List[Header]
+    """
+    Returns the headers, among the given ones, that start a top-level table
+    or a new element of a top-level array of tables. The input can be split
+    before any of them and its parts parsed on their own.
+
+    root is the header of the top-level table preceding the given headers, if any.
+    """
+    units = []
+    root_keys = None
+    for header in headers:
+        if root is None or (
+            # Next element of the same array of tables
+            header.is_aot
+            and root.is_aot
+            and header.name == root.name
+        ):
+            starts_unit = True
+        else:
+            try:
+                if root_keys is None:
+                    root_keys = _table_name_keys(root.name)
+
+                starts_unit = not _is_child_table(
+                    root_keys, _table_name_keys(header.name)
+                )
+            except ParseError:
+                # Invalid names are reported while parsing the table around them,
+                # splitting there would report them differently
+                starts_unit = False
+
+        if starts_unit:
+            units.append(header)
+            root = header
+            root_keys = None
+
+    return units
+
+
+def _parse_chunk(chunk):  # type: (Tuple[str, int, bool]) -> Any
+    """
+    Parses a chunk of a document in a worker process.
+
+    The first chunk is parsed into a document, the others,
+    which start with a top-level table, into a list of tables.
+    """
+    text, line_offset, first = chunk
+    parser = Parser(text, line_offset=line_offset)
+    try:
+        if first:
+            body = TOMLDocument(True)
+            parser._parse_into(body)
+
+            return body
+
+        parser.scan(BLANK)
+
+        return list(parser._parse_tables())
+    except TOMLKitError:
+        # Errors are reported by parsing the whole input again,
+        # with the exact same behavior as without workers.
+        return None
+
+
+class _StreamParser(object):
+    """
+    Base class of the parsers receiving their input in chunks.
+
+    Received text is buffered until the header scanner finds
+    a point at which it can be cut, everything before that point
+    is then handed to _parse_piece().
+    """
+
+    def __init__(self):  # type: () -> None
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._closed = False
+
+        # Text received but not parsed yet
+        self._chunks = []  # type: List[str]
+        self._size = 0
+        # Size of the buffered text when it was last scanned
+        self._scanned = 0
+        # Offset of the first statement of the buffer left to scan
+        self._scan_pos = 0
+        # Number of lines and characters already parsed
+        self._lines = 0
+        self._offset = 0
+
+    def feed(self, chunk):  # type: (Union[str, bytes]) -> None
+        """
+        Adds a chunk of the document, either as text or as UTF-8 encoded bytes.
+        """
+        if self._closed:
+            raise ValueError("Unable to feed a closed parser")
+
+        if not isinstance(chunk, unicode):
+            chunk = self._decode(chunk)
+
+        if chunk:
+            self._chunks.append(chunk)
+            self._size += len(chunk)
+
+        # Waiting for the buffer to double in size between two scans
+        # keeps the total work linear when a single piece is very large.
+        if self._size >= 2 * self._scanned:
+            self._process(False)
+
+    def _finish(self):  # type: () -> None
+        """
+        Parses what is left of the input.
+        """
+        tail = self._decode(b"", True)
+        if tail:
+            self._chunks.append(tail)
+
+        self._closed = True
+        self._process(True)
+
+    def _decode(self, data, final=False):  # type: (bytes, bool) -> str
+        try:
+            return self._decoder.decode(data, final)
+        except UnicodeDecodeError as e:
+            buffered = "".join(self._chunks)
+            prefix = e.object[: e.start].decode("utf-8", "replace")
+            line = self._lines + buffered.count("\n") + prefix.count("\n") + 1
+            if "\n" not in prefix:
+                prefix = buffered + prefix
+
+            raise InvalidEncodingError(line, len(prefix) - prefix.rfind("\n") - 1)
+
+    def _process(self, final):  # type: (bool) -> None
+        text = "".join(self._chunks)
+        headers, self._scan_pos = scan_headers(text, self._scan_pos, final)
+
+        cut = len(text) if final else self._cut(headers)
+        if cut:
+            self._parse_piece(text[:cut])
+            self._lines += text.count("\n", 0, cut)
+            self._offset += cut
+
+            text = text[cut:]
+
+        self._chunks = [text] if text else []
+        self._size = self._scanned = len(text)
+        self._scan_pos -= cut
+
+    def _cut(self, headers):  # type: (List[Header]) -> int
+        """
+        Returns the offset up to which the buffer can be parsed,
+        given the headers found by the last scan, or 0 to wait for more input.
+
+        Subclasses must implement it; the offset must not go past
+        the end of the last complete statement.
+        """
+        raise NotImplementedError()
+
+    def _parse_piece(self, text):  # type: (str) -> None
+        """
+        Parses a piece of the input cut by _cut(),
+        or the whole remaining input once the parser is closed.
+
+        Subclasses must implement it; self._lines and self._offset
+        give the position of the piece in the document.
+        """
+        raise NotImplementedError()
+
+
+class IncrementalParser(_StreamParser):
+    """
+    Parser for TOML documents received in chunks.
+
+    Chunks are given to feed() as they arrive and close() returns the same
+    TOMLDocument Parser.parse() would return for the whole input.
+    Top-level tables, and elements of top-level arrays of tables,
+    are parsed as soon as they are complete so that only the one
+    currently being received is kept in the buffer.
+    """
+
+    def __init__(self):  # type: () -> None
+        super(IncrementalParser, self).__init__()
+
+        self._doc = TOMLDocument(True)
+        # Header of the table currently being buffered
+        self._root = None  # type: Optional[Header]
+        # Headers of the first and last top-level tables of the piece being parsed
+        self._head = None  # type: Optional[Header]
+        self._tail = None  # type: Optional[Header]
+        # Array of tables ending the last piece, with its header,
+        # appended once it is known not to go on in the next piece
+        self._aot = None  # type: Optional[Tuple[Key, AoT, Header]]
+
+    def close(self):  # type: () -> TOMLDocument
+        """
+        Parses what is left of the input and returns the document.
+        """
+        if not self._closed:
+            self._head = self._tail = self._root
+            self._finish()
+            if self._aot is not None:
+                self._doc.append(*self._aot[:2])
+                self._aot = None
+
+            self._doc.parsing(False)
+
+        return self._doc
+
+    def _cut(self, headers):  # type: (List[Header]) -> int
+        units = _unit_headers(headers, self._root)
+        if not units:
+            return 0
+
+        self._head = self._root
+        self._tail = units[-2] if len(units) > 1 else self._root
+        self._root = units[-1]
+
+        return self._root.start
+
+    def _parse_piece(self, text):  # type: (str) -> None
+        # Parser.parse() appends arrays of tables once they are complete,
+        # after reporting the errors found in any of their tables
+        # but before parsing the following table.
+        aot = None
+        if self._aot is not None:
+            key, aot, header = self._aot
+            self._aot = None
+            if not (
+                self._head is not None
+                and self._head.is_aot
+                and header.is_aot
+                and self._head.name == header.name
+            ):
+                self._doc.append(key, aot)
+                aot = None
+
+        parser = Parser(text, line_offset=self._lines)
+        parser._parse_items(self._doc)
+
+        for key, value in parser._parse_tables():
+            if aot is not None:
+                # The next elements of the array of tables ending the last piece
+                for table in value.body:
+                    aot.append(table)
+
+                value, aot = aot, None
+
+            if isinstance(value, AoT) and parser.end() and self._tail is not None:
+                self._aot = key, value, self._tail
+            else:
+                self._doc.append(key, value)
+
+
+class EventParser(_StreamParser):
+    """
+    Event parser for TOML documents received in chunks.
+
+    Chunks are given to feed() as they arrive and the events
+    of every statement they complete are returned by read_events().
+    """
+
+    def __init__(self):  # type: () -> None
+        super(EventParser, self).__init__()
+
+        self._events = []  # type: List[Event]
+
+    def read_events(self):  # type: () -> List[Event]
+        """
+        Returns the events parsed since the last call.
+        """
+        events, self._events = self._events, []
+
+        return events
+
+    def close(self):  # type: () -> None
+        """
+        Parses what is left of the input.
+        Its events are available through read_events().
+        """
+        if not self._closed:
+            self._finish()
+
+    def _cut(self, headers):  # type: (List[Header]) -> int
+        # Every statement scanned so far is complete
+        return self._scan_pos
+
+    def _parse_piece(self, text):  # type: (str) -> None
+        parser = Parser(text, line_offset=self._lines)
+        self._events.extend(parser.events(self._offset))
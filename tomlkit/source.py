@@ -1,18 +1,107 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-import itertools
+import codecs
 
-from copy import copy
+from bisect import bisect_right
+from typing import List
+from typing import Match
 from typing import Optional
+from typing import Pattern
 from typing import Tuple
+from typing import Union
 
 from ._compat import PY2
 from ._compat import unicode
+from .exceptions import InvalidEncodingError
 from .exceptions import UnexpectedEofError
 from .exceptions import UnexpectedCharError
 from .exceptions import ParseError
 from .toml_char import TOMLChar
+from .toml_char import toml_char
+
+
+def decode_source(
+    data,
+):  # type: (Union[unicode, bytes, bytearray, memoryview]) -> unicode
+    """
+    Returns the text to parse from the given input.
+
+    Binary input must be UTF-8 encoded, with an optional BOM.
+    It is validated and decoded in a single strict pass.
+    """
+    if isinstance(data, unicode):
+        return data
+
+    view = memoryview(data)
+    start = 0
+    if view[:3].tobytes() == codecs.BOM_UTF8:
+        start = 3
+
+    body = view[start:]
+    try:
+        return codecs.utf_8_decode(body, "strict", True)[0]
+    except UnicodeDecodeError as e:
+        # Locating the error only needs the bytes before it
+        prefix = view[: start + e.start].tobytes()
+        line_start = prefix.rfind(b"\n") + 1
+        col = len(prefix[max(line_start, start) :].decode("utf-8"))
+
+        raise InvalidEncodingError(prefix.count(b"\n") + 1, col)
+    finally:
+        if not PY2:
+            body.release()
+            view.release()
+
+
+class LineIndex(object):
+    """
+    Maps offsets within a string to (line, column) pairs.
+
+    The start offset of every line is computed once,
+    each lookup is then a binary search over them.
+    """
+
+    def __init__(self, string):  # type: (unicode) -> None
+        starts = [0]
+        idx = string.find("\n")
+        while idx != -1:
+            starts.append(idx + 1)
+            idx = string.find("\n", idx + 1)
+
+        self._starts = starts  # type: List[int]
+
+    def __len__(self):  # type: () -> int
+        return len(self._starts)
+
+    def line_start(self, line):  # type: (int) -> int
+        """
+        Returns the offset at which the given (1-based) line starts.
+        """
+        return self._starts[line - 1]
+
+    def linecol(self, offset):  # type: (int) -> Tuple[int, int]
+        """
+        Returns the 1-based line and the 0-based column of the given offset.
+        """
+        line = bisect_right(self._starts, offset)
+
+        return line, offset - self._starts[line - 1]
+
+
+class Checkpoint(object):
+    """
+    A snapshot of the position of a Source.
+
+    It only holds the cursor index and the marker,
+    so taking and restoring one does not depend on the size of the input.
+    """
+
+    __slots__ = ("idx", "marker")
+
+    def __init__(self, idx, marker):  # type: (int, int) -> None
+        self.idx = idx
+        self.marker = marker
 
 
 class _State:
@@ -25,27 +114,14 @@ class _State:
 
     def __enter__(self):  # type: () -> None
         # Entering this context manager - save the state
-        if PY2:
-            # Python 2.7 does not allow to directly copy
-            # an iterator, so we have to make tees of the original
-            # chars iterator.
-            self._source._chars, self._chars = itertools.tee(self._source._chars)
-        else:
-            self._chars = copy(self._source._chars)
-        self._idx = self._source._idx
-        self._current = self._source._current
-        self._marker = self._source._marker
+        self._checkpoint = self._source.checkpoint()
 
         return self
 
     def __exit__(self, exception_type, exception_val, trace):
         # Exiting this context manager - restore the prior state
         if self.restore or exception_type:
-            self._source._chars = self._chars
-            self._source._idx = self._idx
-            self._source._current = self._current
-            if self._save_marker:
-                self._source._marker = self._marker
+            self._source.restore(self._checkpoint, marker=self._save_marker)
 
 
 class _StateHandler:
@@ -73,17 +149,25 @@ class _StateHandler:
 class Source(unicode):
     EOF = TOMLChar("\0")
 
-    def __init__(self, _):  # type: (unicode) -> None
+    def __new__(cls, string, line_offset=0):  # type: (unicode, int) -> Source
+        return super(Source, cls).__new__(cls, string)
+
+    def __init__(self, _, line_offset=0):  # type: (unicode, int) -> None
         super(Source, self).__init__()
 
-        # Collection of TOMLChars
-        self._chars = iter([(i, TOMLChar(c)) for i, c in enumerate(self)])
+        # Number of lines preceding this source
+        # when it is a fragment of a larger document.
+        self._line_offset = line_offset
 
-        self._idx = 0
+        # The cursor is a plain index into the source string,
+        # characters are only looked up as TOMLChars when they are reached.
+        # The first call to inc() moves the cursor to the first character.
+        self._idx = -1
         self._marker = 0
         self._current = TOMLChar("")
 
         self._state = _StateHandler(self)
+        self._line_index = None  # type: Optional[LineIndex]
 
         self.inc()
 
@@ -98,6 +182,16 @@ class Source(unicode):
     def state(self):  # type: () -> _StateHandler
         return self._state
 
+    @property
+    def line_index(self):  # type: () -> LineIndex
+        """
+        The line index of the source, built on first access.
+        """
+        if self._line_index is None:
+            self._line_index = LineIndex(self)
+
+        return self._line_index
+
     @property
     def idx(self):  # type: () -> int
         return self._idx
@@ -121,17 +215,13 @@ class Source(unicode):
         Increments the parser if the end of the input has not been reached.
         Returns whether or not it was able to advance.
         """
-        try:
-            self._idx, self._current = next(self._chars)
-
+        if self._seek(self._idx + 1):
             return True
-        except StopIteration:
-            self._idx = len(self)
-            self._current = self.EOF
-            if exception:
-                raise self.parse_error(exception)
 
-            return False
+        if exception:
+            raise self.parse_error(exception)
+
+        return False
 
     def inc_n(self, n, exception=None):  # type: (int, Exception) -> bool
         """
@@ -158,6 +248,42 @@ class Source(unicode):
         if min > 0:
             self.parse_error(UnexpectedCharError)
 
+    def checkpoint(self):  # type: () -> Checkpoint
+        """
+        Returns a snapshot of the current position
+        that can later be passed to restore().
+        """
+        return Checkpoint(self._idx, self._marker)
+
+    def restore(self, checkpoint, marker=True):  # type: (Checkpoint, bool) -> None
+        """
+        Moves back to the position saved in the given checkpoint.
+        The marker is restored as well unless marker is False.
+        """
+        self._seek(checkpoint.idx)
+        if marker:
+            self._marker = checkpoint.marker
+
+    def seek(self, idx):  # type: (int) -> None
+        """
+        Moves the cursor, and the marker along with it, to the given index.
+        """
+        self._seek(idx)
+        self._marker = self._idx
+
+    def scan(self, pattern):  # type: (Pattern) -> Optional[Match]
+        """
+        Matches the given compiled pattern at the current position
+        and moves past the matched text in a single step.
+
+        Returns the match, or None if the pattern does not match here.
+        """
+        m = pattern.match(self, self._idx)
+        if m is not None and m.end() != self._idx:
+            self._seek(m.end())
+
+        return m
+
     def end(self):  # type: () -> bool
         """
         Returns True if the parser has reached the end of the input.
@@ -170,6 +296,22 @@ class Source(unicode):
         """
         self._marker = self._idx
 
+    def _seek(self, idx):  # type: (int) -> bool
+        """
+        Moves the cursor to the given index.
+        Returns False if it is past the end of the input.
+        """
+        if idx < len(self):
+            self._idx = idx
+            self._current = toml_char(self[idx])
+
+            return True
+
+        self._idx = len(self)
+        self._current = self.EOF
+
+        return False
+
     def parse_error(
         self, exception=ParseError, *args
     ):  # type: (ParseError.__class__, ...) -> ParseError
@@ -180,12 +322,17 @@ class Source(unicode):
 
         return exception(line, col, *args)
 
-    def _to_linecol(self):  # type: () -> Tuple[int, int]
-        cur = 0
-        for i, line in enumerate(self.splitlines()):
-            if cur + len(line) + 1 > self.idx:
-                return (i + 1, self.idx - cur)
+    def linecol(self, offset=None):  # type: (Optional[int]) -> Tuple[int, int]
+        """
+        Returns the line and column of the given offset,
+        or of the current position if no offset is given.
+        """
+        if offset is None:
+            offset = self._idx
+
+        line, col = self.line_index.linecol(offset)
 
-            cur += len(line) + 1
+        return line + self._line_offset, col
 
-        return len(self.splitlines()), 0
+    def _to_linecol(self):  # type: () -> Tuple[int, int]
+        return self.linecol()
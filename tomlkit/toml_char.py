@@ -1,12 +1,16 @@
 import string
 
-from ._compat import PY2
+from ._compat import chr
 from ._compat import unicode
 
-if PY2:
-    from functools32 import lru_cache
-else:
-    from functools import lru_cache
+
+# Character classes, as bit flags
+BARE_KEY_CHAR = 1 << 0
+KV_SEP_CHAR = 1 << 1
+NUMBER_CHAR = 1 << 2
+SPACE_CHAR = 1 << 3
+NL_CHAR = 1 << 4
+WS_CHAR = SPACE_CHAR | NL_CHAR
 
 
 class TOMLChar(unicode):
@@ -16,6 +20,8 @@ class TOMLChar(unicode):
         if len(self) > 1:
             raise ValueError("A TOML character must be of length 1")
 
+        self._class = char_class(self) if self else 0
+
     BARE = string.ascii_letters + string.digits + "-_"
     KV = "= \t"
     NUMBER = string.digits + "+-_.e"
@@ -23,44 +29,84 @@ class TOMLChar(unicode):
     NL = "\n\r"
     WS = SPACES + NL
 
-    @lru_cache(maxsize=None)
     def is_bare_key_char(self):  # type: () -> bool
         """
         Whether the character is a valid bare key name or not.
         """
-        return self in self.BARE
+        return self._class & BARE_KEY_CHAR != 0
 
-    @lru_cache(maxsize=None)
     def is_kv_sep(self):  # type: () -> bool
         """
         Whether the character is a valid key/value separator ot not.
         """
-        return self in self.KV
+        return self._class & KV_SEP_CHAR != 0
 
-    @lru_cache(maxsize=None)
     def is_int_float_char(self):  # type: () -> bool
         """
         Whether the character if a valid integer or float value character or not.
         """
-        return self in self.NUMBER
+        return self._class & NUMBER_CHAR != 0
 
-    @lru_cache(maxsize=None)
     def is_ws(self):  # type: () -> bool
         """
         Whether the character is a whitespace character or not.
         """
-        return self in self.WS
+        return self._class & WS_CHAR != 0
 
-    @lru_cache(maxsize=None)
     def is_nl(self):  # type: () -> bool
         """
         Whether the character is a new line character or not.
         """
-        return self in self.NL
+        return self._class & NL_CHAR != 0
 
-    @lru_cache(maxsize=None)
     def is_spaces(self):  # type: () -> bool
         """
         Whether the character is a space or not
         """
-        return self in self.SPACES
+        return self._class & SPACE_CHAR != 0
+
+
+def _classify(c):  # type: (str) -> int
+    flags = 0
+    for chars, flag in [
+        (TOMLChar.BARE, BARE_KEY_CHAR),
+        (TOMLChar.KV, KV_SEP_CHAR),
+        (TOMLChar.NUMBER, NUMBER_CHAR),
+        (TOMLChar.SPACES, SPACE_CHAR),
+        (TOMLChar.NL, NL_CHAR),
+    ]:
+        if c in chars:
+            flags |= flag
+
+    return flags
+
+
+# Classes of every ASCII character, indexed by code point
+CHAR_CLASSES = [_classify(chr(i)) for i in range(128)]
+
+
+def char_class(c):  # type: (str) -> int
+    """
+    Returns the class flags of the given character.
+    """
+    o = ord(c)
+    if o < 128:
+        return CHAR_CLASSES[o]
+
+    return _classify(c)
+
+
+# Shared TOMLChar instances for ASCII characters, indexed by code point
+ASCII_CHARS = [TOMLChar(chr(i)) for i in range(128)]
+
+
+def toml_char(c):  # type: (str) -> TOMLChar
+    """
+    Returns the TOMLChar for the given character,
+    reusing the shared instance for ASCII characters.
+    """
+    o = ord(c)
+    if o < 128:
+        return ASCII_CHARS[o]
+
+    return TOMLChar(c)
@@ -1,7 +1,404 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Generator
+from typing import Optional
+from typing import Tuple
+
+from .container import _LOADING_METHODS
 from .container import Container
+from .container import ReadOnlyDict
+from .container import ReadOnlyList
+from .container import _loading
+from .exceptions import NonExistentKey
 
 
 class TOMLDocument(Container):
     """
     A TOML document.
     """
+
+
+class HybridDocument(TOMLDocument):
+    """
+    A TOML document read from the plain values of its source.
+
+    The complete document, with all of its formatting, is only parsed
+    from the source when it is first modified or rendered.
+    Until then, reading it returns plain Python objects, tables and arrays
+    being dicts and lists that load the document when they are modified.
+    """
+
+    def __init__(
+        self, values, loader
+    ):  # type: (Dict[str, Any], Callable[[], TOMLDocument]) -> None
+        super(HybridDocument, self).__init__(True)
+
+        dict.update(self, values)
+        self._loader = loader
+        self._views = {}  # type: Dict[str, Any]
+        self._snapshot = None  # type: Optional[Dict[str, Any]]
+
+    def is_loaded(self):  # type: () -> bool
+        return False
+
+    def load(self):  # type: () -> None
+        document = self._loader()
+
+        dict.clear(self)
+        dict.update(self, dict.items(document))
+        self._map = document._map
+        self._body = document._body
+        self._parsed = document._parsed
+        self._boundary = document._boundary
+        self._tombstones = document._tombstones
+
+        # Once loaded, it is nothing more than a regular document
+        del self._loader
+        del self._views
+        del self._snapshot
+        self.__class__ = TOMLDocument
+
+    @property
+    def value(self):  # type: () -> Dict[str, Any]
+        if self._snapshot is None:
+            self._snapshot = _read_only(dict(dict.items(self)))
+
+        return self._snapshot
+
+    def _value_at(self, keys):  # type: (Tuple) -> Any
+        value = self.value
+        for key in keys:
+            value = value[key]
+
+        return value
+
+    def keys(self):  # type: () -> Generator[str]
+        for k in dict.keys(self):
+            yield k
+
+    def values(self):  # type: () -> Generator[Any]
+        for k in dict.keys(self):
+            yield self[k]
+
+    def items(self):  # type: () -> Generator[Tuple[str, Any]]
+        for k in dict.keys(self):
+            yield k, self[k]
+
+    def get(self, key, default=None):  # type: (str, Any) -> Any
+        if not dict.__contains__(self, key):
+            return default
+
+        return self[key]
+
+    def __contains__(self, key):  # type: (str) -> bool
+        return dict.__contains__(self, key)
+
+    def __getitem__(self, key):  # type: (str) -> Any
+        view = self._views.get(key)
+        if view is not None:
+            return view
+
+        if not dict.__contains__(self, key):
+            raise NonExistentKey(key)
+
+        return _view(self._views, self, (), key, dict.__getitem__(self, key))
+
+    def __iter__(self):  # type: () -> Generator[str]
+        return dict.__iter__(self)
+
+    def __len__(self):  # type: () -> int
+        return dict.__len__(self)
+
+    def __eq__(self, other):  # type: (Dict) -> bool
+        if not isinstance(other, dict):
+            return NotImplemented
+
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):  # type: (Dict) -> bool
+        if not isinstance(other, dict):
+            return NotImplemented
+
+        return not self == other
+
+    def __repr__(self):  # type: () -> str
+        return dict.__repr__(self)
+
+    def __str__(self):  # type: () -> str
+        return dict.__repr__(self)
+
+
+# Every other way of reading or modifying a hybrid document loads it first
+for _name in _LOADING_METHODS + ["as_string"]:
+    if _name not in HybridDocument.__dict__:
+        setattr(HybridDocument, _name, _loading(getattr(Container, _name)))
+
+HybridDocument.body = property(_loading(Container.body.fget))
+
+
+def _view(
+    views, document, keys, key, value
+):  # type: (Dict[Any, Any], HybridDocument, Tuple, Any, Any) -> Any
+    """
+    Returns the given plain value of a hybrid document,
+    with tables and arrays wrapped to keep track of where they are.
+
+    The wrappers are cached in views by key,
+    since the plain values do not change until the document is loaded.
+    """
+    if isinstance(value, dict):
+        view = views.get(key)
+        if view is None:
+            view = views[key] = _PlainTable(document, keys + (key,), value)
+    elif isinstance(value, list):
+        view = views.get(key)
+        if view is None:
+            view = views[key] = _PlainArray(document, keys + (key,), value)
+    else:
+        view = value
+
+    return view
+
+
+def _read_only(value):  # type: (Any) -> Any
+    """
+    Returns a read-only copy of the given plain value,
+    like the cached value of a loaded document.
+    """
+    if isinstance(value, dict):
+        return ReadOnlyDict((k, _read_only(v)) for k, v in value.items())
+    elif isinstance(value, list):
+        return ReadOnlyList(_read_only(v) for v in value)
+
+    return value
+
+
+def _reading(method):  # type: (Callable) -> Callable
+    """
+    Wraps a method reading the plain values of a table or array
+    so that the actual one is read instead once the document is loaded.
+    """
+    name = method.__name__
+
+    def wrapper(self, *args, **kwargs):
+        if self._document.is_loaded():
+            return getattr(self._target(), name)(*args, **kwargs)
+
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+
+    return wrapper
+
+
+def _forwarding(name):  # type: (str) -> Callable
+    def wrapper(self, *args, **kwargs):
+        return getattr(self._target(), name)(*args, **kwargs)
+
+    wrapper.__name__ = name
+
+    return wrapper
+
+
+class _PlainValue(object):
+    """
+    Base class of the tables and arrays of a hybrid document.
+
+    Anything but reading them is done on the actual table or array,
+    loading the document first.
+    """
+
+    def _target(self):  # type: () -> Any
+        self._document.load()
+
+        target = self._document
+        for key in self._keys:
+            target = target[key]
+
+        return target
+
+    def __getattr__(self, name):  # type: (str) -> Any
+        if name.startswith("__") or name in ("_document", "_keys", "_views"):
+            raise AttributeError(name)
+
+        return getattr(self._target(), name)
+
+    @property
+    def value(self):  # type: () -> Any
+        if self._document.is_loaded():
+            return self._target().value
+
+        return self._document._value_at(self._keys)
+
+
+class _PlainTable(_PlainValue, dict):
+    def __init__(
+        self, document, keys, values
+    ):  # type: (HybridDocument, Tuple, Dict) -> None
+        dict.__init__(self, values)
+
+        self._document = document
+        self._keys = keys
+        self._views = {}  # type: Dict[Any, Any]
+
+    @_reading
+    def keys(self):  # type: () -> Generator[str]
+        for k in dict.keys(self):
+            yield k
+
+    @_reading
+    def values(self):  # type: () -> Generator[Any]
+        for k in dict.keys(self):
+            yield self[k]
+
+    @_reading
+    def items(self):  # type: () -> Generator[Tuple[str, Any]]
+        for k in dict.keys(self):
+            yield k, self[k]
+
+    @_reading
+    def get(self, key, default=None):  # type: (str, Any) -> Any
+        if not dict.__contains__(self, key):
+            return default
+
+        return self[key]
+
+    @_reading
+    def __contains__(self, key):  # type: (str) -> bool
+        return dict.__contains__(self, key)
+
+    def __getitem__(self, key):  # type: (str) -> Any
+        # Not wrapped with _reading, to keep the most common read fast
+        if self._document.is_loaded():
+            return self._target()[key]
+
+        view = self._views.get(key)
+        if view is not None:
+            return view
+
+        if not dict.__contains__(self, key):
+            raise NonExistentKey(key)
+
+        value = dict.__getitem__(self, key)
+
+        return _view(self._views, self._document, self._keys, key, value)
+
+    @_reading
+    def __iter__(self):
+        return dict.__iter__(self)
+
+    @_reading
+    def __len__(self):  # type: () -> int
+        return dict.__len__(self)
+
+    @_reading
+    def __eq__(self, other):  # type: (Any) -> bool
+        return dict.__eq__(self, other)
+
+    @_reading
+    def __ne__(self, other):  # type: (Any) -> bool
+        return dict.__ne__(self, other)
+
+    @_reading
+    def __repr__(self):  # type: () -> str
+        return dict.__repr__(self)
+
+    @_reading
+    def __str__(self):  # type: () -> str
+        return dict.__repr__(self)
+
+
+class _PlainArray(_PlainValue, list):
+    def __init__(
+        self, document, keys, values
+    ):  # type: (HybridDocument, Tuple, list) -> None
+        list.__init__(self, values)
+
+        self._document = document
+        self._keys = keys
+        self._views = {}  # type: Dict[Any, Any]
+
+    @_reading
+    def __getitem__(self, index):  # type: (Any) -> Any
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(list.__len__(self)))]
+
+        if index < 0:
+            index += list.__len__(self)
+
+        value = list.__getitem__(self, index)
+
+        return _view(self._views, self._document, self._keys, index, value)
+
+    @_reading
+    def __iter__(self):
+        for i in range(list.__len__(self)):
+            yield self[i]
+
+    @_reading
+    def __len__(self):  # type: () -> int
+        return list.__len__(self)
+
+    @_reading
+    def __contains__(self, value):  # type: (Any) -> bool
+        return list.__contains__(self, value)
+
+    @_reading
+    def index(self, value, *args):  # type: (Any, ...) -> int
+        return list.index(self, value, *args)
+
+    @_reading
+    def count(self, value):  # type: (Any) -> int
+        return list.count(self, value)
+
+    @_reading
+    def __eq__(self, other):  # type: (Any) -> bool
+        return list.__eq__(self, other)
+
+    @_reading
+    def __ne__(self, other):  # type: (Any) -> bool
+        return list.__ne__(self, other)
+
+    @_reading
+    def __repr__(self):  # type: () -> str
+        return list.__repr__(self)
+
+    @_reading
+    def __str__(self):  # type: () -> str
+        return list.__repr__(self)
+
+
+for _name in [
+    "update",
+    "pop",
+    "popitem",
+    "setdefault",
+    "clear",
+    "copy",
+    "__setitem__",
+    "__delitem__",
+    "__copy__",
+    "__reduce__",
+    "__reduce_ex__",
+]:
+    setattr(_PlainTable, _name, _forwarding(_name))
+
+for _name in [
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+    "clear",
+    "copy",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "__reduce__",
+    "__reduce_ex__",
+]:
+    setattr(_PlainArray, _name, _forwarding(_name))
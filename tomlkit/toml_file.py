@@ -1,9 +1,34 @@
+import codecs
 import io
+import json
+import mmap as _mmap
+import os
 
 from typing import Any
+from typing import IO
 from typing import Dict
+from typing import Optional
+from typing import Tuple
+from typing import Union
 
+from ._scanner import scan_headers
+from .api import _CHUNK_SIZE
 from .api import loads
+from .container import Container
+from .exceptions import NonExistentKey
+from .exceptions import ParseError
+from .items import AoT
+from .items import Item
+from .items import Key
+from .items import Table
+from .items import Trivia
+from .parser import BLANK
+from .parser import IncrementalParser
+from .parser import Parser
+from .parser import _is_child_table
+from .parser import _split_table_name
+from .parser import _table_name_keys
+from .source import decode_source
 from .toml_document import TOMLDocument
 
 
@@ -15,10 +40,246 @@ class TOMLFile(object):
     def __init__(self, path):  # type: (str) -> None
         self._path = path
 
-    def read(self):  # type: () -> TOMLDocument
-        with io.open(self._path, encoding="utf-8") as f:
-            return loads(f.read())
+    def read(self, mmap=False):  # type: (bool) -> TOMLDocument
+        """
+        Reads and parses the file.
+
+        If mmap is True, the file is memory-mapped and parsed
+        in chunks decoded from the mapping, so that its content
+        is never held in memory as a whole, either as bytes or as text.
+        """
+        if mmap:
+            return self._read_mmap()
+
+        with io.open(self._path, "rb") as f:
+            return loads(_decode_text(f.read()))
 
     def write(self, data):  # type: (TOMLDocument) -> None
         with io.open(self._path, "w", encoding="utf-8") as f:
             f.write(data.as_string())
+
+    def build_index(self):  # type: () -> Dict[str, Any]
+        """
+        Records the name and byte range of every table header of the file
+        and saves them next to it, to be used by read_table().
+
+        The range of a table spans its header, its body and its children
+        up to the next header that is not one of them.
+        The index is ignored once the size or the modification time
+        of the file changes.
+        """
+        stat = os.stat(self._path)
+        with io.open(self._path, "rb") as f:
+            data = f.read()
+
+        text = decode_source(data)
+        headers, _ = scan_headers(text)
+
+        # Byte offset and line of every header
+        offsets = []
+        lines = []
+        offset = len(codecs.BOM_UTF8) if data.startswith(codecs.BOM_UTF8) else 0
+        line = 1
+        pos = 0
+        for header in headers:
+            chunk = text[pos : header.start]
+            offset += len(chunk.encode("utf-8"))
+            line += chunk.count("\n")
+            pos = header.start
+
+            offsets.append(offset)
+            lines.append(line)
+
+        offsets.append(len(data))
+
+        names = []
+        for header in headers:
+            try:
+                names.append(_table_name_keys(header.name))
+            except ParseError:
+                # Reported when the table is parsed
+                names.append(None)
+
+        tables = []
+        # End of the ranges enclosing the current header,
+        # along with whether they are part of an array of tables.
+        enclosing = []
+        for i, header in enumerate(headers):
+            while enclosing and enclosing[-1][0] <= i:
+                enclosing.pop()
+
+            keys = names[i]
+            end = i + 1
+            while (
+                keys is not None
+                and end < len(headers)
+                and names[end] is not None
+                and _is_child_table(keys, names[end])
+            ):
+                end += 1
+
+            nested = bool(enclosing and enclosing[-1][1])
+            enclosing.append((end, header.is_aot or nested))
+            if nested:
+                # Tables within array of tables elements are not unique
+                continue
+
+            if keys is None:
+                continue
+
+            tables.append([list(keys), offsets[i], offsets[end], lines[i]])
+
+        index = {"mtime": stat.st_mtime, "size": stat.st_size, "tables": tables}
+        with io.open(self._index_path, "wb") as f:
+            f.write(json.dumps(index).encode("utf-8"))
+
+        return index
+
+    def read_table(self, name):  # type: (str) -> Union[Table, AoT]
+        """
+        Reads and parses a single table, given its full name, along with
+        its children, using the index built by build_index().
+        The index is built first if it is missing or outdated.
+
+        Only the byte ranges of the table and of its children
+        are read from the file. Tables nested in arrays of tables
+        can not be read this way.
+        """
+        index = self._load_index()
+        if index is None:
+            index = self.build_index()
+
+        parts = tuple(_split_table_name(name))
+        keys = [k.key for k in parts]
+        if not keys:
+            raise NonExistentKey(name)
+
+        # Ranges of the table itself and of its children
+        # defined elsewhere in the file.
+        ranges = []
+        children = []
+        covered = 0
+        for table_keys, start, end, line in index["tables"]:
+            if table_keys[: len(keys)] != keys or start < covered:
+                continue
+
+            if len(table_keys) == len(keys):
+                ranges.append((start, end, line))
+            else:
+                children.append((start, end, line))
+
+            covered = end
+
+        if not ranges and not children:
+            raise NonExistentKey(name)
+
+        parent_name = ".".join(k.as_string() for k in parts[:-1]) or None
+
+        # Merging the ranges follows the same rules as when parsing
+        # the whole file, like for the elements of an array of tables.
+        container = Container(True)
+        with io.open(self._path, "rb") as f:
+            for start, end, line in ranges:
+                container.append(*self._parse_range(f, start, end, line, parent_name))
+
+            if not ranges:
+                # The table is only defined through its children
+                container.append(
+                    parts[-1],
+                    Table(Container(True), Trivia(), False, is_super_table=True),
+                )
+
+            table = container.item(parts[-1])
+            if isinstance(table, Table):
+                for start, end, line in children:
+                    table.append(*self._parse_range(f, start, end, line, name))
+
+        container.parsing(False)
+
+        return table
+
+    def _parse_range(
+        self, f, start, end, line, parent_name
+    ):  # type: (IO[bytes], int, int, int, Optional[str]) -> Tuple[Key, Item]
+        """
+        Parses the table held by the given byte range of the file.
+        """
+        f.seek(start)
+
+        parser = Parser(_decode_text(f.read(end - start)), line_offset=line - 1)
+        parser.scan(BLANK)
+
+        return parser._parse_table(parent_name)
+
+    @property
+    def _index_path(self):  # type: () -> str
+        return self._path + ".index"
+
+    def _load_index(self):  # type: () -> Optional[Dict[str, Any]]
+        """
+        Returns the saved index of the file,
+        or None if it is missing or outdated.
+        """
+        try:
+            with io.open(self._index_path, "rb") as f:
+                index = json.loads(f.read().decode("utf-8"))
+        except (IOError, OSError, ValueError):
+            return None
+
+        stat = os.stat(self._path)
+        if index.get("mtime") != stat.st_mtime or index.get("size") != stat.st_size:
+            return None
+
+        return index
+
+    def _read_mmap(self):  # type: () -> TOMLDocument
+        with io.open(self._path, "rb") as f:
+            try:
+                mapping = _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can not be mapped
+                return loads("")
+
+            try:
+                return _parse_chunks(mapping)
+            finally:
+                mapping.close()
+
+
+def _parse_chunks(mapping):  # type: (_mmap.mmap) -> TOMLDocument
+    """
+    Parses the content of a mapped file with an incremental parser,
+    translating line endings like _decode_text() does.
+    """
+    parser = IncrementalParser()
+    # A "\r" ending a chunk may be followed by a "\n" in the next one
+    cr = ""
+    for start in range(0, len(mapping), _CHUNK_SIZE):
+        # Decoded by the parser, which reports errors at their position
+        # in the document rather than in the chunk
+        text = cr + parser._decode(mapping[start : start + _CHUNK_SIZE])
+        cr = ""
+        if text.endswith("\r"):
+            text, cr = text[:-1], "\r"
+
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+        parser.feed(text)
+
+    if cr:
+        parser.feed("\n")
+
+    return parser.close()
+
+
+def _decode_text(data):  # type: (bytes) -> str
+    """
+    Decodes the content of a file, translating line endings to "\\n"
+    like reading it in text mode does.
+    """
+    text = decode_source(data)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    return text